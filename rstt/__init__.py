@@ -1,30 +1,77 @@
-from . import stypes, config
-
-from .player import BasicPlayer, Player, GaussianPlayer
-from .game import Match, Duel
-from .solver import BetterWin, BradleyTerry, CoinFlip, LogSolver, WIN, DRAW, LOSE
-from .ranking import (
-    Standing,
-    Ranking,
-    BTRanking,
-    BasicElo, BasicGlicko, BasicOS,
-    WinRate, SuccessRanking
-)
-from .scheduler import (
-    Competition,
-    RoundRobin, SwissRound, RandomRound,
-    SwissBracket,
-    SingleEliminationBracket, DoubleEliminationBracket,
-    Snake
-)
+"""Ranking Simulation Testing Tool
+
+Top-level names are loaded lazily: `import rstt` is cheap and the subpackage defining a name is imported on first access,
+for example by `from rstt import BasicElo` or `rstt.BasicElo`.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+import importlib
+
+# static type checkers and IDEs do not run __getattr__
+if TYPE_CHECKING:
+    from . import stypes, config, utils, player, game, solver, ranking, scheduler
+    from .utils.rng import RNG
+    from .player import BasicPlayer, Player, GaussianPlayer, PlayerRegistry
+    from .game import Match, Duel, GameLog
+    from .solver import BetterWin, BradleyTerry, CoinFlip, LogSolver, WIN, DRAW, LOSE
+    from .ranking import (
+        Standing,
+        Ranking,
+        BTRanking,
+        BasicElo, BasicGlicko, BasicOS,
+        WinRate, SuccessRanking
+    )
+    from .scheduler import (
+        Competition,
+        RoundRobin, SwissRound, RandomRound,
+        SwissBracket,
+        SingleEliminationBracket, DoubleEliminationBracket,
+        Snake,
+        MonteCarlo
+    )
+
+
+# name -> subpackage defining it, None for modules and subpackages themselves
+_LAZY = {**dict.fromkeys(['stypes', 'config', 'utils', 'player', 'game', 'solver', 'ranking', 'scheduler']),
+         'RNG': '.utils.rng',
+         **dict.fromkeys(['BasicPlayer', 'Player', 'GaussianPlayer', 'PlayerRegistry'], '.player'),
+         **dict.fromkeys(['Match', 'Duel', 'GameLog'], '.game'),
+         **dict.fromkeys(['BetterWin', 'BradleyTerry', 'CoinFlip', 'LogSolver', 'WIN', 'DRAW', 'LOSE'], '.solver'),
+         **dict.fromkeys(['Standing', 'Ranking', 'BTRanking', 'BasicElo', 'BasicGlicko', 'BasicOS',
+                          'WinRate', 'SuccessRanking'], '.ranking'),
+         **dict.fromkeys(['Competition', 'RoundRobin', 'SwissRound', 'RandomRound', 'SwissBracket',
+                          'SingleEliminationBracket', 'DoubleEliminationBracket', 'Snake', 'MonteCarlo'], '.scheduler')}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    package = _LAZY[name]
+    if package is None:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        value = getattr(importlib.import_module(package, __name__), name)
+    # cache, next accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = ["stypes",
            "config",
+           "RNG",
            "BasicPlayer",
            "Player",
            "GaussianPlayer",
+           "PlayerRegistry",
            "Match",
            "Duel",
+           "GameLog",
            "BetterWin",
            "BradleyTerry",
            "CoinFlip",
@@ -47,5 +94,6 @@ __all__ = ["stypes",
            "SwissBracket",
            "SingleEliminationBracket",
            "DoubleEliminationBracket",
-           "Snake"
+           "Snake",
+           "MonteCarlo"
            ]
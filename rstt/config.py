@@ -23,7 +23,24 @@ Example
     players = Player.create(nb=10)
 """
 
-import random
+import rstt.utils.rng as ur
+
+import os
+
+
+# -------------------- #
+# -- Typecheck cfg --- #
+# -------------------- #
+
+TYPECHECK = os.environ.get('RSTT_TYPECHECK', '1').strip().lower() not in ['0', 'false', 'no', 'off']
+"""Runtime type checking of function signatures with typeguard, see :func:`rstt.utils.typecheck.typechecked`.
+
+True by default (debug mode): invalid arguments raise a typeguard error. Set the environment variable RSTT_TYPECHECK=0 for production runs,
+typeguard checks are then skipped, simulations and rating updates typically run several times faster.
+
+.. warning::
+    The value is read when rstt modules are imported. Modifying it afterward has no effect on already decorated functions.
+"""
 
 
 # -------------------- #
@@ -37,8 +54,11 @@ PLAYER_GAUSSIAN_MU = 1500
 PLAYER_GAUSSIAN_SIGMA = 500
 """Deafault sigma of :class:`PLAYER_DIST_ARGS`"""
 
-PLAYER_DIST = random.gauss
-"""Default level generator used by :func:`rstt.player.basicplayer.BasicPlayer.create` when param 'level_dist' is None"""
+PLAYER_DIST = ur.gauss
+"""Default level generator used by :func:`rstt.player.basicplayer.BasicPlayer.create` when param 'level_dist' is None.
+
+The default distributions of this module draw from the current random context, see :mod:`rstt.utils.rng`.
+"""
 
 PLAYER_DIST_ARGS = {'mu': PLAYER_GAUSSIAN_MU,
                     'sigma': PLAYER_GAUSSIAN_SIGMA}
@@ -63,10 +83,10 @@ GAUSSIAN_PLAYER_SIGMA_MEAN = 100
 GAUSSIAN_PLAYER_SIGMA_SIGMA = 50
 """Deafault sigma of :class:`GAUSSIAN_PLAYER_SIGMA_ARGS`"""
 
-GAUSSIAN_PLAYER_MEAN_DIST = random.gauss
+GAUSSIAN_PLAYER_MEAN_DIST = ur.gauss
 """Default mean level generator used by :class:`rstt.player.gaussian.GaussianPlayer` when param 'mu' is None"""
 
-GAUSSIAN_PLAYER_SIGMA_DIST = random.gauss
+GAUSSIAN_PLAYER_SIGMA_DIST = ur.gauss
 """Default level standard deviation generator used by :class:`rstt.player.gaussian.GaussianPlayer` when param 'sigma' is None"""
 
 GAUSSIAN_PLAYER_MEAN_ARGS = {'mu': GAUSSIAN_PLAYER_MEAN_MEAN,
@@ -91,9 +111,9 @@ EXPONENTIAL_DIFF_ARGS = {'mu': EXPONENTIAL_DIFF_MEAN,
                          'sigma': EXPONENTIAL_DIFF_SIGMA}
 EXPONENTIAL_TAU_ARGS = {'mu': EXPONENTIAL_TAU_MEAN,
                         'sigma': EXPONENTIAL_TAU_SIGMA}
-EXPONENTIAL_START_DIST = random.gauss
-EXPONENTIAL_DIFF_DIST = random.gauss
-EXPONENTIAL_TAU_DIST = random.gauss
+EXPONENTIAL_START_DIST = ur.gauss
+EXPONENTIAL_DIFF_DIST = ur.gauss
+EXPONENTIAL_TAU_DIST = ur.gauss
 
 
 # --- LogisticPlayer --- #
@@ -113,10 +133,10 @@ LOGISTIC_CENTER_ARGS = {'mu': LOGISTIC_CENTER_MEAN,
                         'sigma': LOGISTIC_CENTER_SIGMA}
 LOGISTIC_R_ARGS = {'mu': LOGISTIC_R_MEAN,
                    'sigma': LOGISTIC_R_SIGMA}
-LOGISTIC_START_DIST = random.gauss
-LOGISTIC_DIFF_DIST = random.gauss
-LOGISTIC_CENTER_DIST = random.gauss
-LOGISTIC_R_DIST = random.gauss
+LOGISTIC_START_DIST = ur.gauss
+LOGISTIC_DIFF_DIST = ur.gauss
+LOGISTIC_CENTER_DIST = ur.gauss
+LOGISTIC_R_DIST = ur.gauss
 
 
 # --- CyclePlayer --- #
@@ -133,9 +153,9 @@ CYCLE_SIGMA_ARGS = {'mu': CYCLE_SIGMA_MEAN,
                     'sigma': CYCLE_SIGMA_SIGMA}
 CYCLE_TAU_ARGS = {'mu': CYCLE_TAU_MEAN,
                   'sigma': CYCLE_TAU_SIGMA}
-CYCLE_LEVEL_DIST = random.gauss
-CYCLE_SIGMA_DIST = random.gauss
-CYCLE_TAU_DIST = random.gauss
+CYCLE_LEVEL_DIST = ur.gauss
+CYCLE_SIGMA_DIST = ur.gauss
+CYCLE_TAU_DIST = ur.gauss
 
 # --- JumpPlayer --- #
 JUMP_LEVEL_MEAN = 1500
@@ -150,9 +170,9 @@ JUMP_SIGMA_ARGS = {'mu': JUMP_SIGMA_MEAN,
                    'sigma': JUMP_SIGMA_SIGMA}
 JUMP_TAU_ARGS = {'mu': JUMP_TAU_MEAN,
                  'sigma': JUMP_TAU_SIGMA}
-JUMP_LEVEL_DIST = random.gauss
-JUMP_SIGMA_DIST = random.gauss
-JUMP_TAU_DIST = random.gauss
+JUMP_LEVEL_DIST = ur.gauss
+JUMP_SIGMA_DIST = ur.gauss
+JUMP_TAU_DIST = ur.gauss
 
 
 # -------------------- #
@@ -171,6 +191,30 @@ If set to True, the Duel instance will 'try' to add the match to its participant
 """
 
 
+# -------------------- #
+# --- Standing cfg --- #
+# -------------------- #
+
+STANDING_INCREMENTAL_RATIO = 0.08
+"""Sorting policy of :class:`rstt.ranking.standing.Standing`.
+
+When the number of keys added or changed since the last sort is at most this fraction of the Standing size,
+they are repositioned one by one (O(k log n)). Otherwise the Standing performs a single sort (O(n log n)).
+"""
+
+
+# -------------------- #
+# --- Observer cfg --- #
+# -------------------- #
+
+OBSERVER_CHUNK_SIZE = 10_000
+"""Default number of games per chunk of :class:`rstt.ranking.observer.GameByGame` when param 'chunk_size' is None.
+
+Observations passed to :func:`rstt.ranking.ranking.Ranking.update` are read lazily and processed by chunks,
+the memory usage of an update is bounded by the chunk size and not by the number of games.
+"""
+
+
 # -------------------- #
 # ---- Solver cfg ---- #
 # -------------------- #
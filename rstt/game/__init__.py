@@ -6,9 +6,11 @@ SMatch have participants, accessed by the method :func:`rstt.game.match.Match.pl
 
 
 from .match import Match, Duel
+from .gamelog import GameLog
 
 
 __all__ = [
     "Match",
-    "Duel"
+    "Duel",
+    "GameLog"
 ]
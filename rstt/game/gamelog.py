@@ -0,0 +1,252 @@
+from typing import Optional, Iterable, Iterator, Callable, Union
+
+from rstt.stypes import SPlayer, SMatch
+from rstt.player import PlayerRegistry
+from .match import Duel
+
+import numpy as np
+
+
+class GameLog():
+    # not typechecked, typeguard would check every player of the list for each slice
+    def __init__(self, players: Union[list[SPlayer], PlayerRegistry],
+                 player1: np.ndarray, player2: np.ndarray,
+                 scores1: np.ndarray, scores2: np.ndarray,
+                 timestamps: Optional[np.ndarray] = None,
+                 events: Optional[np.ndarray] = None,
+                 event_names: Optional[list[str]] = None) -> None:
+        """Columnar record of played duels
+
+        A GameLog stores a sequence of 1-versus-1 results as contiguous arrays instead of :class:`rstt.game.match.Duel` objects.
+        Participants are integer ids, i.e. positions in the players list. A game costs a few dozen bytes instead of a Python object graph.
+
+        A GameLog is an iterable of Duel, created lazily when a caller needs an object. It can therefore be passed wherever games are expected,
+        for example :func:`rstt.ranking.ranking.Ranking.update` (games=log). Vectorized rankings consume the arrays directly.
+
+        .. note::
+            The Duel views are not tracked by the players game history.
+
+        Parameters
+        ----------
+        players : Union[list[SPlayer], PlayerRegistry]
+            The participants, indexed by id.
+        player1 : np.ndarray
+            int array, id of the first player of each game.
+        player2 : np.ndarray
+            int array, id of the second player of each game.
+        scores1 : np.ndarray
+            score of the first player of each game.
+        scores2 : np.ndarray
+            score of the second player of each game.
+        timestamps : Optional[np.ndarray], optional
+            time of each game, by default None.
+        events : Optional[np.ndarray], optional
+            int array, id of the event of each game, by default None.
+        event_names : Optional[list[str]], optional
+            The events names, indexed by id, by default None.
+
+        Raises
+        ------
+        ValueError
+            When the arrays do not have the same length.
+        """
+        self.players = players
+        self.player1 = np.asarray(player1, dtype=np.int64)
+        self.player2 = np.asarray(player2, dtype=np.int64)
+        self.scores1 = np.asarray(scores1, dtype=np.float64)
+        self.scores2 = np.asarray(scores2, dtype=np.float64)
+        self.timestamps = None if timestamps is None else np.asarray(timestamps)
+        self.events = None if events is None else np.asarray(events, dtype=np.int64)
+        self.event_names = event_names
+
+        lengths = {len(column) for column in self.__columns().values()}
+        if len(lengths) > 1:
+            msg = f"GameLog arrays must have the same length, received lengths {sorted(lengths)}"
+            raise ValueError(msg)
+
+    # --- constructor --- #
+    @classmethod
+    def from_games(cls, games: Iterable[SMatch], players: Optional[Union[list[SPlayer], PlayerRegistry]] = None) -> 'GameLog':
+        """Build a GameLog from played duels
+
+        Parameters
+        ----------
+        games : Iterable[SMatch]
+            Duels with a score.
+        players : Optional[Union[list[SPlayer], PlayerRegistry]], optional
+            Known players, their ids are kept and new participants are appended. A registry is shared with the log and receives the new participants.
+            By default None.
+
+        Returns
+        -------
+        GameLog
+            The games in columnar format, in the same order.
+        """
+        registry = players if isinstance(players, PlayerRegistry) else PlayerRegistry(players)
+        player1, player2, scores1, scores2 = [], [], [], []
+        for game in games:
+            p1, p2 = game.players()
+            s1, s2 = game.scores()
+            player1.append(registry.register(p1))
+            player2.append(registry.register(p2))
+            scores1.append(s1)
+            scores2.append(s2)
+        return cls(players=registry, player1=np.array(player1, dtype=np.int64), player2=np.array(player2, dtype=np.int64),
+                   scores1=np.array(scores1, dtype=np.float64), scores2=np.array(scores2, dtype=np.float64))
+
+    @classmethod
+    def concatenate(cls, logs: list['GameLog']) -> 'GameLog':
+        """Merge GameLogs
+
+        Games are kept in order. When all logs share the same players, ids are kept.
+        Otherwise players are identified across logs and receive new ids.
+
+        Parameters
+        ----------
+        logs : list[GameLog]
+            GameLogs to merge
+
+        Returns
+        -------
+        GameLog
+            A single GameLog with all the games.
+        """
+        shared = bool(logs) and all(log.players is logs[0].players for log in logs)
+        registry = logs[0].players if shared else PlayerRegistry()
+        columns: dict[str, list[np.ndarray]] = {'player1': [], 'player2': [], 'scores1': [], 'scores2': []}
+        for log in logs:
+            remap = None if shared else registry.ids(log.players)
+            columns['player1'].append(log.player1 if shared else remap[log.player1])
+            columns['player2'].append(log.player2 if shared else remap[log.player2])
+            columns['scores1'].append(log.scores1)
+            columns['scores2'].append(log.scores2)
+        merged = {name: np.concatenate(values) if values else np.zeros(0) for name, values in columns.items()}
+        # ??? events and timestamps are only kept when every log has them
+        if logs and all(log.timestamps is not None for log in logs):
+            merged['timestamps'] = np.concatenate([log.timestamps for log in logs])
+        if logs and all(log.events is not None and log.event_names == logs[0].event_names for log in logs):
+            merged['events'] = np.concatenate([log.events for log in logs])
+            merged['event_names'] = logs[0].event_names
+        return cls(players=registry, **merged)
+
+    # --- getter --- #
+    def duel(self, index: int) -> Duel:
+        """Getter method for one game as a Duel
+
+        Parameters
+        ----------
+        index : int
+            position of the game in the log.
+
+        Returns
+        -------
+        Duel
+            A new Duel instance with the game result.
+        """
+        return Duel.played(self.players[self.player1[index]], self.players[self.player2[index]],
+                           [float(self.scores1[index]), float(self.scores2[index])], tracking=False)
+
+    def duels(self) -> list[Duel]:
+        """Getter method for all games as Duel
+
+        Returns
+        -------
+        list[Duel]
+            the games as Duel instances, in order.
+        """
+        return list(self)
+
+    def map_players(self, indices: Callable[[list[SPlayer]], np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+        """Translate player ids
+
+        Map the participants of the games to other integer ids, for example the slots of an :class:`rstt.ranking.datamodel.ArrayKeyModel`.
+        Only players with at least one game are passed to indices, in order of first appearance.
+
+        Parameters
+        ----------
+        indices : Callable[[list[SPlayer]], np.ndarray]
+            maps players to integer ids, for example :func:`rstt.ranking.datamodel.ArrayKeyModel.indices`.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            new ids of the first and second player of each game.
+        """
+        slots = np.zeros(len(self.players), dtype=np.int64)
+        if len(self):
+            ids = np.ravel(np.column_stack((self.player1, self.player2)))
+            actives, first = np.unique(ids, return_index=True)
+            actives = actives[np.argsort(first)]
+            slots[actives] = indices([self.players[i] for i in actives.tolist()])
+        return slots[self.player1], slots[self.player2]
+
+    def records(self, indices: Callable[[list[SPlayer]], np.ndarray]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Games as player records
+
+        Columnar data of :func:`rstt.utils.observer.players_records_arrays`: each game produces two records (player, opponent, score of player),
+        one per participant, in game order.
+
+        Parameters
+        ----------
+        indices : Callable[[list[SPlayer]], np.ndarray]
+            maps players to integer ids, for example :func:`rstt.ranking.datamodel.ArrayKeyModel.indices`.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            player ids, opponent ids and scores arrays.
+        """
+        player1, player2 = self.map_players(indices)
+        players = np.ravel(np.column_stack((player1, player2)))
+        opponents = np.ravel(np.column_stack((player2, player1)))
+        scores = np.ravel(np.column_stack((self.scores1, self.scores2)))
+        return players, opponents, scores
+
+    def chunks(self, size: Optional[int] = None) -> Iterator['GameLog']:
+        """Split the log in consecutive GameLog of at most size games
+
+        Parameters
+        ----------
+        size : Optional[int], optional
+            maximal number of games per chunk, by default None which yields the log itself.
+
+        Yields
+        ------
+        GameLog
+            views of the log, sharing its players list.
+        """
+        if size is None:
+            yield self
+            return
+        for start in range(0, len(self), size):
+            yield self[start:start+size]
+
+    # --- magic methods --- #
+    def __len__(self) -> int:
+        return len(self.player1)
+
+    def __iter__(self) -> Iterator[Duel]:
+        for index in range(len(self)):
+            yield self.duel(index)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Duel, 'GameLog']:
+        if isinstance(index, slice):
+            return GameLog(players=self.players, event_names=self.event_names,
+                           **{name: column[index] for name, column in self.__columns().items()})
+        return self.duel(index)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __str__(self) -> str:
+        return f"{type(self)} - games: {len(self)}, players: {len(self.players)}"
+
+    # --- internal mechanism --- #
+    def __columns(self) -> dict[str, np.ndarray]:
+        columns = {'player1': self.player1, 'player2': self.player2,
+                   'scores1': self.scores1, 'scores2': self.scores2}
+        if self.timestamps is not None:
+            columns['timestamps'] = self.timestamps
+        if self.events is not None:
+            columns['events'] = self.events
+        return columns
@@ -0,0 +1,184 @@
+"""Import of match history
+
+Read real-world results stored in CSV files as :class:`rstt.game.gamelog.GameLog`, chunk by chunk,
+and feed them to rankings without creating one Python object per game.
+
+Example
+-------
+.. code-block:: python
+    :linenos:
+
+    from rstt import BasicElo
+    from rstt.game.importer import load_csv
+
+    elo = BasicElo('history', array_backed=True)
+    load_csv(elo, 'results.csv')
+"""
+
+from typing import Optional, Callable, Iterator, Union, List
+from rstt.utils.typecheck import typechecked
+
+from rstt.stypes import SPlayer
+from rstt.player import BasicPlayer, PlayerRegistry
+from .gamelog import GameLog
+import rstt.config as cfg
+
+import numpy as np
+import itertools
+import csv
+import os
+
+
+CSV_COLUMNS = {'date': 'date',
+               'player_a': 'player_a',
+               'player_b': 'player_b',
+               'score_a': 'score_a',
+               'score_b': 'score_b',
+               'event': 'event'}
+"""Default column names of :func:`rstt.game.importer.read_csv`, by role. The 'date' and 'event' columns are optional."""
+
+
+class NameInterner(dict):
+    def __init__(self, players: Optional[list[SPlayer]] = None,
+                 factory: Optional[Callable[[str], SPlayer]] = None,
+                 registry: Optional[PlayerRegistry] = None):
+        """Name to id mapping
+
+        Assign dense integer ids to player names, in order of first appearance, and create the corresponding players.
+        Lookups of known names are plain dict lookups.
+
+        Parameters
+        ----------
+        players : Optional[list[SPlayer]], optional
+            Known players, identified by their name, by default None.
+        factory : Optional[Callable[[str], SPlayer]], optional
+            Create the player of an unknown name, by default None which creates a :class:`rstt.player.basicplayer.BasicPlayer`.
+        registry : Optional[PlayerRegistry], optional
+            Registry providing the ids, its players are known players. By default None which uses a new list.
+        """
+        super().__init__()
+        self.players: Union[list[SPlayer], PlayerRegistry] = registry if registry is not None else []
+        self.factory = factory if factory else (lambda name: BasicPlayer(name=name))
+        for player in list(registry if registry is not None else []) + (players if players else []):
+            self[player.name()] = self.__add(player)
+
+    def __missing__(self, name: str) -> int:
+        self[name] = self.__add(self.factory(name))
+        return self[name]
+
+    def __add(self, player: SPlayer) -> int:
+        if isinstance(self.players, PlayerRegistry):
+            return self.players.register(player)
+        self.players.append(player)
+        return len(self.players) - 1
+
+
+@typechecked
+def read_csv(path: Union[str, os.PathLike],
+             chunk_size: Optional[int] = None,
+             players: Optional[list[SPlayer]] = None,
+             factory: Optional[Callable[[str], SPlayer]] = None,
+             columns: Optional[dict[str, str]] = None,
+             delimiter: str = ',',
+             registry: Optional[PlayerRegistry] = None) -> Iterator[GameLog]:
+    """Read a CSV file of duels results
+
+    The file has a header and one game per row, with the columns of :attr:`rstt.game.importer.CSV_COLUMNS`.
+    Rows are read lazily by chunks of chunk_size games. Player names are interned once, every GameLog shares the same players list
+    and a given name always has the same id. Dates must be in ISO 8601 format and are converted to numpy datetime64.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The CSV file
+    chunk_size : Optional[int], optional
+        Number of rows per GameLog, by default None which uses :attr:`rstt.config.OBSERVER_CHUNK_SIZE`.
+    players : Optional[list[SPlayer]], optional
+        Known players, matched with the CSV names by their name() value, by default None.
+    factory : Optional[Callable[[str], SPlayer]], optional
+        Create the player of a name not in players, by default None which creates a :class:`rstt.player.basicplayer.BasicPlayer`.
+    columns : Optional[dict[str, str]], optional
+        Column names by role, overriding the ones of :attr:`rstt.game.importer.CSV_COLUMNS`, by default None.
+    delimiter : str, optional
+        The CSV delimiter, by default ','.
+    registry : Optional[PlayerRegistry], optional
+        Players registry shared by the GameLogs, its players are known players and new players are registered in it.
+        By default None which uses a new players list.
+
+    Yields
+    ------
+    GameLog
+        Consecutive chunks of the file, in order.
+
+    Raises
+    ------
+    ValueError
+        When a required column is missing, or a line does not have as many fields as the header. Blank lines are skipped.
+    """
+    size = chunk_size if chunk_size else cfg.OBSERVER_CHUNK_SIZE
+    names = {**CSV_COLUMNS, **(columns if columns else {})}
+    interner = NameInterner(players=players, factory=factory, registry=registry)
+    events: dict[str, int] = {}  # event name -> id, in order of first appearance
+
+    with open(path, newline='') as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        header = next(reader, [])
+        position = {role: header.index(name) for role, name in names.items() if name in header}
+        missing = [names[role] for role in ['player_a', 'player_b', 'score_a', 'score_b'] if role not in position]
+        if missing:
+            msg = f"Missing columns {missing} in {path}, found {header}"
+            raise ValueError(msg)
+
+        lines = _rows(reader, len(header), path)
+        while True:
+            rows = list(itertools.islice(lines, size))
+            data = list(zip(*rows))
+            if not rows:
+                return
+            count = len(rows)
+            yield GameLog(players=interner.players,
+                          player1=np.fromiter(map(interner.__getitem__, data[position['player_a']]), dtype=np.int64, count=count),
+                          player2=np.fromiter(map(interner.__getitem__, data[position['player_b']]), dtype=np.int64, count=count),
+                          scores1=np.array(data[position['score_a']], dtype=np.float64),
+                          scores2=np.array(data[position['score_b']], dtype=np.float64),
+                          timestamps=np.array(data[position['date']], dtype='datetime64') if 'date' in position else None,
+                          events=np.fromiter((events.setdefault(name, len(events)) for name in data[position['event']]),
+                                             dtype=np.int64, count=count) if 'event' in position else None,
+                          event_names=list(events) if 'event' in position else None)
+
+
+def _rows(reader: Iterator[List[str]], width: int, path: Union[str, os.PathLike]) -> Iterator[List[str]]:
+    # blank lines are skipped, a row with missing or extra fields would misalign the columns
+    for row in reader:
+        if not row:
+            continue
+        if len(row) != width:
+            msg = f"Line {reader.line_num} of {path} has {len(row)} fields, expected {width}"
+            raise ValueError(msg)
+        yield row
+
+
+def load_csv(ranking, path: Union[str, os.PathLike], **kwargs) -> None:
+    """Update a ranking with a CSV file of duels results
+
+    Stream the chunks of :func:`rstt.game.importer.read_csv` into :func:`rstt.ranking.ranking.Ranking.update`,
+    inside a :func:`rstt.ranking.ranking.Ranking.batch` block. Only one chunk is in memory at a time.
+    When the ranking datamodel has a :class:`rstt.player.PlayerRegistry`, it is used as default registry.
+
+    .. warning::
+        Each chunk is one update call. For rankings updating by rating periods, like :class:`rstt.ranking.standard.BasicGlicko`,
+        a chunk is a period. Use :class:`rstt.ranking.standard.PeriodAccumulator` to control the periods instead.
+
+    Parameters
+    ----------
+    ranking : Ranking
+        The ranking to update
+    path : Union[str, os.PathLike]
+        The CSV file
+    **kwargs
+        Parameters of :func:`rstt.game.importer.read_csv`
+    """
+    kwargs.setdefault('registry', getattr(ranking.datamodel, 'registry', None))
+    with ranking.batch():
+        for log in read_csv(path, **kwargs):
+            ranking.update(games=log)
@@ -1,5 +1,5 @@
 from typing import Optional
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 
 from rstt.stypes import SPlayer, Score
 import rstt.config as cfg
@@ -228,6 +228,33 @@ class Duel(Match):
         tracking = tracking if tracking is not None else cfg.DUEL_HISTORY
         super().__init__(teams=[[player1], [player2]], tracking=tracking)
 
+    @classmethod
+    def played(cls, player1: SPlayer, player2: SPlayer, result: Score, tracking: Optional[bool] = None) -> 'Duel':
+        """Alternative constructor for a Duel with a known outcome
+
+        Build a duel that has already been played, for example a game read from records.
+        To generate the outcome of a duel, use a :class:`rstt.stypes.Solver` instead.
+
+        Parameters
+        ----------
+        player1 : SPlayer
+            A player considered at 'home'.
+        player2 : SPlayer
+            A player considered as 'visitor'
+        result : Score
+            The scores of player1 and player2, like :attr:`rstt.solver.solvers.WIN`.
+        tracking : bool, optional
+            If true, the duel is added to the both player's game history, by default None.
+
+        Returns
+        -------
+        Duel
+            A duel that is not live.
+        """
+        duel = cls(player1, player2, tracking=tracking)
+        duel._Match__set_result(result)
+        return duel
+
     # --- getter --- #
     def player1(self) -> SPlayer:
         """Getter method for player 1
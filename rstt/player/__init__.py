@@ -4,6 +4,8 @@ SPlayer is the notion of competitors facing each others. They are elemts of :cla
 """
 
 
+# NOBUG: imported first, rstt.game depends on it and is imported by the other modules
+from .registry import PlayerRegistry
 from .basicplayer import BasicPlayer
 from .player import Player
 from .playerTVS import PlayerTVS, ExponentialPlayer, LogisticPlayer, CyclePlayer, JumpPlayer
@@ -19,4 +21,5 @@ __all__ = [
     "CyclePlayer",
     "JumpPlayer",
     "GaussianPlayer",
+    "PlayerRegistry",
 ]
@@ -1,5 +1,5 @@
 from typing import Dict, Any, Callable, Optional
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 import rstt.config as cfg
 
 import names
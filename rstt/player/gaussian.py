@@ -1,10 +1,10 @@
 from typing import Optional
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 
 import rstt.config as cfg
+import rstt.utils.rng as ur
 from .playerTVS import PlayerTVS
 
-import random
 
 
 class GaussianPlayer(PlayerTVS):
@@ -44,5 +44,5 @@ class GaussianPlayer(PlayerTVS):
             **cfg.GAUSSIAN_PLAYER_SIGMA_ARGS)
 
     def _update_level(self, *args, **kwars) -> None:
-        self._PlayerTVS__current_level = random.gauss(
+        self._PlayerTVS__current_level = ur.current().random.gauss(
             self._BasicPlayer__level, self.__sigma)
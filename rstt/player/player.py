@@ -1,5 +1,5 @@
 from typing import List, Union, Optional
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 
 from rstt.player.basicplayer import BasicPlayer
 from rstt.game import Match
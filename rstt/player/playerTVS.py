@@ -1,5 +1,5 @@
 from typing import List, Optional
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 
 import abc
 
@@ -7,9 +7,9 @@ import rstt.config as cfg
 from rstt.stypes import SMatch
 from rstt.player import Player
 import rstt.utils.functions as uf
+import rstt.utils.rng as ur
 
 import numpy as np
-import random
 
 
 class PlayerTVS(Player, metaclass=abc.ABCMeta):
@@ -327,7 +327,7 @@ class JumpPlayer(PlayerTVS):
         self.__sigma = sigma if sigma else cfg.JUMP_SIGMA_DIST(
             **cfg.JUMP_SIGMA_ARGS)
         self.__tau = tau if tau else cfg.JUMP_TAU_DIST(**cfg.JUMP_TAU_ARGS)
-        self.__timer = np.random.geometric(1/self.__tau)
+        self.__timer = ur.current().generator.geometric(1/self.__tau)
 
     def _update_level(self, *args, **kwars):
         self.__tictac()
@@ -339,9 +339,9 @@ class JumpPlayer(PlayerTVS):
     def __jump(self):
         if self.__timer == 0:
             # new timer
-            self.__timer = np.random.geometric(1/self.__tau)
+            self.__timer = ur.current().generator.geometric(1/self.__tau)
             # new level
-            self._PlayerTVS__current_level += random.gauss(0, self.__sigma)
+            self._PlayerTVS__current_level += ur.current().random.gauss(0, self.__sigma)
 
 
 # TODO: add the Ornstein-Uhlenbeck model from D. Aldous
@@ -0,0 +1,137 @@
+from typing import Optional, Iterable, Iterator, Union
+
+from rstt.stypes import SPlayer
+
+import numpy as np
+
+
+class PlayerRegistry():
+    def __init__(self, players: Optional[Iterable[SPlayer]] = None) -> None:
+        """Player identity registry
+
+        Assign stable dense integer ids to players: the first registered player has id 0, the next one id 1, and so on.
+        Ids are never reused, a registry only grows.
+
+        Containers sharing a registry can exchange players as integer arrays instead of objects.
+        For example a :class:`rstt.game.gamelog.GameLog` and an :class:`rstt.ranking.datamodel.ArrayKeyModel`
+        built on the same registry translate ids to rating slots without hashing any player.
+
+        Parameters
+        ----------
+        players : Optional[Iterable[SPlayer]], optional
+            Players to register, in order, by default None.
+        """
+        self.__ids: dict[SPlayer, int] = {}
+        self.__players: list[SPlayer] = []
+        for player in (players if players else []):
+            self.register(player)
+
+    # --- setter --- #
+    def register(self, player: SPlayer) -> int:
+        """Register a player
+
+        Parameters
+        ----------
+        player : SPlayer
+            A player, registered or not.
+
+        Returns
+        -------
+        int
+            The id of the player.
+        """
+        identifier = self.__ids.get(player)
+        if identifier is None:
+            identifier = len(self.__players)
+            self.__ids[player] = identifier
+            self.__players.append(player)
+        return identifier
+
+    # --- getter --- #
+    def id(self, player: SPlayer) -> int:
+        """Getter method for the id of a player
+
+        Parameters
+        ----------
+        player : SPlayer
+            A registered player.
+
+        Returns
+        -------
+        int
+            The id of the player.
+
+        Raises
+        ------
+        KeyError
+            When the player is not registered.
+        """
+        return self.__ids[player]
+
+    def ids(self, players: Iterable[SPlayer]) -> np.ndarray:
+        """Getter method for the ids of many players
+
+        Unregistered players are registered, in order.
+
+        Parameters
+        ----------
+        players : Iterable[SPlayer]
+            Players to identify.
+
+        Returns
+        -------
+        np.ndarray
+            int array, the id of each player.
+        """
+        return np.fromiter((self.register(player) for player in players), dtype=np.int64)
+
+    def player(self, identifier: int) -> SPlayer:
+        """Getter method for the player of an id
+
+        Parameters
+        ----------
+        identifier : int
+            A player id.
+
+        Returns
+        -------
+        SPlayer
+            The corresponding player.
+        """
+        return self.__players[identifier]
+
+    def players(self, identifiers: Optional[Iterable[int]] = None) -> list[SPlayer]:
+        """Getter method for the players of many ids
+
+        Parameters
+        ----------
+        identifiers : Optional[Iterable[int]], optional
+            Player ids, by default None which means all the registered players.
+
+        Returns
+        -------
+        list[SPlayer]
+            The corresponding players, in order.
+        """
+        if identifiers is None:
+            return list(self.__players)
+        return [self.__players[identifier] for identifier in identifiers]
+
+    # --- magic methods --- #
+    def __getitem__(self, identifier: Union[int, slice]) -> Union[SPlayer, list[SPlayer]]:
+        return self.__players[identifier]
+
+    def __contains__(self, player: SPlayer) -> bool:
+        return player in self.__ids
+
+    def __len__(self) -> int:
+        return len(self.__players)
+
+    def __iter__(self) -> Iterator[SPlayer]:
+        return iter(self.__players)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __str__(self) -> str:
+        return f"{type(self)} - players: {len(self)}"
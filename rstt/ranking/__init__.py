@@ -3,10 +3,10 @@
 
 from . import rating
 
-from .standing import Standing
+from .standing import Standing, ArrayStanding
 from .ranking import Ranking
 
-from .datamodel import KeyModel, GaussianModel
+from .datamodel import KeyModel, GaussianModel, ArrayKeyModel, ArrayGaussianModel
 
 from .observer import (
     GameByGame, BatchGame,
@@ -25,9 +25,12 @@ from .standard import (
 __all__ = [
     "rating",
     "Standing",
+    "ArrayStanding",
     "Ranking",
     "KeyModel",
     "GaussianModel",
+    "ArrayKeyModel",
+    "ArrayGaussianModel",
     "GameByGame",
     "BatchGame",
     "PlayerChecker",
@@ -4,13 +4,17 @@ RatingSystem are ranking component acting as defaultdictionary to store rating f
 It provide get(), set() and ordinal() methods.
 """
 
-from typing import List, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Optional, Iterator, Tuple
 from collections import defaultdict
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
+import dataclasses
 
 from rstt.stypes import SPlayer
 from rstt import BasicPlayer
+from rstt.player import PlayerRegistry
 
+import numpy as np
+import numbers
 import copy
 
 
@@ -40,12 +44,15 @@ class keydefaultdict(defaultdict[SPlayer, Any]):
 
 class KeyModel:
     @typechecked
-    def __init__(self, default: Optional[Any] = None, template: Optional[Callable] = None, factory: Optional[Callable] = None, **kwargs):
+    def __init__(self, default: Optional[Any] = None, template: Optional[Callable] = None, factory: Optional[Callable] = None,
+                 registry: Optional[PlayerRegistry] = None, **kwargs):
         r"""Basic Rating system
 
         The KeyModel is a intuitive implementation of :class:`rstt.stypes.RatingSystem` that strores ratings of player in a defauldict.
         The default rating value can be specified in three different fashions.
 
+        Internally, ratings are keyed on the player ids of a :class:`rstt.player.PlayerRegistry`, players are only exposed at the interface.
+
         Parameters
         ----------
         default : Any, optional
@@ -53,8 +60,10 @@ class KeyModel:
         template : Callable, optional
             A lambda function to generate default ratings, by default None
         factory : _type_, optional
-            A Callable of the form lambda x: ..., where x is the SPlayer with no rating, by default None. If you pass a factory,
-            the KeyModel stores ratings in  a :class:`rstt.ranking.datamodel.keydefauldict`.
+            A Callable of the form lambda x: ..., where x is the SPlayer with no rating, by default None.
+        registry : Optional[PlayerRegistry], optional
+            The registry identifying the players, by default None and the KeyModel creates its own.
+            A :class:`rstt.ranking.ranking.Ranking` shares the registry of its datamodel with its standing.
 
         .. note::
             If you are using the \'template\' or \'factory\', you can additionaly specify \**kwargs to be passed to the template every time it is called to generate a new rating.
@@ -68,10 +77,19 @@ class KeyModel:
             KeyModel(template=GaussianRating, 1500, 250)
             KeyModel(factory=GaussianRating, mu=1500, sigma=250)
         """
-        self.__ratings = self.__init_ratings(
+        self.registry = registry if registry is not None else PlayerRegistry()
+        self.__ratings: Dict[int, Any] = {}  # {player id: rating}
+        self.__factory = self.__init_ratings(
             default, template, factory, **kwargs)
         self.__rtype = self.__get_rating_type()
         self.__default = self.__get_default_rating()
+        # NOBUG: mutable ratings can be modified in place by the caller of get()
+        self.__mutable = not isinstance(self.__default, (numbers.Number, str, bytes, tuple, frozenset))
+
+        # ids whose rating has been set, or exposed when mutable, since the last pop_dirty() call - dict used as an ordered set
+        self.__dirty: Dict[int, None] = {}
+        # ids added since the last pop_new() call - dict used as an ordered set
+        self.__new: Dict[int, None] = {}
 
     # --- setter --- #
     @typechecked
@@ -92,10 +110,19 @@ class KeyModel:
             The set operation will not throw any error. Yet, following calls to :func:`rstt.ranking.datamodel.KeyModel.ordinal` ordinal method could fail without proper error traceback.
 
             Hopefull future version will fix this issue.
+
+        .. note::
+            The key is recorded as 'dirty', see :func:`rstt.ranking.datamodel.KeyModel.pop_dirty`.
         """
         # TODO: test rating type before assignement and thorw TypeError
         # !!! the problem is how the type is defined? built-in, class, protocol 'attribute protocol' ? isinstance does not work for all cases.
-        self.__ratings[key] = rating
+        identifier = self.registry.register(key)
+        if identifier not in self.__ratings:
+            self.__new[identifier] = None
+        self.__ratings[identifier] = rating
+        # keep the dirty keys in order of last modification
+        self.__dirty.pop(identifier, None)
+        self.__dirty[identifier] = None
 
     # --- getter --- #
     @typechecked
@@ -111,33 +138,76 @@ class KeyModel:
         -------
         Any
             The rating of the player
+
+        .. note::
+            When ratings are mutable objects, like a :class:`rstt.ranking.rating.GlickoRating`, the key is recorded as 'dirty',
+            since the returned rating can be modified in place. See :func:`rstt.ranking.datamodel.KeyModel.pop_dirty`.
         """
         # QUEST: __getitem__ ?
-        return self.__ratings[key]
+        identifier = self.registry.register(key)
+        if self.__mutable:
+            self.__dirty[identifier] = None
+        return self.__rating(identifier, key)
 
-    def items(self):
+    def items(self) -> List[Tuple[SPlayer, Any]]:
         """Dict like items() method
 
-        return the view object returned by the underlying dict.items method
+        Similar to dict.items() but it returns a list, not a view.
 
         Returns
         -------
-        view object
+        List[Tuple[SPlayer, Any]]
             items stored in the KeyModel
+
+        .. note::
+            Like get(), all keys are recorded as 'dirty' when ratings are mutable.
         """
-        return self.__ratings.items()
+        if self.__mutable:
+            self.__dirty.update(dict.fromkeys(self.__ratings))
+        return list(zip(self.keys(), self.__ratings.values()))
 
-    def keys(self):
+    def keys(self) -> List[SPlayer]:
         """Dict like keys() method
 
-        return the view object returned by the underlying dict.keys method
+        Similar to dict.keys() but it returns a list, not a view.
 
         Returns
         -------
-        view object
+        List[SPlayer]
             keys, i.e. SPlayer.
         """
-        return self.__ratings.keys()
+        return self.registry.players(self.__ratings)
+
+    def pop_dirty(self) -> List[SPlayer]:
+        """Getter for modified keys
+
+        Return the keys whose rating has been set since the previous call, and reset the record.
+        It allows a :class:`rstt.ranking.ranking.Ranking` to synchronise only the changed entries of its standing.
+
+        Mutable ratings returned by :func:`rstt.ranking.datamodel.KeyModel.get` or items() may be modified in place without a set() call,
+        their keys are returned too.
+
+        Returns
+        -------
+        List[SPlayer]
+            Keys passed to :func:`rstt.ranking.datamodel.KeyModel.set`, or whose mutable rating was exposed, since the last call.
+        """
+        dirty, self.__dirty = self.__dirty, {}
+        return self.registry.players(dirty)
+
+    def pop_new(self) -> List[SPlayer]:
+        """Getter for added keys
+
+        Return the keys that received a rating, default or set, since the previous call, and reset the record.
+        It allows a :class:`rstt.ranking.ranking.Ranking` to register new players in its standing without comparing all keys.
+
+        Returns
+        -------
+        List[SPlayer]
+            Keys added to the KeyModel since the last call, in order of addition.
+        """
+        new, self.__new = self.__new, {}
+        return self.registry.players(new)
 
     # --- general purpose methords --- #
     def rtype(self) -> type:
@@ -191,6 +261,23 @@ class KeyModel:
         # NOTE: name source -> https://fr.wikipedia.org/wiki/Nombre_ordinal
         return float(rating)
 
+    def ordinal_all(self, keys: List[SPlayer]) -> np.ndarray:
+        """Ordinal of many players
+
+        Unlike get(), reading the ratings does not record the keys as 'dirty'.
+
+        Parameters
+        ----------
+        keys : List[SPlayer]
+            Players to compute the ordinal of.
+
+        Returns
+        -------
+        np.ndarray
+            The ordinal values.
+        """
+        return np.array([self.ordinal(self.__rating(self.registry.register(key), key)) for key in keys], dtype=float)
+
     def tiebreaker(self, rating: Any) -> List[Any]:
         """
         .. warning:: 
@@ -205,12 +292,21 @@ class KeyModel:
             return 0
 
     # --- internal mechanism --- #
+    def __rating(self, identifier: int, key: SPlayer) -> Any:
+        try:
+            return self.__ratings[identifier]
+        except KeyError:
+            # like a defaultdict, a missing key receives a default rating
+            self.__new[identifier] = None
+            rating = self.__ratings[identifier] = self.__factory(key)
+            return rating
+
     def __init_ratings(self, default, template, factory, **kwargs):
         ''' rating initialization
 
-        return: defaultdict {key: rating}
-            where key are the one contained in the standing
-            and rating are object used to compute the associated value. 
+        return: Callable[[SPlayer], rating]
+            the default rating of a key,
+            where rating are object used to compute the associated value. 
 
         REQ:
             - each key as its own rating
@@ -238,33 +334,39 @@ class KeyModel:
         return ratings
 
     def __default_ratings(self, value):
-        return defaultdict(lambda: copy.deepcopy(value))
+        return lambda key: copy.deepcopy(value)
 
     def __template_ratings(self, template, **kwargs):
-        return defaultdict(lambda: template(**kwargs))
+        return lambda key: template(**kwargs)
 
     def __factory_ratings(self, func: Callable, **kwargs):
-        return keydefaultdict(default_factory=lambda x: func(x, **kwargs))
+        return lambda key: func(key, **kwargs)
 
     def __get_rating_type(self):
+        # the dummy is not registered, registries only grow
         dummy = BasicPlayer('dummy', 0.0)
         # !!! This may not always work as intended
-        rtype = type(self.__ratings[dummy])
-        del self.__ratings[dummy]
-        return rtype
+        return type(self.__factory(dummy))
 
     def __get_default_rating(self):
         dummy = BasicPlayer('dummy', 0.0)
-        self.__ratings[dummy]
-        return self.__ratings.pop(dummy)
+        return self.__factory(dummy)
 
     # --- magic methods --- #
     def __delitem__(self, key: SPlayer):
-        del self.__ratings[key]
+        identifier = self.registry.id(key)
+        del self.__ratings[identifier]
+        self.__dirty.pop(identifier, None)
+        self.__new.pop(identifier, None)
+
+    def __contains__(self, key: SPlayer) -> bool:
+        return key in self.registry and self.registry.id(key) in self.__ratings
+
+    def __len__(self) -> int:
+        return len(self.__ratings)
 
     # ??? __setitem__
     # ??? __getitem__
-    # ??? __contain__
 
 
 class GaussianModel(KeyModel):
@@ -304,3 +406,356 @@ class GaussianModel(KeyModel):
 
     def tiebreaker(self, rating):
         return [rating.mu, rating.sigma]
+
+
+class ArrayKeyModel:
+    @typechecked
+    def __init__(self, default: Any = 0.0, registry: Optional[PlayerRegistry] = None):
+        """Array based Rating system
+
+        Structure-of-arrays alternative to :class:`rstt.ranking.datamodel.KeyModel`.
+        Each player owns an integer slot and ratings are stored in contiguous float64 NumPy arrays, one per rating field.
+        Float ratings (e.g. elo) use a single array, dataclass ratings (e.g. :class:`rstt.ranking.rating.GlickoRating`) one array per field.
+
+        It implements the :class:`rstt.stypes.RatingSystem` protocol, so a :class:`rstt.ranking.ranking.Ranking` can use it as datamodel,
+        and provides vectorized access for inference code: :func:`rstt.ranking.datamodel.ArrayKeyModel.indices`,
+        :func:`rstt.ranking.datamodel.ArrayKeyModel.array` and :func:`rstt.ranking.datamodel.ArrayKeyModel.ordinal_all`.
+
+        .. warning::
+            get() returns a new rating object built from the arrays. Modifying it in place has no effect on the model, use set().
+
+        Parameters
+        ----------
+        default : Any, optional
+            A default rating value, either a float or a dataclass instance with float fields, by default 0.0
+        registry : Optional[PlayerRegistry], optional
+            The registry identifying the players, by default None and the model creates its own.
+            Players added to the model are registered, see :func:`rstt.ranking.datamodel.ArrayKeyModel.registry_indices`.
+
+        Raises
+        ------
+        TypeError
+            When the default rating is neither a number nor a dataclass instance.
+        """
+        self.__rtype = type(default)
+        self.__default = copy.deepcopy(default)
+        if isinstance(default, (int, float)):
+            self.__rtype = float
+            self.__fields = None
+            defaults = {None: float(default)}
+        elif dataclasses.is_dataclass(default) and not isinstance(default, type):
+            self.__fields = [field.name for field in dataclasses.fields(default)]
+            defaults = {name: float(getattr(default, name)) for name in self.__fields}
+        else:
+            msg = f"ArrayKeyModel default rating must be a float or a dataclass instance, not {type(default)}"
+            raise TypeError(msg)
+
+        # data - slot indexed arrays, only [:self._size] is meaningfull
+        self._defaults: Dict[Optional[str], float] = defaults
+        self._arrays: Dict[Optional[str], np.ndarray] = {name: np.empty(0, dtype=np.float64) for name in defaults}
+        self._ids = np.empty(0, dtype=np.int64)  # registry id of each slot
+        self._size = 0
+
+        # registry id -> slot, -1 for players not in the model
+        self.registry = registry if registry is not None else PlayerRegistry()
+        self._slots = np.empty(0, dtype=np.int64)
+
+        # ids modified/added since the last pop_dirty()/pop_new() call - dict used as an ordered set
+        self.__dirty = {}
+        self.__new = {}
+
+    # --- setter --- #
+    def set(self, key: SPlayer, rating: Any):
+        """Set method to manualy assign a rating to a player.
+
+        Parameters
+        ----------
+        key : SPlayer
+            A Player to modify the rating
+        rating : Any
+            a new rating, of the same type as the default rating.
+        """
+        slot = self.__slot(key)
+        if self.__fields is None:
+            self._arrays[None][slot] = rating
+        else:
+            for name in self.__fields:
+                self._arrays[name][slot] = getattr(rating, name)
+        self.__touch(int(self._ids[slot]))
+
+    @typechecked
+    def set_all(self, slots: np.ndarray, **arrays: np.ndarray):
+        """Bulk setter
+
+        Assign new values to many slots at once, for example the output of a vectorized inferer.
+
+        Parameters
+        ----------
+        slots : np.ndarray
+            Slots of the players, as returned by :func:`rstt.ranking.datamodel.ArrayKeyModel.indices`
+        **arrays : np.ndarray
+            New values by rating field, e.g. mu=..., sigma=... . For float ratings use the keyword 'value'.
+        """
+        for name, values in arrays.items():
+            self.array(name)[slots] = values
+        for identifier in self._ids[slots].tolist():
+            self.__touch(identifier)
+
+    # --- getter --- #
+    def get(self, key: SPlayer) -> Any:
+        """getter method for the rating of a player
+
+        Parameters
+        ----------
+        key : SPlayer
+            A player to get the rating. Missing players receive the default rating.
+
+        Returns
+        -------
+        Any
+            The rating of the player
+        """
+        return self.__rating(self.__slot(key))
+
+    @typechecked
+    def indices(self, keys: List[SPlayer]) -> np.ndarray:
+        """Slots of players
+
+        Missing players are added with the default rating.
+
+        Parameters
+        ----------
+        keys : List[SPlayer]
+            Players to locate in the arrays.
+
+        Returns
+        -------
+        np.ndarray
+            The slot of each player.
+        """
+        return self.registry_indices(self.registry.ids(keys))
+
+    def registry_indices(self, identifiers: np.ndarray) -> np.ndarray:
+        """Slots of players given their registry ids
+
+        Counterpart of :func:`rstt.ranking.datamodel.ArrayKeyModel.indices` for players identified by the model registry, with arrays only.
+        Missing players are added with the default rating, in order of first appearance.
+
+        Parameters
+        ----------
+        identifiers : np.ndarray
+            int array, registry ids of the players.
+
+        Returns
+        -------
+        np.ndarray
+            The slot of each player.
+        """
+        identifiers = np.asarray(identifiers, dtype=np.int64)
+        self.__sync_registry()
+        slots = self._slots[identifiers]
+        missing = slots < 0
+        if missing.any():
+            news, first = np.unique(identifiers[missing], return_index=True)
+            for identifier in news[np.argsort(first)].tolist():
+                self.__add(identifier)
+            slots = self._slots[identifiers]
+        return slots
+
+    def array(self, name: Optional[str] = None) -> np.ndarray:
+        """Getter for a rating field
+
+        Parameters
+        ----------
+        name : Optional[str], optional
+            A field of the rating type, e.g. 'mu', by default None for float ratings (also accessible as 'value').
+
+        Returns
+        -------
+        np.ndarray
+            A view of the values in slot order. Writing into it bypasses the dirty keys tracking.
+        """
+        if name == 'value':
+            name = None
+        return self._arrays[name][:self._size]
+
+    def items(self) -> List[Tuple[SPlayer, Any]]:
+        """Dict like items() method
+
+        Returns
+        -------
+        List[Tuple[SPlayer, Any]]
+            pairs of players and ratings, in slot order
+        """
+        return [(key, self.__rating(slot)) for slot, key in enumerate(self.keys())]
+
+    def keys(self) -> List[SPlayer]:
+        """Dict like keys() method
+
+        Returns
+        -------
+        List[SPlayer]
+            keys, in slot order.
+        """
+        return self.registry.players(self._ids[:self._size].tolist())
+
+    def pop_dirty(self) -> List[SPlayer]:
+        """Getter for modified keys
+
+        See :func:`rstt.ranking.datamodel.KeyModel.pop_dirty`.
+        """
+        dirty, self.__dirty = self.__dirty, {}
+        return self.registry.players(dirty)
+
+    def pop_new(self) -> List[SPlayer]:
+        """Getter for added keys
+
+        See :func:`rstt.ranking.datamodel.KeyModel.pop_new`.
+        """
+        new, self.__new = self.__new, {}
+        return self.registry.players(new)
+
+    # --- general purpose methods --- #
+    def rtype(self) -> type:
+        return self.__rtype
+
+    def default(self) -> Any:
+        return copy.deepcopy(self.__default)
+
+    def ordinal(self, rating: Any) -> float:
+        """Convert a rating into a float value
+
+        See :func:`rstt.ranking.datamodel.KeyModel.ordinal`.
+        """
+        return float(rating)
+
+    def ordinal_all(self, keys: Optional[List[SPlayer]] = None) -> np.ndarray:
+        """Vectorized ordinal
+
+        Parameters
+        ----------
+        keys : Optional[List[SPlayer]], optional
+            Players to compute the ordinal of, by default None for all players in slot order.
+
+        Returns
+        -------
+        np.ndarray
+            The ordinal values.
+        """
+        slots = slice(None) if keys is None else self.indices(keys)
+        return self._ordinal_arrays({name: self.array(name)[slots] for name in self._arrays})
+
+    def _ordinal_arrays(self, arrays: Dict[Optional[str], np.ndarray]) -> np.ndarray:
+        '''vectorized counterpart of ordinal(), to override alongside it'''
+        if None not in arrays:
+            msg = f"{type(self).__name__} can not compute ordinal of {self.__rtype} ratings, override ordinal() and _ordinal_arrays()"
+            raise TypeError(msg)
+        return arrays[None].copy()
+
+    def tiebreaker(self, rating: Any) -> List[Any]:
+        """
+        .. warning::
+            DO NOT USE.
+
+            Boilerplate code for future features.
+
+        """
+        return KeyModel.tiebreaker(self, rating)
+
+    # --- internal mechanism --- #
+    def __rating(self, slot: int) -> Any:
+        if self.__fields is None:
+            return self.__rtype(self._arrays[None][slot])
+        return self.__rtype(**{name: float(self._arrays[name][slot]) for name in self.__fields})
+
+    def __slot(self, key: SPlayer) -> int:
+        identifier = self.registry.register(key)
+        self.__sync_registry()
+        slot = int(self._slots[identifier])
+        if slot < 0:
+            slot = self.__add(identifier)
+        return slot
+
+    def __add(self, identifier: int) -> int:
+        slot = self._size
+        if slot == len(self._ids):
+            capacity = max(2 * slot, 16)
+            for name, array in self._arrays.items():
+                grown = np.empty(capacity, dtype=np.float64)
+                grown[:slot] = array[:slot]
+                self._arrays[name] = grown
+            grown = np.empty(capacity, dtype=np.int64)
+            grown[:slot] = self._ids[:slot]
+            self._ids = grown
+        for name, value in self._defaults.items():
+            self._arrays[name][slot] = value
+        self._ids[slot] = identifier
+        self._slots[identifier] = slot
+        self._size += 1
+        self.__new[identifier] = None
+        return slot
+
+    def __sync_registry(self):
+        if len(self._slots) < len(self.registry):
+            capacity = max(len(self.registry), 2 * len(self._slots))
+            grown = np.full(capacity, -1, dtype=np.int64)
+            grown[:len(self._slots)] = self._slots
+            self._slots = grown
+
+    def __touch(self, identifier: int):
+        # keep the dirty ids in order of last modification
+        self.__dirty.pop(identifier, None)
+        self.__dirty[identifier] = None
+
+    # --- magic methods --- #
+    def __delitem__(self, key: SPlayer):
+        '''swap-remove: the last slot fills the freed one'''
+        if key not in self:
+            raise KeyError(key)
+        identifier = self.registry.id(key)
+        slot, last = int(self._slots[identifier]), self._size - 1
+        if slot != last:
+            moved = self._ids[last]
+            for array in self._arrays.values():
+                array[slot] = array[last]
+            self._ids[slot] = moved
+            self._slots[moved] = slot
+        self._slots[identifier] = -1
+        self._size = last
+        self.__dirty.pop(identifier, None)
+        self.__new.pop(identifier, None)
+
+    def __contains__(self, key: SPlayer) -> bool:
+        if key not in self.registry:
+            return False
+        identifier = self.registry.id(key)
+        return identifier < len(self._slots) and self._slots[identifier] >= 0
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class ArrayGaussianModel(ArrayKeyModel):
+    def __init__(self, *args, **kwargs):
+        """Array based Gaussian Rating System
+
+        :class:`rstt.ranking.datamodel.ArrayKeyModel` counterpart of :class:`rstt.ranking.datamodel.GaussianModel`.
+        Associated ratings must be dataclasses with a mu and a sigma field.
+        """
+        super().__init__(*args, **kwargs)
+        if not self._arrays.keys() >= {'mu', 'sigma'}:
+            msg = f"ArrayGaussianModel ratings need a 'mu' and a 'sigma' field, got {list(self._arrays)}"
+            raise TypeError(msg)
+
+    def ordinal(self, rating) -> float:
+        """Ordinal method for gaussian values
+
+        See :func:`rstt.ranking.datamodel.GaussianModel.ordinal`.
+        """
+        return rating.mu - 2*rating.sigma
+
+    def _ordinal_arrays(self, arrays: Dict[Optional[str], np.ndarray]) -> np.ndarray:
+        return arrays['mu'] - 2*arrays['sigma']
+
+    def tiebreaker(self, rating):
+        return [rating.mu, rating.sigma]
@@ -1,6 +1,12 @@
 import rstt.utils.functions as uf
+import rstt.utils.observer as uo
 
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
+from typing import Tuple
+
+import numpy as np
+import itertools
+import math
 
 
 class Elo:
@@ -21,6 +27,7 @@ class Elo:
         self.K = k
         # QUEST: should the base implementation support distribution function as parameters
 
+    @uo.declare_args('rating_groups', 'scores')
     @typechecked
     def rate(self, rating_groups: list[list[float]], scores: list[float], *args, **kwars) -> list[list[float]]:
         """Rate method for elo
@@ -120,3 +127,36 @@ class Elo:
             post rating
         """
         return prior_rating + self.K * (sum(scores) - sum([self.expectedScore(prior_rating, rating2) for rating2 in ratings_opponents]))
+
+    def rate_duels(self, ratings1: np.ndarray, ratings2: np.ndarray,
+                   scores1: np.ndarray, scores2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized 1-versus-1 updates
+
+        Update independent duels at once. Each entry gives the same result, bit for bit,
+        as :func:`rstt.ranking.inferer.Elo.rate` called with rating_groups=[[rating1], [rating2]] and scores=[score1, score2].
+
+        Parameters
+        ----------
+        ratings1 : np.ndarray
+            ratings of the first players
+        ratings2 : np.ndarray
+            ratings of the second players
+        scores1 : np.ndarray
+            scores of the first players
+        scores2 : np.ndarray
+            scores of the second players
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            updated ratings of the first and second players
+        """
+        expected1 = self.__expected_scores(ratings1-ratings2)
+        expected2 = self.__expected_scores(ratings2-ratings1)
+        return ratings1 + self.K * (scores1 - expected1), ratings2 + self.K * (scores2 - expected2)
+
+    def __expected_scores(self, diffs: np.ndarray) -> np.ndarray:
+        # np.power does not round like math.pow: only the power is computed per element, as in uf.logistic_elo
+        exponents = -diffs / self.lc
+        powers = np.fromiter(map(math.pow, itertools.repeat(self.base), exponents.tolist()), dtype=np.float64, count=len(diffs))
+        return 1.0 / (1.0 + powers)
@@ -1,8 +1,12 @@
 import copy
 import math
 
-from typeguard import typechecked
-from typing import Any
+from rstt.utils.typecheck import typechecked
+from typing import Any, Tuple
+
+import rstt.utils.observer as uo
+
+import numpy as np
 
 import warnings
 
@@ -185,6 +189,24 @@ class Glicko:
         # check boundaries on sigma - ??? move max() elsewhere
         return max(min(new_RD, self.__maxRD), self.__minRD)
 
+    def prePeriod_RD_all(self, sigma: np.ndarray) -> np.ndarray:
+        """Vectorized pre update RD value
+
+        Array version of :func:`rstt.ranking.inferer.Glicko.prePeriod_RD`.
+
+        Parameters
+        ----------
+        sigma : np.ndarray
+            RD values to 'pre-update'
+
+        Returns
+        -------
+        np.ndarray
+            the new RD values.
+        """
+        new_RD = np.sqrt(sigma*sigma + self.C*self.C)
+        return np.clip(new_RD, self.__minRD, self.__maxRD)
+
     def newRating(self, rating1, games: list[tuple[Any, float]]):
         """Rating Update method
 
@@ -222,6 +244,7 @@ class Glicko:
 
         return rating
 
+    @uo.declare_args('rating', 'ratings_opponents', 'scores')
     def rate(self, rating, ratings_opponents: list[Any], scores: list[float], *args, **kwars):
         """Glicko rate method
 
@@ -245,3 +268,114 @@ class Glicko:
         # formating
         games = [(r, s) for r, s in zip(ratings_opponents, scores)]
         return self.newRating(rating, games)
+
+    def rate_period(self, player_idx: np.ndarray, opp_idx: np.ndarray, scores: np.ndarray,
+                    mu: np.ndarray, sigma: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized rating period
+
+        Compute the step 2 of the rating period for all players at once, using only prior ratings.
+        Results are the ones of :func:`rstt.ranking.inferer.Glicko.rate` called for each active player, up to floating point rounding.
+
+        Games are passed as records, one per player and game: the k-th record states that player_idx[k] scored scores[k] against opp_idx[k].
+        A duel thus produces two records.
+
+        Parameters
+        ----------
+        player_idx : np.ndarray
+            int array, index of the rated player of each record
+        opp_idx : np.ndarray
+            int array, index of the opponent of each record
+        scores : np.ndarray
+            score of the rated player of each record
+        mu : np.ndarray
+            prior ratings mean, indexed by player
+        sigma : np.ndarray
+            prior ratings RD, indexed by player
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Posterior mu and sigma arrays. Players without records keep their prior values.
+
+        Warns
+        -----
+            Same numerical issue as :func:`rstt.ranking.inferer.Glicko.d2`, handled the same way.
+        """
+        n = len(mu)
+        weights, improvements = self.period_terms(mu[player_idx], mu[opp_idx], sigma[opp_idx], scores)
+
+        # per player sums
+        bigSum = np.bincount(player_idx, weights=weights, minlength=n)
+        b = np.bincount(player_idx, weights=improvements, minlength=n)
+        active = np.bincount(player_idx, minlength=n) > 0
+
+        new_mu, new_sigma = mu.astype(np.float64), sigma.astype(np.float64)
+        new_mu[active], new_sigma[active] = self.close_period(bigSum[active], b[active], mu[active], sigma[active])
+        return new_mu, new_sigma
+
+    def period_terms(self, mu: np.ndarray, opp_mu: np.ndarray, opp_sigma: np.ndarray,
+                     scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Game terms of a rating period
+
+        Within a rating period, a game contributes to the rating of a player only through two terms, both depending on prior ratings:
+        g(RD_j)^2 * E * (1-E), summed in the d^2 formula, and g(RD_j) * (s-E), summed in the new rating formula.
+        Their per player sums are the sufficient statistics of the period, see :func:`rstt.ranking.inferer.Glicko.close_period`.
+
+        Parameters
+        ----------
+        mu : np.ndarray
+            prior mean of the rated player of each game
+        opp_mu : np.ndarray
+            prior mean of the opponent of each game
+        opp_sigma : np.ndarray
+            prior RD of the opponent of each game
+        scores : np.ndarray
+            score of the rated player of each game
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            d^2 terms and rating change terms of each game
+        """
+        # g(RD_j) and E(s|r, r_j, RD_j) of each game
+        Gj = 1 / np.sqrt(1 + 3*self.Q*self.Q*(opp_sigma*opp_sigma)/(math.pi*math.pi))
+        Ej = 1 / (1 + np.power(10, -Gj * (mu-opp_mu)/400))
+        return Gj*Gj*Ej*(1-Ej), Gj*(scores-Ej)
+
+    def close_period(self, weights: np.ndarray, improvements: np.ndarray,
+                     mu: np.ndarray, sigma: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Rating period from sufficient statistics
+
+        Compute the step 2 of the rating period of active players given the per player sums of :func:`rstt.ranking.inferer.Glicko.period_terms`.
+
+        Parameters
+        ----------
+        weights : np.ndarray
+            sum of the d^2 terms of each player
+        improvements : np.ndarray
+            sum of the rating change terms of each player
+        mu : np.ndarray
+            prior ratings mean of each player
+        sigma : np.ndarray
+            prior ratings RD of each player
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Posterior mu and sigma arrays.
+
+        Warns
+        -----
+            Same numerical issue as :func:`rstt.ranking.inferer.Glicko.d2`, handled the same way.
+        """
+        # d2 - see the NOTE in d2() about the zero division
+        degenerate = weights == 0
+        if degenerate.any():
+            msg = f"Glicko d2 ERROR: players {np.flatnonzero(degenerate).tolist()}\n d2 return value as been adjusted to 1/{0.00000000001}"
+            warnings.warn(msg, RuntimeWarning)
+            weights = np.where(degenerate, 0.00000000001, weights)
+        d2 = 1 / (self.Q*self.Q*weights)
+
+        # post period R and RD
+        a = self.Q / ((1/(sigma*sigma)) + (1/d2))
+        return mu + a*improvements, np.sqrt(1/((1/sigma**2) + (1/d2)))
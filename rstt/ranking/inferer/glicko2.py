@@ -1,6 +1,11 @@
 from .glicko import Glicko
 from ..rating import GlickoRating, Glicko2Rating
+import rstt.utils.observer as uo
 
+from typing import Tuple
+
+import numpy as np
+import warnings
 import math
 
 
@@ -190,6 +195,7 @@ class Glicko2(Glicko):
         return mu, sigma
 
     # --- Inference --- #
+    @uo.declare_args('rating', 'ratings_opponents', 'scores')
     def rate(self, rating: Glicko2Rating, ratings_opponents: list[Glicko2Rating], scores: list[float]):
         # !!! self._step1(...) needs to be performed in the forward method
         '''
@@ -219,6 +225,220 @@ class Glicko2(Glicko):
 
         return Glicko2Rating(post_mu, post_rd, post_volatility)
 
+    # --- Vectorized Inference --- #
+    def rate_period(self, player_idx: np.ndarray, opp_idx: np.ndarray, scores: np.ndarray,
+                    mu: np.ndarray, sigma: np.ndarray, volatility: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized rating period
+
+        Perform steps 2 to 8 for all players at once, using only prior ratings.
+        Results are the ones of :func:`rstt.ranking.inferer.Glicko2.rate` called for each active player, up to floating point rounding.
+        The volatility of step 5 is computed by :func:`rstt.ranking.inferer.Glicko2.volatility_all`.
+
+        Games are passed as records, like in :func:`rstt.ranking.inferer.Glicko.rate_period`.
+
+        Parameters
+        ----------
+        player_idx : np.ndarray
+            int array, index of the rated player of each record
+        opp_idx : np.ndarray
+            int array, index of the opponent of each record
+        scores : np.ndarray
+            score of the rated player of each record
+        mu : np.ndarray
+            prior ratings mean, indexed by player
+        sigma : np.ndarray
+            prior ratings deviation, indexed by player
+        volatility : np.ndarray
+            prior ratings volatility, indexed by player
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Posterior mu, sigma and volatility arrays. Players without records keep their prior values.
+        """
+        n = len(mu)
+        weights, improvements = self.period_terms(mu[player_idx], mu[opp_idx], sigma[opp_idx], scores)
+        bigSum = np.bincount(player_idx, weights=weights, minlength=n)
+        DELTA = np.bincount(player_idx, weights=improvements, minlength=n)
+        active = np.bincount(player_idx, minlength=n) > 0
+
+        new_mu, new_sigma, new_volatility = mu.astype(np.float64), sigma.astype(np.float64), volatility.astype(np.float64)
+        new_mu[active], new_sigma[active], new_volatility[active] = self.close_period(bigSum[active], DELTA[active],
+                                                                                      mu[active], sigma[active], volatility[active])
+        return new_mu, new_sigma, new_volatility
+
+    def period_terms(self, mu: np.ndarray, opp_mu: np.ndarray, opp_sigma: np.ndarray,
+                     scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Game terms of a rating period
+
+        Glicko-2 counterpart of :func:`rstt.ranking.inferer.Glicko.period_terms`, on the Glicko-2 scale:
+        g(phi_j)^2 * E * (1-E), summed in step 3, and g(phi_j) * (s-E), summed in step 4.
+
+        Parameters
+        ----------
+        mu : np.ndarray
+            prior mean of the rated player of each game
+        opp_mu : np.ndarray
+            prior mean of the opponent of each game
+        opp_sigma : np.ndarray
+            prior deviation of the opponent of each game
+        scores : np.ndarray
+            score of the rated player of each game
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            step 3 terms and step 4 terms of each game
+        """
+        # step2 - scaling down
+        m, m_j, phi_j = (mu-self.base_mu)/self.scaling, (opp_mu-self.base_mu)/self.scaling, opp_sigma/self.scaling
+
+        # step3 & step4 terms
+        g = 1 / np.sqrt(1 + 3*(phi_j**2)/(math.pi*math.pi))
+        E = 1 / (1 + np.exp(-g * (m-m_j)))
+        return g*g*E*(1-E), g*(scores-E)
+
+    def close_period(self, weights: np.ndarray, improvements: np.ndarray,
+                     mu: np.ndarray, sigma: np.ndarray, volatility: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Rating period from sufficient statistics
+
+        Perform steps 3 to 8 for active players given the per player sums of :func:`rstt.ranking.inferer.Glicko2.period_terms`.
+
+        Parameters
+        ----------
+        weights : np.ndarray
+            sum of the step 3 terms of each player
+        improvements : np.ndarray
+            sum of the step 4 terms of each player
+        mu : np.ndarray
+            prior ratings mean of each player
+        sigma : np.ndarray
+            prior ratings deviation of each player
+        volatility : np.ndarray
+            prior ratings volatility of each player
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Posterior mu, sigma and volatility arrays.
+        """
+        # step2 - scaling down
+        m, phi = (mu-self.base_mu)/self.scaling, sigma/self.scaling
+
+        # step3 - see the NOTE in Glicko.d2() about the zero division
+        degenerate = weights == 0
+        if degenerate.any():
+            msg = f"Glicko d2 ERROR: players {np.flatnonzero(degenerate).tolist()}\n d2 return value as been adjusted to 1/{0.00000000001}"
+            warnings.warn(msg, RuntimeWarning)
+            weights = np.where(degenerate, 0.00000000001, weights)
+        v = 1 / weights
+
+        # step4
+        delta = v * improvements
+
+        # step5
+        post_volatility = self.volatility_all(phi**2, volatility**2, v, delta**2)
+
+        # step6 & step7
+        phi_star = np.sqrt(phi**2 + post_volatility**2)
+        phi_prime = 1 / np.sqrt(1/phi_star**2 + 1/v)
+        mu_prime = m + phi_prime**2 * improvements
+
+        # step8 - scaling up
+        return self.scaling * mu_prime + self.base_mu, self.scaling * phi_prime, post_volatility
+
+    def volatility_all(self, phi2: np.ndarray, vol2: np.ndarray, v: np.ndarray, delta2: np.ndarray) -> np.ndarray:
+        """Vectorized step 5
+
+        Run the Illinois algorithm of :func:`rstt.ranking.inferer.Glicko2._step5` simultaneously for all entries.
+        Each entry stops iterating once converged, exactly like the scalar version.
+
+        Parameters
+        ----------
+        phi2 : np.ndarray
+            squared (scaled) rating deviations
+        vol2 : np.ndarray
+            squared volatilities
+        v : np.ndarray
+            step 3 estimated variances
+        delta2 : np.ndarray
+            squared step 4 estimated improvements
+
+        Returns
+        -------
+        np.ndarray
+            post volatilities
+        """
+        def f(x, i):
+            # like _step5, the current value of A is passed as the 'a' parameter of f()
+            ex = np.exp(x)
+            numerator = ex * (delta2[i] - phi2[i] - v[i] - ex)
+            denominator = 2 * (phi2[i] + v[i] + ex)**2
+            return (numerator / denominator) - ((x - A[i]) / self.tau**2)
+
+        every = slice(None)
+
+        # 1) set A
+        A = np.log(vol2)
+
+        # 2) initial values
+        B = np.empty_like(A)
+        large = delta2 > phi2 + v
+        B[large] = np.log(delta2[large] - phi2[large] - v[large])
+        small = np.flatnonzero(~large)
+        k = np.ones(len(small))
+        searching = np.ones(len(small), dtype=bool)
+        for _ in range(4):
+            # the scalar search stops at k == 5
+            searching &= f(A[small] - k*self.tau, small) < 0
+            k[searching] += 1
+        B[small] = A[small] - k*self.tau
+
+        # 3)
+        fA, fB = f(A, every), f(B, every)
+        # 4)
+        running = np.flatnonzero(np.abs(B-A) > self.epsilon)
+        while running.size:
+            # (a)
+            C = A[running] + (A[running]-B[running])*fA[running]/(fB[running]-fA[running])
+            fC = f(C, running)
+
+            # (b)
+            switch = fC*fB[running] <= 0
+            A[running[switch]] = B[running[switch]]
+            fA[running[switch]] = fB[running[switch]]
+            fA[running[~switch]] = fA[running[~switch]]/2
+
+            # (c)
+            B[running] = C
+            fB[running] = fC
+
+            # (d)
+            running = running[np.abs(B[running]-A[running]) > self.epsilon]
+
+        # 5) post volatility
+        return np.exp(A/2)
+
+    def unactive_RD_all(self, sigma: np.ndarray, volatility: np.ndarray) -> np.ndarray:
+        """Vectorized rating deviation of players without games
+
+        Apply step 6 to players who did not compete during the rating period (author note p.8).
+
+        Parameters
+        ----------
+        sigma : np.ndarray
+            rating deviations
+        volatility : np.ndarray
+            volatilities
+
+        Returns
+        -------
+        np.ndarray
+            The new rating deviations
+        """
+        phi = sigma/self.scaling
+        return self.scaling * np.sqrt(phi**2 + volatility**2)
+
 
 '''
 TODO:
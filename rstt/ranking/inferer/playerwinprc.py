@@ -1,6 +1,6 @@
 from rstt.stypes import SPlayer
 
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 
 import numpy as np
 
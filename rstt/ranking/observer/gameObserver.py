@@ -3,25 +3,36 @@
 
 from .obs import ObsTemplate
 import rstt.utils.observer as uo
+import rstt.config as cfg
+
+from typing import Optional
 
 
 class GameByGame(ObsTemplate):
-    def __init__(self):
+    def __init__(self, chunk_size: Optional[int] = None):
         """Game by Game updating Procedure
 
         Implementing an iterative approach where each observations triggers the entire updating workflows.
         In particular, new ratings are stored inbetween of each iterations, and the prior ones are lost.
 
+        Games are read lazily, 'games' and 'events' can be generators, and processed by chunks of 'chunk_size' games.
+        An update runs in constant memory regardless of the number of games.
+
+        Parameters
+        ----------
+        chunk_size : Optional[int], optional
+            Maximal number of games in memory during an update, by default None which uses :attr:`rstt.config.OBSERVER_CHUNK_SIZE`
+
         Observations
         ------------
         game : SMatch, optional
             a game justifying a ranking update, by default None
-        games : list[SMatch], optional
-            a list of games, by default None
+        games : Iterable[SMatch], optional
+            an iterable of games, by default None
         event : Event, optional
             the observer uses Event.games() to extract the observations, by defualt None
-        events: list[Event], optional
-            a list of Event, by default None
+        events: Iterable[Event], optional
+            an iterable of Event, by default None
 
         Datamodel
         ---------
@@ -36,8 +47,9 @@ class GameByGame(ObsTemplate):
         ratings_groups : list[list[any]]
         """
         super().__init__()
-        self.convertor = uo.to_list_of_games
-        self.extractor = lambda duels: [uo.duel_data(duel) for duel in duels]
+        self.chunk_size = chunk_size if chunk_size is not None else cfg.OBSERVER_CHUNK_SIZE
+        self.convertor = uo.iter_games
+        self.extractor = lambda duels: (uo.duel_data(duel) for duel in duels)
         self.query = uo.get_ratings_groups_of_teams_from_datamodel
         self.output_formater = uo.new_ratings_groups_to_ratings_dict
         self.push = uo.push_new_ratings
@@ -57,16 +69,19 @@ class BatchGame(ObsTemplate):
         In this workflows, ratings are stored after all matches have been processed. Every computation is performed using the prior ratings
         (i.e the one stored in the datamodel before the method call)
 
+        Games are read lazily, 'games' and 'events' can be generators. Only the opponents and scores of each player are kept in memory,
+        not the games themselves.
+
         Observations
         ------------
         game : SMatch, optional
             a game justifying a ranking update, by default None
-        games : list[SMatch], optional
-            a list of games, by default None
+        games : Iterable[SMatch], optional
+            an iterable of games, by default None
         event : Event, optional
             the observer uses Event.games() to extract the observations, by defualt None
-        events: list[Event], optional
-            a list of Event, by default None
+        events: Iterable[Event], optional
+            an iterable of Event, by default None
 
         Datamodel
         ---------
@@ -80,7 +95,7 @@ class BatchGame(ObsTemplate):
         ratings_groups : list[list[any]]
         """
         super().__init__()
-        self.convertor = uo.to_list_of_games
+        self.convertor = uo.iter_games
         self.extractor = uo.players_records
         self.query = uo.get_ratings_groups_of_teams_from_datamodel
         self.output_formater = uo.new_ratings_groups_to_ratings_dict
@@ -2,10 +2,13 @@ from rstt.stypes import Inference, Observer, RatingSystem
 from ..datamodel import KeyModel
 import rstt.utils.observer as uo
 
-from typing import Any
+from typing import Any, Optional
 
 
 class ObsTemplate(Observer):
+    # class attribute, some observers do not call super().__init__()
+    chunk_size: Optional[int] = None
+
     def __init__(self):
         self.prior: RatingSystem = None
         self.posteriori: RatingSystem = None
@@ -33,18 +36,22 @@ class ObsTemplate(Observer):
 
         # data transformation
         observations = self.convertor(*args, **kwargs)
-        data = self.extractor(observations)
-        # process each 'rate-trigger'
-        for data_point in data:
-            # get corresponding priors
-            self.query(self.prior, data_point)
 
-            # perofrm rating evaluation
-            self.output_formater(
-                data_point, uo.call_function_with_args(infer.rate, **data_point))
+        # the inferer signature is resolved once for all data points
+        rate = uo.bind_function_args(infer.rate)
+
+        # observations are extracted by chunks, only one is in memory at a time
+        for chunk in uo.chunked(observations, self.chunk_size):
+            # process each 'rate-trigger'
+            for data_point in self.extractor(chunk):
+                # get corresponding priors
+                self.query(self.prior, data_point)
+
+                # perofrm rating evaluation
+                self.output_formater(data_point, rate(data_point))
 
-            # store posteriori
-            self.push(data_point, self.posteriori)
+                # store posteriori
+                self.push(data_point, self.posteriori)
 
         # terminate the process
         self._handling_end(datamodel)
@@ -61,8 +68,10 @@ class ObsTemplate(Observer):
         self._set_posteriori(datamodel)
 
     def _handling_end(self, datamodel: RatingSystem):
-        for player, post_rating in self.posteriori.items():
-            datamodel.set(key=player, rating=post_rating)
+        # when ratings are stored in place (posteriori is the datamodel) there is nothing to push
+        if self.posteriori is not datamodel:
+            for player, post_rating in self.posteriori.items():
+                datamodel.set(key=player, rating=post_rating)
         self.prior = None
         self.posteriori = None
 
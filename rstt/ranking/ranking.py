@@ -18,8 +18,9 @@ Glossary
     
 """
 
-from typeguard import typechecked
-from typing import Any, Union, List, Dict, Callable, Optional
+from rstt.utils.typecheck import typechecked
+from typing import Any, Union, List, Dict, Callable, Optional, Iterator
+from contextlib import contextmanager
 
 from rstt.ranking import Standing
 from rstt.stypes import Inference, RatingSystem, Observer, SPlayer
@@ -129,7 +130,8 @@ class Ranking():
                  datamodel: RatingSystem,
                  backend: Inference,
                  handler: Observer,
-                 players: Optional[List[SPlayer]] = None):
+                 players: Optional[List[SPlayer]] = None,
+                 standing: Optional[Standing] = None):
         """Ranking for players
 
         The rstt package implements its own definition of a ranking.
@@ -158,13 +160,18 @@ class Ranking():
             A workflow handling the ranking update procedure
         players : Optional[List[SPlayer]], optional
             Players to register in the ranking, by default None
+        standing : Optional[Standing], optional
+            An empty Standing instance to use as the ranking standing, by default None and a :class:`rstt.ranking.standing.Standing` is created,
+            sharing the :class:`rstt.player.PlayerRegistry` of the datamodel if any.
+            For example pass an :class:`rstt.ranking.standing.ArrayStanding` to access ranks and points as arrays.
         """
 
         # name/identifier - usefull for plot
         self.name = name
 
         # fundamental notions of the Ranking Class
-        self.standing = Standing()
+        # the standing and the datamodel identify players with the same ids
+        self.standing = standing if standing is not None else Standing(registry=getattr(datamodel, 'registry', None))
         self.backend = backend
         self.datamodel = datamodel
         self.handler = handler
@@ -410,6 +417,31 @@ class Ranking():
         self.datamodel.set(key, rating)
         self.__equivalence = False
 
+    @set_disamb
+    @set_equi
+    def set_ratings(self, ratings: Dict[SPlayer, Any]):
+        """A method to assign ratings to many Players at once
+
+        Bulk version of :func:`rstt.ranking.ranking.Ranking.set_rating`. The standing is synchronised once, after all assignements.
+
+        Parameters
+        ----------
+        ratings : Dict[SPlayer, Any]
+            New rating objects associated to their keys
+
+        Raises
+        ------
+        TypeError
+            When ratings is not a dict.
+        """
+        # not @typechecked, typeguard would check every key of the bulk assignement
+        if not isinstance(ratings, dict):
+            msg = f"set_ratings expects a dict, received {type(ratings)}"
+            raise TypeError(msg)
+        for key, rating in ratings.items():
+            self.datamodel.set(key, rating)
+        self.__equivalence = False
+
     # ??? remove()
     # ??? pop()
 
@@ -437,11 +469,49 @@ class Ranking():
         """
         self.forward(*args, **kwargs)
 
-        # NOTE: How do we know if the ranking state changed ?
-        # HACK: always assume it did
+        # NOTE: the datamodel tracks which ratings changed, see __RankDisambiguity
         self.__disambiguity = False
         self.__equivalence = False
 
+    @contextmanager
+    def batch(self) -> Iterator['Ranking']:
+        """Defer the ranking maintenance
+
+        Context manager suspending the equivalence and disambiguity properties, as well as the standing sorting,
+        for the duration of the block. On exit, the ranking is synchronised once with the datamodel.
+        It is meant for sequences of many :func:`rstt.ranking.ranking.Ranking.update`, :func:`rstt.ranking.ranking.Ranking.set_rating`
+        or :func:`rstt.ranking.ranking.Ranking.add` calls, like replaying a season game by game.
+
+        .. code-block:: python
+
+            with elo.batch():
+                for game in games:
+                    elo.update(game=game)
+
+        .. warning::
+            Inside the block, the standing is not updated: ranks, points and players membership reflect the state before the block.
+            Ratings are always accessible with ranking.datamodel.get().
+
+        Yields
+        ------
+        Ranking
+            The ranking itself.
+        """
+        should_maintain = (self.__maintain_equivalence, self.__maintain_disambiguity)
+        should_sort = self.standing._maintain
+        self.__maintain_equivalence, self.__maintain_disambiguity = False, False
+        self.standing.set_sorting(False)
+        try:
+            yield self
+        finally:
+            # restaure Ranking status and perform one consolidated maintenance
+            self.__maintain_equivalence, self.__maintain_disambiguity = should_maintain
+            self.standing.set_sorting(should_sort)
+            if self.__maintain_equivalence:
+                self.__ContainerEquivalence()
+            if self.__maintain_disambiguity:
+                self.__RankDisambiguity()
+
     def forward(self, *args, **kwargs):
         """Internal 'update' function
 
@@ -511,19 +581,39 @@ class Ranking():
     @get_disamb
     @get_equi
     def fit(self, players: List[SPlayer]) -> Standing:
-        seeding = Standing(default=self.standing._Standing__default,  # ??? lower instead of default
-                           lower=self.standing._Standing__min,
-                           upper=self.standing._Standing__max,
-                           protocol=self.standing._Standing__protocol)  # Optimize
-        points = [self.point(
-            player) if player in self else None for player in players]
-        seeding.add(players, points)
-        return seeding
+        # standing values match ratings ordinal (disambiguity)
+        # ??? lower instead of default for unranked players
+        return self.standing.fit(players)
 
     # --- internal mechanism --- #
 
     def __ContainerEquivalence(self):
         ''' property checker'''
+        if not hasattr(self.datamodel, 'pop_new'):
+            # RatingSystem without addition tracking
+            self.__FullContainerEquivalence()
+            return
+
+        # only keys added to the RatingSystem since the last check can be missing in the standing
+        new_players = [player for player in self.datamodel.pop_new()
+                       if player not in self.standing]
+
+        if new_players:
+            # NOBUG: player is in the RatingSystem. 'get()' is safe to perform.
+            new_points = self.__ordinals(new_players)
+            # NOBUG: no ambiguity is introduce this way
+            self.standing.add(keys=new_players, values=new_points)
+
+        # len(keys()) builds the list of players of a KeyModel
+        size = len(self.datamodel) if hasattr(self.datamodel, '__len__') else len(self.datamodel.keys())
+        if len(self.standing) == size:
+            self.__equivalence = True
+        else:
+            # keys were removed from one container only, or added without notification
+            self.__FullContainerEquivalence()
+
+    def __FullContainerEquivalence(self):
+        ''' property checker, comparing all keys'''
 
         # get keys
         standing_keys = set(self.standing.keys())
@@ -534,11 +624,8 @@ class Ranking():
         elif standing_keys <= RatingSystem_keys:  # a <= b means a.issubset(b)
             # a - b means a.difference(b)
             not_ranked_players = list(RatingSystem_keys - standing_keys)
-            new_points = []
-            for player in not_ranked_players:
-                # NOBUG: player is in the RatingSystem. 'get()' is safe to perform.
-                new_points.append(self.datamodel.ordinal(
-                    self.datamodel.get(player)))
+            # NOBUG: player is in the RatingSystem. 'get()' is safe to perform.
+            new_points = self.__ordinals(not_ranked_players)
             # NOBUG: no ambiguity is introduce this way
             self.standing.add(keys=not_ranked_players, values=new_points)
             self.__equivalence = True
@@ -549,12 +636,23 @@ class Ranking():
 
     def __RankDisambiguity(self):
         ''' property checker'''
-        for player in self.standing:
-            # TODO: performance check (a) assign only if needed (b) assign always
-            # ??? (a / b) as user options ?
-            rating = self.datamodel.get(player)
-            point = self.datamodel.ordinal(rating)
-            if self.standing.value(player) != point:
-                self.standing[player] = point
+        if hasattr(self.datamodel, 'pop_dirty'):
+            # only ratings set (or exposed for in place modifications) since the last synchronisation can differ from their standing value
+            players = [player for player in self.datamodel.pop_dirty()
+                       if player in self.standing]
+        else:
+            # RatingSystem without change tracking
+            players = self.standing.keys()
+
+        # update_values() only reassigns changed points and reorders the standing once
+        if players:
+            self.standing.update_values(players, self.__ordinals(players))
 
         self.__disambiguity = True
+
+    def __ordinals(self, players: List[SPlayer]) -> List[float]:
+        ''' ordinal values of players ratings'''
+        if hasattr(self.datamodel, 'ordinal_all'):
+            # vectorized RatingSystem, like the ArrayKeyModel, or reading without change tracking, like the KeyModel
+            return self.datamodel.ordinal_all(players).tolist()
+        return [self.datamodel.ordinal(self.datamodel.get(player)) for player in players]
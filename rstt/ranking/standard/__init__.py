@@ -5,6 +5,7 @@ from .consensus import BTRanking, WinRate
 from .basicOS import BasicOS
 from .basicElo import BasicElo
 from .basicGlicko import BasicGlicko, BasicGlicko2
+from .glickoPeriod import PeriodAccumulator
 from .successRanking import SuccessRanking
 
 
@@ -15,5 +16,6 @@ __all__ = [
     "BasicElo",
     "BasicGlicko",
     "BasicGlicko2",
+    "PeriodAccumulator",
     "SuccessRanking"
 ]
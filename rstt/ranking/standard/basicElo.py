@@ -1,9 +1,14 @@
 from rstt.ranking import Ranking
-from rstt.ranking.datamodel import KeyModel
+from rstt.ranking.standing import Standing
+from rstt.ranking.datamodel import KeyModel, ArrayKeyModel
 from rstt.ranking.inferer import Elo
 from rstt.ranking.observer import GameByGame
 from rstt.stypes import SPlayer
+from rstt.player import PlayerRegistry
+from rstt.game import GameLog
+import rstt.utils.observer as uo
 
+import numpy as np
 
 
 class BasicElo(Ranking):
@@ -11,13 +16,16 @@ class BasicElo(Ranking):
                  k: float = 20.0,
                  lc: float = 400.0,
                  base: float = 10.0,
-                 players: list[SPlayer] | None = None):
+                 players: list[SPlayer] | None = None,
+                 array_backed: bool = False,
+                 registry: PlayerRegistry | None = None,
+                 standing: Standing | None = None):
         """Simple Elo System
 
 
         Attributes
         ----------
-        datamodel: :class:`rstt.ranking.datamodel.KeyModel` (float as rating type)
+        datamodel: :class:`rstt.ranking.datamodel.KeyModel` or :class:`rstt.ranking.datamodel.ArrayKeyModel` (float as rating type)
         backend: :class:`rstt.ranking.inferer.elo.Elo`
         handler: :class:`rstt.ranking.observer.GameByGame`
 
@@ -34,9 +42,60 @@ class BasicElo(Ranking):
             Backend parameter, constant dividing the ratings difference in the expected score formula , by default 400.0
         players : Optional[List[SPlayer]], optional
             Players to register in the ranking, by default None
+        array_backed : bool, optional
+            Store ratings in an :class:`rstt.ranking.datamodel.ArrayKeyModel` instead of a :class:`rstt.ranking.datamodel.KeyModel`, by default False.
+            Suited for large populations, see the class documentation.
+        registry : Optional[PlayerRegistry], optional
+            Registry of the datamodel and the standing, by default None.
+            When array_backed, updates with a :class:`rstt.game.GameLog` sharing this registry do not hash players.
+        standing : Optional[Standing], optional
+            An empty Standing instance to use as the ranking standing, by default None, see :class:`rstt.ranking.ranking.Ranking`.
         """
+        datamodel = ArrayKeyModel(default=float(default), registry=registry) if array_backed else KeyModel(default=default, registry=registry)
         super().__init__(name=name,
-                         datamodel=KeyModel(default=default),
+                         datamodel=datamodel,
                          backend=Elo(k=k, lc=lc, base=base),
                          handler=GameByGame(),
-                         players=players)
+                         players=players,
+                         standing=standing)
+
+    def vectorized(self) -> bool:
+        """Indicate if updates are computed with arrays
+
+        This is the case when the datamodel is an :class:`rstt.ranking.datamodel.ArrayKeyModel` (see the 'array_backed' parameter)
+        and the handler a :class:`rstt.ranking.observer.GameByGame`.
+        Games are then replayed in waves of player-disjoint games (see :func:`rstt.utils.observer.conflict_free_waves`)
+        with :func:`rstt.ranking.inferer.Elo.rate_duels`. Results are identical to the game by game procedure.
+
+        Returns
+        -------
+        bool
+            True if updates are vectorized.
+        """
+        return isinstance(self.datamodel, ArrayKeyModel) and type(self.handler) is GameByGame
+
+    def forward(self, *args, **kwargs):
+        if self.vectorized():
+            self.__replay(*args, **kwargs)
+        else:
+            super().forward(*args, **kwargs)
+
+    def __replay(self, *args, **kwargs):
+        # chunks are replayed one after the other, results do not depend on the chunk size
+        for log in uo.to_game_logs(self.handler.chunk_size, *args, **kwargs):
+            self.__replay_log(log)
+
+    def __replay_log(self, games: GameLog):
+        player1_idx, player2_idx = uo.game_log_slots(games, self.datamodel)
+        scores1, scores2 = games.scores1, games.scores2
+
+        # read the array after indices() which may add players
+        ratings = self.datamodel.array().copy()
+        for wave in uo.conflict_free_waves(player1_idx, player2_idx):
+            p1, p2 = player1_idx[wave], player2_idx[wave]
+            ratings[p1], ratings[p2] = self.backend.rate_duels(ratings[p1], ratings[p2],
+                                                               scores1[wave], scores2[wave])
+
+        # push in game order, like the GameByGame observer
+        slots = np.ravel(np.column_stack((player1_idx, player2_idx)))
+        self.datamodel.set_all(slots, value=ratings[slots])
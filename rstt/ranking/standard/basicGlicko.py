@@ -1,14 +1,18 @@
-from rstt import Duel
+from rstt import Duel, GameLog
 from rstt.stypes import SPlayer, RatingSystem
+from rstt.player import PlayerRegistry
 from rstt.ranking.rating import GlickoRating, Glicko2Rating
-from rstt.ranking.ranking import Ranking, get_disamb
-from rstt.ranking.datamodel import GaussianModel
+from rstt.ranking.ranking import Ranking, get_disamb, set_disamb, set_equi
+from rstt.ranking.standing import Standing
+from rstt.ranking.datamodel import GaussianModel, ArrayKeyModel, ArrayGaussianModel
 from rstt.ranking.inferer import Glicko, Glicko2
 from rstt.ranking.observer import BatchGame
+from rstt.ranking.standard.glickoPeriod import PeriodAccumulator
 import rstt.utils.observer as uo
 
 from typing import Any
 
+import numpy as np
 import math
 
 
@@ -24,7 +28,9 @@ class BasicGlicko(Ranking):
                  minRD: float = 30.0, maxRD: float = 350.0,
                  c: float = 63.2, q: float = math.log(10, math.e)/400,
                  lc: int = 400,
-                 players: list[SPlayer] | None = None):
+                 players: list[SPlayer] | None = None,
+                 array_backed: bool = False, registry: PlayerRegistry | None = None,
+                 standing: Standing | None = None):
         """Simple Glicko system
 
         Implement A glicko rating system as originaly `proposed <https://www.glicko.net/glicko/glicko.pdf>`_.
@@ -36,7 +42,7 @@ class BasicGlicko(Ranking):
 
         Attributes
         ----------
-        datamodel: :class:`rstt.ranking.datamodel.GaussianModel` (:class:`rstt.ranking.rating.GlickoRating as rating)
+        datamodel: :class:`rstt.ranking.datamodel.GaussianModel` or :class:`rstt.ranking.datamodel.ArrayGaussianModel` (:class:`rstt.ranking.rating.GlickoRating as rating)
         backend: :class:`rstt.ranking.inferer.Glicko` as backend
         handler :class:`rstt.ranking.observer.BatchGame` as handler
 
@@ -55,32 +61,112 @@ class BasicGlicko(Ranking):
            Datamodel parameter, the default sigma of the rating, by default 350.0
         players : Optional[List[SPlayer]], optional
             Players to register in the ranking, by default None
+        array_backed : bool, optional
+            Store ratings in an :class:`rstt.ranking.datamodel.ArrayGaussianModel` instead of a :class:`rstt.ranking.datamodel.GaussianModel`, by default False.
+            Suited for large populations, see the class documentation.
+        registry : Optional[PlayerRegistry], optional
+            Registry of the datamodel and the standing, by default None.
+            When array_backed, updates with a :class:`rstt.game.GameLog` sharing this registry do not hash players.
+        standing : Optional[Standing], optional
+            An empty Standing instance to use as the ranking standing, by default None, see :class:`rstt.ranking.ranking.Ranking`.
         """
+        model = ArrayGaussianModel if array_backed else GaussianModel
         super().__init__(name=name,
-                         datamodel=GaussianModel(
-                             default=GlickoRating(mu, sigma)),
+                         datamodel=model(default=GlickoRating(mu, sigma), registry=registry),
                          backend=Glicko(minRD, maxRD, c, q, lc),
                          handler=BatchGame(),
-                         players=players)
+                         players=players,
+                         standing=standing)
         self.handler.query = get_ratings_for_glicko
         self.handler.output_formater = lambda d, x: uo.new_ratings_groups_to_ratings_dict(d, [
             [x]])
 
+    def vectorized(self) -> bool:
+        """Indicate if updates are computed with arrays
+
+        This is the case when the datamodel is an :class:`rstt.ranking.datamodel.ArrayKeyModel` (see the 'array_backed' parameter)
+        and the handler a :class:`rstt.ranking.observer.BatchGame`. Ratings are then updated with :func:`rstt.ranking.inferer.Glicko.rate_period`.
+
+        Returns
+        -------
+        bool
+            True if rating periods are vectorized.
+        """
+        return isinstance(self.datamodel, ArrayKeyModel) and type(self.handler) is BatchGame
+
     @get_disamb
     def __step1(self):
         # TODO: check which player iterator to use
+        if self.vectorized():
+            slots = self.datamodel.indices(list(self))
+            sigma = self.backend.prePeriod_RD_all(self.datamodel.array('sigma')[slots])
+            self.datamodel.set_all(slots, sigma=sigma)
+            return
+
         for player in self:
             rating = self.datamodel.get(player)
             rating.sigma = self.backend.prePeriod_RD(rating)
+            self.datamodel.set(player, rating)
 
     def forward(self, *args, **kwargs):
         self.__step1()
-        self.handler.handle_observations(
-            infer=self.backend, datamodel=self.datamodel, *args, **kwargs)
+        if self.vectorized():
+            self.__rate_period(*args, **kwargs)
+        else:
+            self.handler.handle_observations(
+                infer=self.backend, datamodel=self.datamodel, *args, **kwargs)
+
+    @set_disamb
+    @set_equi
+    def open_period(self) -> PeriodAccumulator:
+        """Start a live rating period
+
+        Apply the step 1 of the rating period to the players, like :func:`rstt.ranking.ranking.Ranking.update` does,
+        and return an accumulator to feed the games of the period as they are played.
+
+        .. code-block:: python
+
+            period = glicko.open_period()
+            for game in live_results():
+                period.add(game=game)
+            glicko.close_period(period)
+
+        Returns
+        -------
+        PeriodAccumulator
+            An empty period.
+        """
+        self.__step1()
+        return PeriodAccumulator(self.backend, self.datamodel)
+
+    @set_disamb
+    @set_equi
+    def close_period(self, period: PeriodAccumulator) -> None:
+        """Terminate a live rating period
+
+        Rate the players of the period, see :func:`rstt.ranking.standard.BasicGlicko.open_period`.
+
+        Parameters
+        ----------
+        period : PeriodAccumulator
+            A period returned by open_period.
+        """
+        period.close()
+
+    def __rate_period(self, *args, **kwargs):
+        logs = uo.to_game_logs(None, *args, **kwargs)
+        player_idx, opp_idx, scores = uo.game_logs_records(logs, self.datamodel)
+        # read arrays after indices() which may add players
+        mu, sigma = self.datamodel.array('mu'), self.datamodel.array('sigma')
+        new_mu, new_sigma = self.backend.rate_period(player_idx, opp_idx, scores, mu, sigma)
+        actives = np.unique(player_idx)
+        self.datamodel.set_all(actives, mu=new_mu[actives], sigma=new_sigma[actives])
 
 
 class BasicGlicko2(Ranking):
-    def __init__(self, name: str, mu: float = 1500, sigma: float = 350, volatility: float = 0.06, tau: float = 0.3, epsilon: float = 0.000000005, players: list[SPlayer] | None = None):
+    def __init__(self, name: str, mu: float = 1500, sigma: float = 350, volatility: float = 0.06, tau: float = 0.3, epsilon: float = 0.000000005, players: list[SPlayer] | None = None,
+                 array_backed: bool = False, registry: PlayerRegistry | None = None,
+                 standing: Standing | None = None):
         """Glicko-2 system
 
         Implement the `glicko-2 <https://www.glicko.net/glicko/glicko2.pdf>`_ rating system as descried by Prof. Mark E. Glickman.
@@ -89,7 +175,7 @@ class BasicGlicko2(Ranking):
         Attributes
         ----------
         rating: :class:`rstt.ranking.rating.Glicko2Rating`
-        datamodel: :class:`rstt.ranking.datamodel.GaussianModel`
+        datamodel: :class:`rstt.ranking.datamodel.GaussianModel` or :class:`rstt.ranking.datamodel.ArrayGaussianModel`
         backend: :class:`rstt.ranking.inferer.Glicko2` as Inference
         handler :class:`rstt.ranking.observer.BatchGame` as Observer
 
@@ -114,12 +200,22 @@ class BasicGlicko2(Ranking):
             Glicko2 Inference parameter. Convergence tolerance of the Illinois algorithm used in step 5 of rating update, by default 0.000000005
         players : Optional[List[SPlayer]], optional
             Players to register in the ranking, by default None
+        array_backed : bool, optional
+            Store ratings in an :class:`rstt.ranking.datamodel.ArrayGaussianModel` instead of a :class:`rstt.ranking.datamodel.GaussianModel`, by default False.
+            Suited for large populations, see the class documentation.
+        registry : Optional[PlayerRegistry], optional
+            Registry of the datamodel and the standing, by default None.
+            When array_backed, updates with a :class:`rstt.game.GameLog` sharing this registry do not hash players.
+        standing : Optional[Standing], optional
+            An empty Standing instance to use as the ranking standing, by default None, see :class:`rstt.ranking.ranking.Ranking`.
 
         """
-        super().__init__(name, datamodel=GaussianModel(default=Glicko2Rating(mu=mu, sigma=sigma, volatility=volatility)),
+        model = ArrayGaussianModel if array_backed else GaussianModel
+        super().__init__(name, datamodel=model(default=Glicko2Rating(mu=mu, sigma=sigma, volatility=volatility), registry=registry),
                          backend=Glicko2(tau=tau, mu=mu, epsilon=epsilon),
                          handler=BatchGame(),
-                         players=players)
+                         players=players,
+                         standing=standing)
         self.handler.query = get_ratings_for_glicko
         self.handler.output_formater = lambda d, x: uo.new_ratings_groups_to_ratings_dict(d, [
             [x]])
@@ -167,9 +263,22 @@ class BasicGlicko2(Ranking):
             increase RD for player who does not compete during the rating period
         '''
 
+        self.__adjust_unactive_RD(uo.active_players(games))
+
+    def __adjust_unactive_RD(self, actives: list[SPlayer]) -> None:
+        if self.vectorized():
+            # indices() registers active players missing in the datamodel, like the handler query would
+            actives = self.datamodel.indices(actives)
+            unactives = np.ones(len(self.datamodel), dtype=bool)
+            unactives[actives] = False
+            slots = np.flatnonzero(unactives)
+            sigma = self.backend.unactive_RD_all(self.datamodel.array('sigma')[slots],
+                                                 self.datamodel.array('volatility')[slots])
+            self.datamodel.set_all(slots, sigma=sigma)
+            return
+
         # find unactive players
         players = set(self.datamodel.keys())
-        actives = uo.active_players(games)
         unactives = players - set(actives)
 
         # update rating deviation (RD / sigma)
@@ -183,8 +292,8 @@ class BasicGlicko2(Ranking):
                                       scaled_rating.volatility)
 
             # scale back
-            _, post_rd = self._step8(mu_prime=scaled_rating.mu,
-                                     phi_prime=phi)
+            _, post_rd = self.backend._step8(mu_prime=scaled_rating.mu,
+                                             phi_prime=phi)
             rating.sigma = post_rd
 
             # push
@@ -196,7 +305,22 @@ class BasicGlicko2(Ranking):
         1. adjust rating of unactive player
         2. adapt system parameter tau
         3. update rating
+
+        With the default :class:`rstt.ranking.observer.BatchGame` handler, the games are read once, chunk by chunk,
+        into a :class:`rstt.ranking.standard.PeriodAccumulator`. Generators are not stored, the memory usage follows the number of active players.
         """
+        if type(self.handler) is BatchGame:
+            # the games are read once, by chunks: the period keeps per player sums and the active players
+            period = PeriodAccumulator(self.backend, self.datamodel, fields=['mu', 'sigma', 'volatility'])
+            period.add(*args, **uo.filter_valid_args(['game', 'games', 'event', 'events'], **kwargs))
+            self.__adjust_unactive_RD(period.players())
+            self.backend._step1(self._estimate_tau(*args, **kwargs))
+            period.close()
+            return
+
+        # other handlers read the games on their own, after the unactive players adjustment
+        if not isinstance(kwargs.get('games'), (type(None), list, GameLog)):
+            kwargs['games'] = uo.to_list_of_games(games=kwargs['games'])
 
         # unactive players
         self._adjust_unactive_player_RD(*args, **kwargs)
@@ -208,3 +332,48 @@ class BasicGlicko2(Ranking):
         self.handler.handle_observations(infer=self.backend,
                                          datamodel=self.datamodel,
                                          *args, **kwargs)
+
+    @set_disamb
+    @set_equi
+    def open_period(self) -> PeriodAccumulator:
+        """Start a live rating period
+
+        Return an accumulator to feed the games of the period as they are played, see :func:`rstt.ranking.standard.BasicGlicko.open_period`.
+
+        Returns
+        -------
+        PeriodAccumulator
+            An empty period.
+        """
+        return PeriodAccumulator(self.backend, self.datamodel, fields=['mu', 'sigma', 'volatility'])
+
+    @set_disamb
+    @set_equi
+    def close_period(self, period: PeriodAccumulator, tau: float = None) -> None:
+        """Terminate a live rating period
+
+        Perform the steps of :func:`rstt.ranking.standard.BasicGlicko2.forward` with the games of the period:
+        adjust the rating deviation of unactive players, adapt tau and rate the players of the period.
+
+        Parameters
+        ----------
+        period : PeriodAccumulator
+            A period returned by open_period.
+        tau : float, optional
+            Passed to :func:`rstt.ranking.standard.BasicGlicko2._estimate_tau`, by default None
+        """
+        self.__adjust_unactive_RD(period.players())
+        self.backend._step1(self._estimate_tau(tau))
+        period.close()
+
+    def vectorized(self) -> bool:
+        """Indicate if updates are computed with arrays
+
+        See :func:`rstt.ranking.standard.BasicGlicko.vectorized`. The rating period then reads and writes the ratings as arrays.
+
+        Returns
+        -------
+        bool
+            True if rating periods are vectorized.
+        """
+        return isinstance(self.datamodel, ArrayKeyModel) and type(self.handler) is BatchGame
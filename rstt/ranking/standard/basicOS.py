@@ -1,5 +1,6 @@
 from rstt.stypes import SPlayer, SMatch, RatingSystem
 from rstt.ranking import Ranking
+from rstt.ranking.standing import Standing
 from rstt.ranking.observer import ObsTemplate
 import rstt.utils.observer as rou
 # from rstt.ranking.observer.gameObserver import TEAMS, to_list_of_games, push_new_ratings
@@ -43,7 +44,8 @@ class OSGBG(ObsTemplate):
 
 
 class BasicOS(Ranking):
-    def __init__(self, name: str, model=None, players: list[SPlayer] | None = None):
+    def __init__(self, name: str, model=None, players: list[SPlayer] | None = None,
+                 standing: Standing | None = None):
         """Simple OpenSkill Integretion
 
         Ranking to integrate an `openskill <https://openskill.me/en/stable/manual.html>`_ model into the rstt package.
@@ -64,6 +66,8 @@ class BasicOS(Ranking):
             One of openskills.models implementation, by default None
         players : Optional[List[SPlayer]], optional
             Players to register in the ranking, by default None
+        standing : Optional[Standing], optional
+            An empty Standing instance to use as the ranking standing, by default None, see :class:`rstt.ranking.ranking.Ranking`.
 
 
         Example:
@@ -83,7 +87,8 @@ class BasicOS(Ranking):
                              factory=lambda x: model.rating(name=x.name())),
                          backend=model,
                          handler=OSGBG(),
-                         players=players)
+                         players=players,
+                         standing=standing)
 
     def quality(self, game: SMatch) -> float:
         # TODO: provide a default implementation at the Ranking class level
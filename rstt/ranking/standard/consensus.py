@@ -1,4 +1,5 @@
 from rstt.ranking import Ranking
+from rstt.ranking.standing import Standing
 from rstt.ranking.datamodel import KeyModel
 from rstt.ranking.inferer import PlayerLevel, PlayerWinPRC
 from rstt.ranking.observer import PlayerChecker
@@ -9,7 +10,8 @@ import numpy as np
 
 
 class BTRanking(Ranking):
-    def __init__(self, name: str = '', players: list[SPlayer] | None = None):
+    def __init__(self, name: str = '', players: list[SPlayer] | None = None,
+                 standing: Standing | None = None):
         """Consensus Ranking For the Bradley-Terry Model
 
         Ranking based on the player's level() method.
@@ -30,6 +32,8 @@ class BTRanking(Ranking):
             A name to identify the ranking, by default ''
         players : _type_, optional
             SPlayer to add to the ranking, by default None
+        standing : Optional[Standing], optional
+            An empty Standing instance to use as the ranking standing, by default None, see :class:`rstt.ranking.ranking.Ranking`.
 
         .. warning::
             BTRanking validity is limited to Bradley-Terry like models and is not suited for simulation using 'None-transitive' level.
@@ -38,14 +42,16 @@ class BTRanking(Ranking):
                          datamodel=KeyModel(factory=lambda x: x.level()),
                          backend=PlayerLevel(),
                          handler=PlayerChecker(),
-                         players=players)
+                         players=players,
+                         standing=standing)
 
 
 class WinRate(Ranking):
     def __init__(self, name: str,
                  default: float = -1.0,
                  scope: int = np.iinfo(np.int32).max,
-                 players: list[SPlayer] | None = None):
+                 players: list[SPlayer] | None = None,
+                 standing: Standing | None = None):
         """Ranking based on Win rate
 
 
@@ -67,12 +73,15 @@ class WinRate(Ranking):
             A default rating value for when player have no game in their history, by default -1.0
         players : Optional[List[SPlayer]], optional
             Players to register in the ranking, by default None
+        standing : Optional[Standing], optional
+            An empty Standing instance to use as the ranking standing, by default None, see :class:`rstt.ranking.ranking.Ranking`.
         """
         super().__init__(name,
                          datamodel=KeyModel(default=default),
                          backend=PlayerWinPRC(default=default, scope=scope),
                          handler=PlayerChecker(),
-                         players=players)
+                         players=players,
+                         standing=standing)
         # incase player already played games
         self.update()
 
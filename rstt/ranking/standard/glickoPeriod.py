@@ -0,0 +1,175 @@
+"""Live Glicko rating periods
+
+Accumulate the games of a rating period as they are played, see :func:`rstt.ranking.standard.BasicGlicko.open_period`.
+"""
+
+from rstt.stypes import SPlayer, RatingSystem
+from rstt.game import GameLog
+from rstt.ranking.datamodel import ArrayKeyModel
+import rstt.utils.observer as uo
+import rstt.config as cfg
+
+from typing import Any, Optional
+
+import numpy as np
+import copy
+
+
+class PeriodAccumulator:
+    def __init__(self, infer: Any, datamodel: RatingSystem, fields: Optional[list[str]] = None):
+        """Live rating period
+
+        Within a Glicko rating period, every game contributes to the new rating of a player through terms depending only on prior ratings and scores.
+        The accumulator sums these terms per player as games arrive, see :func:`rstt.ranking.inferer.Glicko.period_terms`,
+        and closes the period from the sums with :func:`rstt.ranking.inferer.Glicko.close_period`.
+        Games are never stored, the memory usage is proportional to the number of active players.
+
+        Results are the ones of a :class:`rstt.ranking.observer.BatchGame` update with all the games of the period, up to floating point rounding.
+
+        .. warning::
+            The prior rating of a player is read from the datamodel the first time the player appears in the period.
+            Ratings should not be modified by other means until the period is closed.
+
+        Parameters
+        ----------
+        infer : Glicko or Glicko2
+            An inferer providing period_terms() and close_period() methods.
+        datamodel : RatingSystem
+            The ratings to read priors from and to write posteriors to.
+        fields : Optional[list[str]], optional
+            The rating attributes passed to infer.close_period, by default None which means ['mu', 'sigma'].
+        """
+        self.infer = infer
+        self.datamodel = datamodel
+        self.__fields = fields if fields else ['mu', 'sigma']
+
+        # players of the period
+        self.__index: dict[SPlayer, int] = {}
+        self.__players: list[SPlayer] = []
+        self.__size = 0
+
+        # per player priors and running sums
+        self.__priors: dict[str, np.ndarray] = {name: np.zeros(0) for name in self.__fields}
+        self.__weights = np.zeros(0)
+        self.__improvements = np.zeros(0)
+        self.__games = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __contains__(self, player: SPlayer) -> bool:
+        return player in self.__index
+
+    def players(self) -> list[SPlayer]:
+        """Active players of the period
+
+        Returns
+        -------
+        list[SPlayer]
+            Players with at least one game, in order of first appearance.
+        """
+        return list(self.__players)
+
+    def games(self) -> int:
+        """Number of games of the period
+
+        Returns
+        -------
+        int
+            Number of games added since the period started.
+        """
+        return self.__games
+
+    def add(self, *args, **kwargs) -> None:
+        """Add games to the period
+
+        Accepts the same observations as :class:`rstt.ranking.observer.BatchGame`: game, games, event, events.
+        Games can be a :class:`rstt.game.GameLog` or come from a generator, they are processed by chunks of :attr:`rstt.config.OBSERVER_CHUNK_SIZE`.
+        """
+        for log in uo.to_game_logs(cfg.OBSERVER_CHUNK_SIZE, *args, **kwargs):
+            self.__add_log(log)
+
+    def close(self) -> list[SPlayer]:
+        """Close the period
+
+        Compute the posterior ratings of the active players, store them in the datamodel and reset the accumulator.
+
+        Returns
+        -------
+        list[SPlayer]
+            The rated players.
+        """
+        players, n = self.__players, self.__size
+        if n:
+            priors = {name: values[:n] for name, values in self.__priors.items()}
+            posteriors = self.infer.close_period(self.__weights[:n], self.__improvements[:n], **priors)
+            self.__push(players, dict(zip(self.__fields, posteriors)))
+        self.__reset()
+        return players
+
+    # --- internal mechanism --- #
+    def __add_log(self, games: GameLog):
+        player_idx, opp_idx, scores = games.records(self.__indices)
+        mu, sigma = self.__priors['mu'], self.__priors['sigma']
+        weights, improvements = self.infer.period_terms(mu[player_idx], mu[opp_idx], sigma[opp_idx], scores)
+        self.__weights += np.bincount(player_idx, weights=weights, minlength=len(self.__weights))
+        self.__improvements += np.bincount(player_idx, weights=improvements, minlength=len(self.__weights))
+        self.__games += len(games)
+
+    def __indices(self, players: list[SPlayer]) -> np.ndarray:
+        news = {}
+        for player in players:
+            if player not in self.__index and player not in news:
+                news[player] = self.__size + len(news)
+        if news:
+            self.__register(list(news))
+        return np.fromiter((self.__index[player] for player in players), dtype=np.int64, count=len(players))
+
+    def __register(self, players: list[SPlayer]):
+        start, stop = self.__size, self.__size + len(players)
+        if stop > len(self.__weights):
+            # doubling growth, like ArrayKeyModel
+            capacity = max(stop, 2*len(self.__weights), 16)
+            self.__weights = self.__grow(self.__weights, capacity)
+            self.__improvements = self.__grow(self.__improvements, capacity)
+            self.__priors = {name: self.__grow(values, capacity) for name, values in self.__priors.items()}
+        for name, values in self.__read(players).items():
+            self.__priors[name][start:stop] = values
+        for i, player in enumerate(players):
+            self.__index[player] = start + i
+        self.__players += players
+        self.__size = stop
+
+    def __read(self, players: list[SPlayer]) -> dict[str, np.ndarray]:
+        if isinstance(self.datamodel, ArrayKeyModel):
+            slots = self.datamodel.indices(players)
+            return {name: self.datamodel.array(name)[slots] for name in self.__fields}
+        ratings = [self.datamodel.get(player) for player in players]
+        return {name: np.array([getattr(rating, name) for rating in ratings], dtype=np.float64)
+                for name in self.__fields}
+
+    def __push(self, players: list[SPlayer], posteriors: dict[str, np.ndarray]):
+        if isinstance(self.datamodel, ArrayKeyModel):
+            self.datamodel.set_all(self.datamodel.indices(players), **posteriors)
+            return
+        for i, player in enumerate(players):
+            # create new rating object to avoid 'side effect'
+            rating = copy.copy(self.datamodel.get(player))
+            for name, values in posteriors.items():
+                setattr(rating, name, float(values[i]))
+            self.datamodel.set(player, rating)
+
+    def __reset(self):
+        self.__index = {}
+        self.__players = []
+        self.__size = 0
+        self.__priors = {name: np.zeros(0) for name in self.__fields}
+        self.__weights = np.zeros(0)
+        self.__improvements = np.zeros(0)
+        self.__games = 0
+
+    @staticmethod
+    def __grow(values: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.zeros(capacity)
+        grown[:len(values)] = values
+        return grown
@@ -1,5 +1,6 @@
 from rstt.stypes import SPlayer, Event
 from rstt.ranking import Ranking
+from rstt.ranking.standing import Standing
 from rstt.ranking.datamodel import KeyModel
 from rstt.ranking.inferer import EventScoring
 from rstt.ranking.observer import PlayerChecker
@@ -20,7 +21,8 @@ class SuccessRanking(Ranking):
                  window_range: int = 1, tops: int = 1,
                  buffer: int | None = None, nb: int | None = None,
                  players: list[SPlayer] | None = None,
-                 default: dict[int, float] | None = None):
+                 default: dict[int, float] | None = None,
+                 standing: Standing | None = None):
         """Merit Based Ranking
 
         Usefull to implement Ranking system like the one in  `tennis <https://en.wikipedia.org/wiki/ATP_rankings>`_ for example.
@@ -43,6 +45,8 @@ class SuccessRanking(Ranking):
             Backend Parameter. Mapping placement in event to points for the rating, by default None
         players : Optional[List[SPlayer]], optional
             Players to register in the ranking, by default None
+        standing : Optional[Standing], optional
+            An empty Standing instance to use as the ranking standing, by default None, see :class:`rstt.ranking.ranking.Ranking`.
         """
 
         if buffer:
@@ -60,7 +64,8 @@ class SuccessRanking(Ranking):
                                               tops=tops,
                                               default=default),
                          handler=PlayerChecker(),
-                         players=players)
+                         players=players,
+                         standing=standing)
 
     def forward(self, event: Event | None = None, events: list[Event] | None = None):
         new_events = []
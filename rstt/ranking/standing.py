@@ -3,13 +3,17 @@
 Standing is a sorted container class implementing a triplet relationship between player, rank and points.
 """
 
-from typing import Union, List, Tuple, Callable, Any, Optional
+from typing import Union, List, Tuple, Dict, Callable, Any, Optional, Iterator
+from collections import defaultdict
+from itertools import chain
 
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 import numpy as np
 
 from rstt.stypes import SPlayer
-import rstt.utils.utils as uu
+from rstt.player import PlayerRegistry
+from rstt.utils.sortedlist import SortedList
+import rstt.config as cfg
 
 
 GET_SORT = 'get'
@@ -37,8 +41,8 @@ def get_sort(func: Callable[..., Any]) -> Callable[..., Any]:
 
     def wrapper_get(self: Any, *args, **kwars) -> Any:
         """:meta private:"""
-        if self._Standing__protocol in [GET_SORT, ALWAYS]:
-            self._Standing__sort()
+        if self._protocol in [GET_SORT, ALWAYS]:
+            self._sort()
         return func(self, *args, **kwars)
     return wrapper_get
 
@@ -68,15 +72,15 @@ def set_sort(func: Callable[..., Any]) -> Callable[..., Any]:
     def wrapper_set(self: Any, *args, **kwargs) -> Any:
         """:meta private:"""
         set_action = func(self, *args, **kwargs)
-        if self._Standing__protocol in [SET_SORT, ALWAYS]:
-            self._Standing__sort()
+        if self._protocol in [SET_SORT, ALWAYS]:
+            self._sort()
         return set_action
     return wrapper_set
 
 # TODO: ADD
 # def not_sorted_error(func: Callable[..., Any]) -> Callable[..., Any]:
 #    def wrapper_check(self: Any, *args, **kwargs) -> Any:
-#        if not self._Standing__sorted:
+#        if not self._sorted:
 #            msg = f"Can not call {func.__name__} on unsorted Standing"
 #            raise RuntimeError(msg)
 #        return func(self, *args, **kwargs)
@@ -88,7 +92,8 @@ class Standing:
                  lower: float = np.iinfo(np.int32).min,
                  upper: float = np.iinfo(np.int32).max,
                  step: float = 1.0,
-                 protocol: str = SET_SORT):
+                 protocol: str = SET_SORT,
+                 registry: Optional[PlayerRegistry] = None):
         """A Standing object emulate a value-based ordered dictionary.
 
         The Standing also act as a <list> and a <dict> and the following relationship exist:
@@ -104,8 +109,11 @@ class Standing:
         --------
 
         .. note::
-            Ordering is computationaly demanding, which means that repeated operations on a large Standing could result
-            in performances issues. It is possible to turn off the ordering features.
+            Internally, keys are identified by their id in a :class:`rstt.player.PlayerRegistry`,
+            indexed by a dictionary and ordered in a :class:`rstt.utils.sortedlist.SortedList`.
+            Membership and value lookups are O(1), rank lookups are O(log n),
+            and changing the value of a key only repositions that key instead of sorting the whole Standing.
+            It is possible to turn off the ordering features.
             This break the whole point of the class. Do it only if needed and if you know what your are doing
 
             In its current form Key are intended to be of Type <Player> and Value of type <float>.
@@ -123,35 +131,119 @@ class Standing:
         step : float, optional
             An interval used for insertion operation , by default 1.0
             NOTE: not completely supported, could disapear in futur version.
+        registry : Optional[PlayerRegistry], optional
+            The registry identifying the keys, by default None and the Standing creates its own.
+            Standings created by fit() and rerank() share the registry of the original one.
         """
 
         # data
-        self.ranks: list[SPlayer, float] = []  # [(key: Player, value: float)]
-        self.__default = default  # default value
+        self._registry = registry if registry is not None else PlayerRegistry()
+        self._default = default  # default value
+        self._storage()
 
         # sorting controls
-        self.__sorted = True
-        self.__maintain = True
-        self.__protocol = protocol  # used by decorators
+        self._sorted = True
+        self._maintain = True
+        self._protocol = protocol  # used by decorators
 
         # NOTE:  Untested feature. Delete ?
-        self.__min = lower
-        self.__max = upper
-        self.__step = step
+        self._min = lower
+        self._max = upper
+        self._step = step
+
+    def _storage(self):
+        '''Initialize the containers of the keys - overridden by subclasses with their own storage'''
+        self.__entries: dict[int, tuple] = {}  # {id: (value, name, tick, id)}
+        self.__order = SortedList()  # placed entries, in ascending order
+        self.__pending: dict[int, None] = {}  # ids waiting to be placed in __order
+        self.__tick = 0  # insertion counter, last tiebreaker of the ordering
 
     # --- sorting algorithm --- #
-    def __sort(self):
+    def _sort(self):
         ''' Sorting method
 
-        Sort self.ranks [(key, value)] based on values
+        Place pending keys in the ordered structure based on their values
         NOTE: (conceptual)
-            - __sort is never called 'as-it', _Standing__sort is called by get/set_sort decorator
+            - _sort is called by the get/set_sort decorators, subclasses with their own storage override it
+            - only keys added or changed since the last call are repositioned
+            - a few pending keys are inserted one by one (bisect), many pending keys trigger a single sort.
+            The switch is controlled by rstt.config.STANDING_INCREMENTAL_RATIO
+        '''
+        if self._maintain and not self._sorted:
+            pending = [self.__entries[key] for key in self.__pending]
+            if len(pending) <= cfg.STANDING_INCREMENTAL_RATIO * len(self.__order):
+                # incremental path: O(k log n)
+                for entry in pending:
+                    self.__order.add(entry)
+            else:
+                # full path: O(n log n), but one sort of mostly ordered data
+                self.__order.update(pending)
+            self.__pending.clear()
+            self._sorted = True
+
+    def __entry(self, identifier: int, key: SPlayer, value: float) -> tuple:
+        '''
+        Build the sorting entry of a key.
+
+        NOTE: the general idea is: (1) sort on value, (2) on key name, (3) on insertion order.
+        The ascending order of entries is the reversed order of the Standing.
+        The id is never compared, ticks are unique.
         '''
-        if self.__maintain and not self.__sorted:
-            # NOTE: the general idea is: (1) sort on value, (2) on key
-            # TODO: use functool lib to define the 'cmp' policy
-            self.ranks.sort(key=lambda x: (x[1], x[0].name()), reverse=True)
-            self.__sorted = True
+        self.__tick -= 1
+        return (value, key.name(), self.__tick, identifier)
+
+    def __ordered(self) -> Iterator[tuple]:
+        '''iterate entries in Standing order - pending keys come last'''
+        return chain(reversed(self.__order), (self.__entries[identifier] for identifier in self.__pending))
+
+    def __keys(self, entries: Iterator[tuple]) -> List[SPlayer]:
+        '''keys of entries'''
+        return self._registry.players(entry[3] for entry in entries)
+
+    def _bulk(self, keys: Union[Dict[SPlayer, float], List[SPlayer]],
+              values: Optional[Union[List[float], np.ndarray]]) -> Tuple[List[SPlayer], Union[List[float], np.ndarray]]:
+        '''containers check of update_values() parameters, the elements are not inspected'''
+        if isinstance(keys, dict):
+            return list(keys.keys()), list(keys.values())
+        if not isinstance(keys, list):
+            msg = f"update_values expects a dict or a list of keys, received {type(keys)}"
+            raise TypeError(msg)
+        if values is not None and not isinstance(values, (list, np.ndarray)):
+            msg = f"update_values expects a list or an array of values, received {type(values)}"
+            raise TypeError(msg)
+        if values is None or len(keys) != len(values):
+            msg = f"update_values expects as many values as keys, received {len(keys)} keys and {None if values is None else len(values)} values"
+            raise ValueError(msg)
+        return keys, values
+
+    def __id(self, key: SPlayer) -> int:
+        '''id of a key in the Standing'''
+        try:
+            identifier = self._registry.id(key)
+        except KeyError:
+            identifier = None
+        if identifier not in self.__entries:
+            msg = f"{key} is not in the Standing"
+            raise ValueError(msg)
+        return identifier
+
+    def __entry_at(self, index: int) -> tuple:
+        '''entry at a given index (rank)'''
+        size, placed = len(self.__entries), len(self.__order)
+        if index < 0:
+            index += size
+        if 0 <= index < placed:
+            return self.__order[placed-1-index]
+        elif placed <= index < size:
+            return self.__entries[list(self.__pending)[index-placed]]
+        msg = "Standing index out of range"
+        raise IndexError(msg)
+
+    @property
+    def ranks(self) -> List[Tuple[SPlayer, float]]:
+        """Standing content as a list of (key, value) in order"""
+        entries = list(self.__ordered())
+        return list(zip(self.__keys(entries), [entry[0] for entry in entries]))
 
     # --- general purpose methords --- #
     @get_sort
@@ -166,7 +258,7 @@ class Standing:
             A name has standing header, by default "Standing"
     """
         print(f"----------- {standing_name} -----------")
-        for i, (k, v) in enumerate(self.ranks):
+        for i, (k, v) in enumerate(self.items()):
             print("{:>5} {:>20} {:>10}".format('%d.' % i, '%s' % k, '%d' % v))
 
     @typechecked
@@ -185,7 +277,8 @@ class Standing:
         -------
         Standing
         """
-        seeding = Standing(self.__default, self.__min, self.__max, self.__step)
+        seeding = type(self)(self._default, self._min, self._max, self._step,
+                             protocol=self._protocol, registry=self._registry)
         points = [self.value(key) if key in self else None for key in keys]
         seeding.add(keys, points)
         return seeding
@@ -214,15 +307,16 @@ class Standing:
         """
 
         # create new Standing instance
-        new_standing = Standing(
-            self.__default, self.__min, self.__max, self.__step)
+        new_standing = type(self)(
+            self._default, self._min, self._max, self._step, registry=self._registry)
 
         # compute key-value pairs
+        current_keys, current_values = self.keys(), self.values()
         if inverse:
-            keys_values = [(self[p_i], self.value(i))
+            keys_values = [(current_keys[p_i], current_values[i])
                            for i, p_i in enumerate(permutation)]
         else:
-            keys_values = [(self[i], self.value(p_i))
+            keys_values = [(current_keys[i], current_values[p_i])
                            for i, p_i in enumerate(permutation)]
 
         keys, values = [item[0] for item in keys_values], [item[1]
@@ -268,7 +362,7 @@ class Standing:
         bool
             If True, the Standing contains at least a two keys with equal value.
         """
-        points = set([entry[1] for entry in self.ranks])
+        points = set(entry[0] for entry in self.__entries.values())
         return len(points) != len(self)
 
     # TODO: define clearly output format
@@ -282,21 +376,13 @@ class Standing:
             return a dictionary where keys are a tuple indicating the ranks range and values are the tied keys (player)
         """
 
-        ties: dict[tuple[int, int], list[SPlayer]] = {}  # returned value
-        tied_players: dict[float, list[SPlayer]] = {}  # intermediate steps
-        values = uu.multiples([entry[1] for entry in self.ranks])
-
-        for val in values:
-            tied_players[val] = []
-            for player in self:
-                if self.value(player) == val:
-                    tied_players[val].append(player)
-        for val in values:
-            top = (min(self[tied_players[val]]), max(self[tied_players[val]]))
-            ties[top] = tied_players[val]
-            del ties[val]
+        # group (index, key) by value in a single pass
+        tied_players: dict[float, list[tuple[int, int]]] = defaultdict(list)
+        for index, entry in enumerate(self.__ordered()):
+            tied_players[entry[0]].append((index, entry[3]))
 
-        return ties
+        return {(group[0][0], group[-1][0]): self._registry.players(identifier for _, identifier in group)
+                for group in tied_players.values() if len(group) > 1}
 
     # --- setter --- #
     @set_sort
@@ -335,10 +421,16 @@ class Standing:
                 - protocol='always' anytime performances are not an issue.
                 - protocol='never' the standing stops ordering itself automaticaly.
                 - sorting=False when the order of the keys in the Standing do not matter.
-        """
 
-        self.__maintain = sorting
-        self.__protocol = protocol
+        .. note::
+            Whatever the protocol, a sorting call only repositions the keys added or changed since the previous one.
+            When few keys are concerned, they are inserted one by one, otherwise the Standing is sorted at once.
+            See :class:`rstt.config.STANDING_INCREMENTAL_RATIO`.
+        """
+        if sorting is not None:
+            self._maintain = sorting
+        if protocol is not None:
+            self._protocol = protocol
 
     @typechecked
     @set_sort
@@ -385,8 +477,8 @@ class Standing:
         #    - test performances & requirements without it
 
         # turn off sorting for optimisation
-        should_sort = self.__maintain
-        self.__maintain = False
+        should_sort = self._maintain
+        self._maintain = False
 
         if values is None:
             values = []
@@ -396,10 +488,51 @@ class Standing:
             try:
                 self.__add(key, values[i])
             except IndexError:
-                self.__add(key, self.__default)
+                self.__add(key, self._default)
+
+        # restaure Standing status
+        self._maintain = should_sort
+
+    @set_sort
+    def update_values(self, keys: Union[Dict[SPlayer, float], List[SPlayer]],
+                      values: Optional[Union[List[float], np.ndarray]] = None):
+        """Set the values of many keys at once
+
+        Dict-like update of the Standing. All the changes are applied first and the Standing is reordered only once.
+        Keys not yet present are added, keys whose value does not change are left untouched.
+
+        Parameters
+        ----------
+        keys : Union[Dict[SPlayer, float], List[SPlayer]]
+            Either a mapping {key: value}, or a list of keys matching the parameter values.
+        values : Optional[Union[List[float], np.ndarray]], optional
+            The new values of the keys, by default None. Only used (and required) when keys is a list.
+
+        Raises
+        ------
+        TypeError
+            When keys is neither a dict nor a list, or values neither a list nor an array.
+        ValueError
+            When keys is a list and values is missing or of a different length.
+        """
+        # not @typechecked, typeguard would check every key and value of the bulk update
+        keys, values = self._bulk(keys, values)
+        items = zip(keys, values)
+
+        # turn off sorting, reorder once (set_sort) after all changes
+        should_sort = self._maintain
+        self._maintain = False
+
+        for key, value in items:
+            entry = self.__entries.get(self._registry.register(key))
+            if entry is None:
+                self.__add(key, value)
+            elif entry[0] != min(max(value, self._min), self._max):
+                self.__delitem_key(key)
+                self.__add(key, value)
 
         # restaure Standing status
-        self.__maintain = should_sort
+        self._maintain = should_sort
 
     # --- Containers standard methods --- #
     @get_sort
@@ -413,7 +546,7 @@ class Standing:
         List[Player]
             A list with all the item registered in the Stadning
         """
-        return [item[0] for item in self.ranks]
+        return self.__keys(self.__ordered())
 
     @get_sort
     def values(self) -> List[float]:
@@ -426,7 +559,7 @@ class Standing:
         List[float]
             A list with all the values in the Standing
         """
-        return [item[1] for item in self.items()]
+        return [entry[0] for entry in self.__ordered()]
 
     @get_sort
     @typechecked
@@ -448,9 +581,9 @@ class Standing:
             The associated value to the key.
         """
         if isinstance(key, int):
-            return self.ranks[key][1]
+            return self.__entry_at(key)[0]
         elif isinstance(key, SPlayer):
-            return self.ranks[self.index(key)][1]
+            return self.__entries[self.__id(key)][0]
 
     @get_sort
     @typechecked
@@ -483,7 +616,10 @@ class Standing:
         int
             The rank of the key in the Standing. 
         """
-        return self.keys().index(key)
+        identifier = self.__id(key)
+        if identifier in self.__pending:
+            return len(self.__order) + list(self.__pending).index(identifier)
+        return len(self.__order) - 1 - self.__order.position(self.__entries[identifier])
 
     @get_sort
     @typechecked
@@ -530,16 +666,18 @@ class Standing:
         REQ:
             - no typechecking because it is called internaly,
             i.e. when type should already been approved
-            - this is the only funtion that should use the self.__default
-            i.e. self.__add(key, self.__default) should never be called
+            - this is the only funtion that should use the self._default
+            i.e. self.__add(key, self._default) should never be called
         '''
-        if key not in self:
+        identifier = self._registry.register(key)
+        if identifier not in self.__entries:
             if value is not None:
-                value = min(max(value, self.__min), self.__max)
+                value = min(max(value, self._min), self._max)
             else:
-                value = self.__default
-            self.ranks.append((key, value))
-            self.__sorted = False
+                value = self._default
+            self.__entries[identifier] = self.__entry(identifier, key, value)
+            self.__pending[identifier] = None
+            self._sorted = False
         else:
             msg = f"Attempt to add a key ({key}) already present in the Standing {self})"
             raise KeyError(msg)
@@ -555,17 +693,16 @@ class Standing:
             - no typechecking because it is called internaly
 
         FIXME:
-            - raise error/warnings based on __sorted, __maintain
+            - raise error/warnings based on _sorted, _maintain
         '''
         if isinstance(index, int):
-            del self.ranks[index]
+            self.__delitem_key(self._registry.player(self.__entry_at(index)[3]))
         elif isinstance(index, slice):
             keys = self[index]
             self.__delitem_key(keys)
         else:
-            # QUEST: is it better to use the same approach as for slice, than sorting the indexes ?
-            for i in sorted(index, reverse=True):
-                del self.ranks[i]
+            keys = self.__keys(self.__entry_at(i) for i in index)
+            self.__delitem_key(keys)
 
     def __delitem_key(self, key: Union[SPlayer, List[SPlayer]]):
         '''
@@ -578,12 +715,14 @@ class Standing:
             - no typechecking because it is called internaly
             - Is not sorting dependant.
         '''
-        if isinstance(key, SPlayer):
-            self.__delitem_index(self.index(key))
-        else:
-            for k in key:
-                # QUEST: use self.__delitem_key(k) ?
-                self.__delitem_index(self.index(k))
+        keys = [key] if isinstance(key, SPlayer) else key
+        for k in keys:
+            identifier = self.__id(k)
+            entry = self.__entries.pop(identifier)
+            if identifier in self.__pending:
+                del self.__pending[identifier]
+            else:
+                self.__order.remove(entry)
 
     def __setitem_key_value(self, key: SPlayer, value: float):
         '''
@@ -621,11 +760,12 @@ class Standing:
             - does not have the expected behaviour for an-already contained key. check __add()
         '''
         if index == 0:
-            point = min(self.ranks[0][1] + self.__step, self.__max)
+            point = min(self.__entry_at(0)[0] + self._step, self._max)
         elif index == len(self):
-            point = max(self.ranks[-1][1] - self.__step, self.__min)
+            point = max(self.__entry_at(-1)[0] - self._step, self._min)
         else:
-            point = (self.ranks[index-1][1] + self.ranks[index][1]) / 2
+            point = (self.__entry_at(index-1)[0] +
+                     self.__entry_at(index)[0]) / 2
         self.__add(key, point)
 
     def __change_key_value(self, key: SPlayer, value: float):
@@ -640,6 +780,8 @@ class Standing:
 
         This method aims to match the syntax 'my_Standing_insnatce[already_existing_key] = different_value'
         with its intuitive behaviour - the one of dictionaries. 
+
+        Only the changed key is removed from the ordered structure, it is repositioned by the next _sort call.
         '''
         if key in self:
             self.__delitem_key(key)
@@ -680,16 +822,15 @@ class Standing:
 
         '''
         if isinstance(key, slice):
-            return [player[0] for player in self.ranks][key]
+            return self.__keys(list(self.__ordered())[key])
         elif isinstance(key, SPlayer):
             return self.index(key)
         elif isinstance(key, int):
-            return self.ranks[key][0]
+            return self._registry.player(self.__entry_at(key)[3])
         elif isinstance(key, list) and isinstance(key[0], SPlayer):
             return [self.index(player) for player in key]
         elif isinstance(key, list) and isinstance(key[0], int):
-            players = [player[0] for player in self.ranks]
-            return [players[index] for index in key]
+            return self.__keys(self.__entry_at(index) for index in key)
 
     @set_sort
     @typechecked
@@ -754,10 +895,10 @@ class Standing:
 
     @typechecked
     def __contains__(self, key: SPlayer):
-        return key in [item[0] for item in self.ranks]
+        return key in self._registry and self._registry.id(key) in self.__entries
 
     def __len__(self):
-        return len(self.ranks)
+        return len(self.__entries)
 
     @get_sort
     def __iter__(self):
@@ -775,10 +916,364 @@ class Standing:
         This implementation seems to maintain the proper iteration behaviour
         and it make isinstance(Standing, Iterable/Collection) True - WHICH IS GOOD
         '''
-        return [entry[0] for entry in self.ranks].__iter__()
+        return self.__keys(self.__ordered()).__iter__()
 
     def __str__(self):
         return str(self.ranks)
 
     def __repr__(self):
         return f"Standing({self.ranks})"
+
+
+class ArrayStanding(Standing):
+    def __init__(self, default: float = 0.0,
+                 lower: float = np.iinfo(np.int32).min,
+                 upper: float = np.iinfo(np.int32).max,
+                 step: float = 1.0,
+                 protocol: str = SET_SORT,
+                 registry: Optional[PlayerRegistry] = None):
+        """A Standing backed by NumPy arrays.
+
+        Structure-of-arrays alternative to :class:`rstt.ranking.standing.Standing` with the same interface and ordering policy.
+        Keys are stored in an object array, values in a contiguous float64 array and each key owns an integer slot, indexed by its registry id.
+        The ordering is computed with np.lexsort and bulk queries (keys, values, ties, percentiles) are vectorized.
+
+        It is suited for large rankings whose standing is mostly read as a whole, for example by analytics code
+        pulling ranks and points with :func:`rstt.ranking.standing.ArrayStanding.keys_array`
+        and :func:`rstt.ranking.standing.ArrayStanding.values_array`.
+
+        .. note::
+            Any modification triggers a complete (vectorized) sort, unlike the Standing class that repositions only changed keys.
+            When sorting is turned off, keys are returned in storage order.
+
+        Parameters
+        ----------
+        default : float, optional
+            A key added to the standing without an associated value will be assign this default value, by default 0.0
+        min : float, optional
+            The minimal boundary for values, by default np.iinfo(np.int32).min
+        max : float, optional
+            The maximal boundary for values, by default np.iinfo(np.int32).max
+        step : float, optional
+            An interval used for insertion operation , by default 1.0
+        registry : Optional[PlayerRegistry], optional
+            The registry identifying the keys, by default None and the Standing creates its own.
+        """
+        super().__init__(default, lower, upper, step, protocol, registry)
+
+    def _storage(self):
+        '''Storage initialization
+
+        Overrides Standing._storage, the base containers are not created.
+        '''
+        # data - slot indexed arrays, only [:self._size] is meaningfull
+        self._slots: dict[int, int] = {}  # {id: slot}
+        self._ids = np.empty(0, dtype=np.int64)  # registry id of each slot
+        self._keys = np.empty(0, dtype=object)
+        self._values = np.empty(0, dtype=np.float64)
+        self._names = np.empty(0, dtype=object)
+        self._ticks = np.empty(0, dtype=np.int64)  # insertion counter, last tiebreaker
+        self._size = 0
+        self._tick = 0
+
+        # ordering - slots in standing order, and index of each slot
+        self._order = np.empty(0, dtype=np.int64)
+        self._rank = np.empty(0, dtype=np.int64)
+
+    # --- sorting algorithm --- #
+    def _sort(self):
+        '''Sorting method
+
+        Overrides Standing._sort, called by the get/set_sort decorators.
+        Sort on (1) value, (2) name, (3) insertion order. Names are only compared in presence of ties.
+        '''
+        if self._maintain and not self._sorted:
+            values = self._values[:self._size]
+            ticks = self._ticks[:self._size]
+            order = np.lexsort((ticks, -values))
+            ordered = values[order]
+            if np.any(ordered[1:] == ordered[:-1]):
+                # names are only needed to break ties
+                _, names = np.unique(self._names[:self._size], return_inverse=True)
+                order = np.lexsort((ticks, -names, -values))
+            self._order = order
+            self._rank = np.empty(self._size, dtype=np.int64)
+            self._rank[order] = np.arange(self._size)
+            self._sorted = True
+
+    def __current_order(self) -> np.ndarray:
+        '''slots in Standing order - storage order if the standing is not sorted'''
+        if self._sorted:
+            return self._order
+        return np.arange(self._size)
+
+    def __slot(self, key: SPlayer) -> int:
+        try:
+            return self._slots[self._registry.id(key)]
+        except KeyError:
+            msg = f"{key} is not in the Standing"
+            raise ValueError(msg)
+
+    # --- general purpose methods --- #
+    @get_sort
+    def ties(self) -> bool:
+        return np.unique(self._values[:self._size]).size != self._size
+
+    @get_sort
+    def tied_items(self) -> dict[tuple[int, int], list[SPlayer]]:
+        order = self.__current_order()
+        values = self._values[order]
+        perm = np.argsort(values, kind='stable')
+        grouped = values[perm]
+        starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+        ends = np.r_[starts[1:], self._size]
+        ties = {}
+        for start, end in zip(starts[ends - starts > 1], ends[ends - starts > 1]):
+            indices = np.sort(perm[start:end])
+            ties[(int(indices[0]), int(indices[-1]))] = self._keys[order[indices]].tolist()
+        return ties
+
+    @get_sort
+    @typechecked
+    def percentile(self, key: Union[SPlayer, List[SPlayer]]) -> Union[float, np.ndarray]:
+        """Getter funtion for the percentile of players
+
+        Parameters
+        ----------
+        key : Union[SPlayer, List[SPlayer]]
+            A player, or a list of players
+
+        Returns
+        -------
+        Union[float, np.ndarray]
+            The percentile of the player(s) as their relative position in the ranking
+        """
+        if isinstance(key, list):
+            return (np.array(self[key]) + 1) / self._size * 100.00
+        return (self[key]+1)/self._size * 100.00
+
+    # --- setter --- #
+    @set_sort
+    @typechecked
+    def insert(self, index: int, key: SPlayer):
+        if index == 0:
+            point = min(self.value(0) + self._step, self._max)
+        elif index == len(self):
+            point = max(self.value(-1) - self._step, self._min)
+        else:
+            point = (self.value(index-1) + self.value(index)) / 2
+        self.__add([key], np.array([point]))
+
+    @set_sort
+    def add(self, keys: List[SPlayer], values: Optional[Union[List[float], np.ndarray]] = None):
+        values = [] if values is None else values
+        points = np.full(len(keys), self._default, dtype=np.float64)
+        given = [value if value is not None else self._default
+                 for value in values[:len(keys)]]
+        points[:len(given)] = given
+        self.__add(keys, points)
+
+    @set_sort
+    def update_values(self, keys: Union[Dict[SPlayer, float], List[SPlayer]],
+                      values: Optional[Union[List[float], np.ndarray]] = None):
+        keys, values = self._bulk(keys, values)
+        values = np.asarray(values, dtype=np.float64)
+
+        # ticks follow the parameters order, like iterative set operations would
+        ticks = self._tick + np.arange(len(keys))
+        self._tick += len(keys)
+
+        # present keys
+        identifiers = self._registry.ids(keys).tolist()
+        known = np.array([identifier in self._slots for identifier in identifiers], dtype=bool)
+        slots = np.array([self._slots[identifier] for identifier, k in zip(identifiers, known) if k], dtype=np.int64)
+        points = np.clip(values[known], self._min, self._max)
+        changed = self._values[slots] != points
+        if changed.any():
+            self._values[slots[changed]] = points[changed]
+            self._ticks[slots[changed]] = ticks[known][changed]
+            self._sorted = False
+
+        # new keys
+        if not known.all():
+            self.__add([key for key, k in zip(keys, known) if not k],
+                       values[~known], ticks[~known])
+
+    # --- Containers standard methods --- #
+    @get_sort
+    def keys(self) -> List[SPlayer]:
+        return self._keys[self.__current_order()].tolist()
+
+    @get_sort
+    def values(self) -> List[float]:
+        return self._values[self.__current_order()].tolist()
+
+    @get_sort
+    def keys_array(self) -> np.ndarray:
+        """Get method for keys
+
+        Returns
+        -------
+        np.ndarray
+            An object array with all the keys in the Standing order.
+        """
+        return self._keys[self.__current_order()]
+
+    @get_sort
+    def values_array(self) -> np.ndarray:
+        """Get method for values
+
+        Returns
+        -------
+        np.ndarray
+            A float64 array with all the values in the Standing order.
+        """
+        return self._values[self.__current_order()]
+
+    @get_sort
+    @typechecked
+    def value(self, key: Union[SPlayer, int]) -> float:
+        if isinstance(key, int):
+            return float(self._values[self.__current_order()[key]])
+        return float(self._values[self.__slot(key)])
+
+    @get_sort
+    @typechecked
+    def items(self) -> List[Tuple[SPlayer, float]]:
+        return list(zip(self.keys(), self.values()))
+
+    @get_sort
+    @typechecked
+    def index(self, key: SPlayer) -> int:
+        slot = self.__slot(key)
+        return int(self._rank[slot]) if self._sorted else slot
+
+    @property
+    def ranks(self) -> List[Tuple[SPlayer, float]]:
+        order = self.__current_order()
+        return list(zip(self._keys[order].tolist(), self._values[order].tolist()))
+
+    # --- internal mechanism --- #
+    def __add(self, keys: List[SPlayer], values: np.ndarray, ticks: Optional[np.ndarray] = None):
+        identifiers = self._registry.ids(keys).tolist()
+        for key, identifier in zip(keys, identifiers):
+            if identifier in self._slots:
+                msg = f"Attempt to add a key ({key}) already present in the Standing {self})"
+                raise KeyError(msg)
+        if len(set(identifiers)) != len(identifiers):
+            msg = f"Attempt to add the same key multiple time in the Standing {self}"
+            raise KeyError(msg)
+
+        start, end = self._size, self._size + len(keys)
+        self.__reserve(end)
+        self._ids[start:end] = identifiers
+        self._keys[start:end] = keys if isinstance(keys, list) else list(keys)
+        self._values[start:end] = np.clip(values, self._min, self._max)
+        self._names[start:end] = [key.name() for key in keys]
+        if ticks is None:
+            ticks = self._tick + np.arange(len(keys))
+            self._tick += len(keys)
+        self._ticks[start:end] = ticks
+        self._slots.update(zip(identifiers, range(start, end)))
+        self._size = end
+        self._sorted = False
+
+    def __set_value(self, key: SPlayer, value: float):
+        '''dict-like set, a present key is moved last among its ties - as in Standing'''
+        if key not in self:
+            self.__add([key], np.array([value]))
+        else:
+            slot = self.__slot(key)
+            self._values[slot] = min(max(value, self._min), self._max)
+            self._ticks[slot] = self._tick
+            self._tick += 1
+            self._sorted = False
+
+    def __reserve(self, size: int):
+        capacity = self._values.size
+        if size > capacity:
+            capacity = max(size, 2*capacity, 16)
+            for name in ['_ids', '_keys', '_values', '_names', '_ticks']:
+                array = getattr(self, name)
+                grown = np.empty(capacity, dtype=array.dtype)
+                grown[:self._size] = array[:self._size]
+                setattr(self, name, grown)
+
+    def __remove(self, keys: List[SPlayer]):
+        '''remove keys at once: the remaining slots are compacted, in storage order'''
+        slots = np.array([self.__slot(key) for key in keys], dtype=np.int64)
+        keep = np.ones(self._size, dtype=bool)
+        keep[slots] = False
+        if np.count_nonzero(~keep) != len(slots):
+            msg = f"Attempt to remove the same key multiple time from the Standing {self}"
+            raise ValueError(msg)
+
+        # deletion does not alter the ordering of other keys, only slot indices
+        kept = np.flatnonzero(keep)
+        size = kept.size
+        relocation = np.cumsum(keep) - 1
+        for name in ['_ids', '_keys', '_values', '_names', '_ticks']:
+            array = getattr(self, name)
+            array[:size] = array[kept]
+        self._keys[size:self._size] = None
+        self._names[size:self._size] = None
+        self._slots = dict(zip(self._ids[:size].tolist(), range(size)))
+        self._size = size
+
+        if self._sorted:
+            self._order = relocation[self._order[keep[self._order]]]
+            self._rank = np.empty(size, dtype=np.int64)
+            self._rank[self._order] = np.arange(size)
+
+    # --- magic methods --- #
+    @get_sort
+    @typechecked
+    def __getitem__(self, key: Union[int, slice, List[int], SPlayer, List[SPlayer]]
+                    ) -> Union[SPlayer, List[SPlayer], int, List[int]]:
+        if isinstance(key, slice):
+            return self.keys()[key]
+        elif isinstance(key, SPlayer):
+            return self.index(key)
+        elif isinstance(key, int):
+            return self._keys[self.__current_order()[key]]
+        elif isinstance(key, list) and isinstance(key[0], SPlayer):
+            slots = np.array([self.__slot(player) for player in key])
+            return (self._rank[slots] if self._sorted else slots).tolist()
+        elif isinstance(key, list) and isinstance(key[0], int):
+            return self._keys[self.__current_order()[key]].tolist()
+
+    @set_sort
+    @typechecked
+    def __setitem__(self, key: Union[int, SPlayer], value: Union[SPlayer, float]):
+        if isinstance(key, int) and isinstance(value, SPlayer):
+            self.insert(key, value)
+        elif isinstance(key, SPlayer) and isinstance(value, float):
+            self.__set_value(key, value)
+        elif isinstance(key, SPlayer) and isinstance(value, int):
+            self.insert(value, key)
+
+    @typechecked
+    def __delitem__(self, elem: Union[slice, int, List[int], SPlayer, List[SPlayer]]):
+        if isinstance(elem, SPlayer):
+            keys = [elem]
+        elif isinstance(elem, list) and isinstance(elem[0], SPlayer):
+            keys = elem
+        elif isinstance(elem, int):
+            keys = [self[elem]]
+        else:
+            keys = self[elem]
+        self.__remove(keys)
+
+    def __contains__(self, key: SPlayer):
+        registry = self._registry
+        return key in registry and registry.id(key) in self._slots
+
+    def __len__(self):
+        return self._size
+
+    @get_sort
+    def __iter__(self):
+        return self.keys().__iter__()
+
+    def __repr__(self):
+        return f"ArrayStanding({self.ranks})"
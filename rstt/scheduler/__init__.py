@@ -4,7 +4,7 @@ RSTT consider scheduler in competition as a large notion covering both sport tou
 """
 
 from .tournament import Competition
-from .tournament import RoundRobin, SwissRound, RandomRound, SwissBracket, SingleEliminationBracket, DoubleEliminationBracket, Snake
+from .tournament import RoundRobin, SwissRound, RandomRound, SwissBracket, SingleEliminationBracket, DoubleEliminationBracket, Snake, MonteCarlo
 
 __all__ = [
     "Competition",
@@ -14,5 +14,6 @@ __all__ = [
     "SwissBracket",
     "SingleEliminationBracket",
     "DoubleEliminationBracket",
-    "Snake"
+    "Snake",
+    "MonteCarlo"
 ]
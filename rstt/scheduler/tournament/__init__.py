@@ -18,6 +18,7 @@ from .swissbracket import SwissBracket
 
 from .knockout import SingleEliminationBracket, DoubleEliminationBracket
 from .snake import Snake
+from .montecarlo import MonteCarlo
 
 '''
     TODO: BYE-round
@@ -36,5 +37,6 @@ __all__ = [
     "SwissBracket",
     "SingleEliminationBracket",
     "DoubleEliminationBracket",
-    "Snake"
+    "Snake",
+    "MonteCarlo"
 ]
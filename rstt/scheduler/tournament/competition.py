@@ -1,14 +1,16 @@
 from typing import Union, List, Set, Dict, Optional
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 import abc
 
-from rstt import Duel, BetterWin
+from rstt import Duel, BetterWin, GameLog
 from rstt.stypes import SPlayer, Solver, Achievement
 from rstt.ranking.ranking import Ranking
 import rstt.utils.utils as uu
 
 from collections import defaultdict
 
+import numpy as np
+
 
 import warnings
 
@@ -166,6 +168,25 @@ class Competition(metaclass=abc.ABCMeta):
         # ??? raise error/warnings if not finished
         return self.played_matches if by_rounds else uu.flatten(self.played_matches)
 
+    def game_log(self) -> GameLog:
+        """Getter for all matches played during the event in columnar format
+
+        Alternative to :func:`rstt.scheduler.tournament.competition.Competition.games` for rankings and analysis consuming arrays.
+        The timestamp of a game is the index of its round and its event is the competition.
+
+        Returns
+        -------
+        GameLog
+            All matches played during the event, in chronological order.
+        """
+        rounds = self.played_matches
+        log = GameLog.from_games(uu.flatten(rounds))
+        return GameLog(players=log.players, player1=log.player1, player2=log.player2,
+                       scores1=log.scores1, scores2=log.scores2,
+                       timestamps=np.repeat(np.arange(len(rounds)), [len(games) for games in rounds]),
+                       events=np.zeros(len(log), dtype=np.int64),
+                       event_names=[self.name()])
+
     @typechecked
     def top(self, place: Optional[int] = None) -> Union[Dict[int, List[SPlayer]], List[SPlayer]]:
         """Getter for players by their final placement
@@ -206,8 +227,9 @@ class Competition(metaclass=abc.ABCMeta):
             Playrs taking part in the event's matches.
         """
         if not self.__started:
-            playerset = set(self._participants)
-            playerset.update(players)
+            # NOBUG: dict as an ordered set, participants order does not depend on objects hash and random schedules are reproducible
+            playerset = dict.fromkeys(self._participants)
+            playerset.update(dict.fromkeys(players))
             self._participants = list(playerset)
 
     def run(self):
@@ -274,7 +296,14 @@ class Competition(metaclass=abc.ABCMeta):
         -------
         List[Duel]
             the games with a scored.
+
+        .. note::
+            When the solver provides a solve_many() method, all the games are solved with a single call.
+            Solvers overriding solve() without overriding solve_many() are called game by game.
         """
+        if self.__batch_solvable():
+            self.solver.solve_many(list(games))
+            return list(games)
         played = []
         for game in games:
             self.solver.solve(game)
@@ -317,6 +346,14 @@ class Competition(metaclass=abc.ABCMeta):
                 continue
         self.__closed = True
 
+    # --- internal mechanism --- #
+    def __batch_solvable(self) -> bool:
+        # NOBUG: solve_many() must be defined at the same level or below solve() in the solver class hierarchy
+        mro = type(self.solver).__mro__
+        solve = next((cls for cls in mro if 'solve' in vars(cls)), None)
+        solve_many = next((cls for cls in mro if 'solve_many' in vars(cls)), None)
+        return solve_many is not None and (solve is None or issubclass(solve_many, solve))
+
     # --- subclass specificity --- #
     def _initialise(self) -> None:
         '''Function called once, after seedings computation but before any game is played.'''
@@ -4,8 +4,8 @@ Such tournament do have a strict elimination process and losing participants are
 Standing is based on 'how far' the competitors go.
 """
 
-from typing import Callable
-from typeguard import typechecked
+from typing import Callable, Optional
+from rstt.utils.typecheck import typechecked
 
 
 from . import Competition
@@ -15,6 +15,7 @@ from rstt.stypes import Solver, SPlayer
 
 from rstt.utils import utils as uu, matching as um, competition as uc
 
+import numpy as np
 import math
 
 
@@ -53,6 +54,66 @@ class SingleEliminationBracket(Competition):
                  cashprize: dict[int, float] = {}):
         super().__init__(name, seeding, solver, cashprize)
 
+    # --- analysis --- #
+    @classmethod
+    @typechecked
+    def reach_probabilities(cls, seeding: Ranking, solver: Solver, players: Optional[list[SPlayer]] = None) -> np.ndarray:
+        """Exact round reach probabilities
+
+        Compute, without simulation, the probability of every participant to win k games of the bracket, for every k.
+        The computation is a dynamic programming over the rounds of the bracket, vectorized with numpy, in O(n²) for n participants.
+
+        Parameters
+        ----------
+        seeding : Ranking
+            A ranking used for seeding purposes, like for an instance of the class.
+        solver : Solver
+            A solver with a win_probabilities() method, like :class:`rstt.solver.solvers.LogSolver`.
+        players : Optional[list[SPlayer]], optional
+            The participants, by default None which means the players of the seeding.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n, rounds+1) where the entry [i, k] is the probability that the i-th seed wins at least k games.
+            Column 0 is 1 and the last column is the probability to win the competition. Rows follow list(seeding.fit(players)).
+
+        Raises
+        ------
+        ValueError
+            When the number of participants is not a power of two.
+        TypeError
+            When the solver does not provide pairwise win probabilities.
+        """
+        seeds = list(seeding.fit(players if players is not None else seeding.players()))
+        if not uu.power_of_two(len(seeds)):
+            msg = f"{cls} needs a power of two as number of participants (2,4,8,16,...), given {len(seeds)}"
+            raise ValueError(msg)
+        if not hasattr(solver, 'win_probabilities'):
+            msg = f"{type(solver)} does not provide a win_probabilities() method"
+            raise TypeError(msg)
+
+        n = len(seeds)
+        nb_rounds = int(math.log(n, 2))
+        # bracket slots, as in _initialise(), and win probabilities between slots
+        slots = np.array(balanced_tree(nb_rounds), dtype=np.int64) - 1 if nb_rounds else np.zeros(1, dtype=np.int64)
+        wins = solver.win_probabilities([seeds[i] for i in slots.tolist()])
+
+        reach = np.ones((nb_rounds + 1, n))
+        for k in range(1, nb_rounds + 1):
+            # blocks of 2^k slots: the upper half faces the lower half, the upper player is the first player of the Duel
+            half = 2**(k-1)
+            blocks = n // (2 * half)
+            upper_vs_lower = wins.reshape(blocks, 2, half, blocks, 2, half)[np.arange(blocks), 0, :, np.arange(blocks), 1, :]
+            previous = reach[k-1].reshape(blocks, 2, half)
+            upper, lower = previous[:, 0, :], previous[:, 1, :]
+            reach[k].reshape(blocks, 2, half)[:, 0, :] = upper * np.einsum('bij,bj->bi', upper_vs_lower, lower)
+            reach[k].reshape(blocks, 2, half)[:, 1, :] = lower * np.einsum('bij,bi->bj', 1 - upper_vs_lower, upper)
+
+        table = np.empty((n, nb_rounds + 1))
+        table[slots] = reach.T
+        return table
+
     # --- override --- #
     def _initialise(self):
         msg = (f'{type(self)} '
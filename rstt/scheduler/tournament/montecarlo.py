@@ -0,0 +1,173 @@
+"""Monte Carlo estimation of competition outcomes
+
+Run the same competition many times and aggregate the final placements of the participants.
+"""
+
+from typing import Optional, Union, Any
+from rstt.utils.typecheck import typechecked
+
+from rstt import BetterWin
+from rstt.stypes import SPlayer, Solver
+from rstt.ranking.ranking import Ranking
+from rstt.ranking.standard import BasicElo
+from rstt.utils.rng import RNG
+from .competition import Competition
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import warnings
+import math
+import os
+
+
+class MonteCarlo:
+    @typechecked
+    def __init__(self, competition: type[Competition],
+                 seeding: Ranking,
+                 solver: Solver = BetterWin(),
+                 n_runs: int = 1000,
+                 workers: Optional[int] = None,
+                 players: Optional[list[SPlayer]] = None,
+                 seed: Optional[Union[int, np.random.SeedSequence]] = None,
+                 chunk_size: int = 1000,
+                 **kwargs: Any):
+        """Monte Carlo tournament runner
+
+        Simulate n_runs times a competition and count the final placement of each participant.
+        Runs are split in tasks of chunk_size runs, each task draws from its own :class:`rstt.utils.rng.RNG` stream spawned from seed,
+        and tasks are executed across a process pool. Only placement counts are kept, games and competitions are discarded after each run.
+
+        Results only depend on the seed and the chunk_size, not on the number of workers.
+
+        .. note::
+            With workers > 1, the solver, the players and kwargs are pickled to the worker processes.
+            For large studies, set the environment variable RSTT_TYPECHECK=0, see :attr:`rstt.config.TYPECHECK`.
+
+        .. warning::
+            Players do not collect :class:`rstt.stypes.Achievement` of the simulated competitions.
+
+        Parameters
+        ----------
+        competition : type[Competition]
+            The competition class, for example :class:`rstt.scheduler.tournament.knockout.SingleEliminationBracket`.
+        seeding : Ranking
+            A ranking used for seeding purposes. Its order of the participants is computed once and reused by every run.
+        solver : Solver, optional
+            A Solver to generate match outcomes, by default BetterWin()
+        n_runs : int, optional
+            Number of simulated competitions, by default 1000.
+        workers : Optional[int], optional
+            Number of processes, by default None which uses os.cpu_count(). With 1, runs are executed in the current process.
+        players : Optional[list[SPlayer]], optional
+            The participants, by default None which means the players of the seeding.
+        seed : Optional[Union[int, np.random.SeedSequence]], optional
+            The entropy of the simulation, by default None which uses fresh entropy from the OS.
+        chunk_size : int, optional
+            Number of runs per task, by default 1000.
+        **kwargs
+            Other parameters of the competition constructor.
+        """
+        self.competition = competition
+        self.solver = solver
+        self.n_runs = n_runs
+        self.workers = workers if workers else os.cpu_count()
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.kwargs = kwargs
+
+        # participants, in seeding order
+        self.__players = list(seeding.fit(players if players is not None else seeding.players()))
+        self.__counts = np.zeros((len(self.__players), len(self.__players)), dtype=np.int64)
+
+    # --- getter --- #
+    def players(self) -> list[SPlayer]:
+        """Getter for the participants
+
+        Returns
+        -------
+        list[SPlayer]
+            The participants in seeding order, index of the rows of the result arrays.
+        """
+        return list(self.__players)
+
+    def placements(self) -> np.ndarray:
+        """Placement histogram
+
+        Returns
+        -------
+        np.ndarray
+            int array of shape (players, players), the entry [i, k] is the number of runs where players()[i] finished at place k+1.
+        """
+        return self.__counts.copy()
+
+    def distribution(self) -> np.ndarray:
+        """Placement probabilities
+
+        Returns
+        -------
+        np.ndarray
+            The placement histogram divided by the number of runs.
+        """
+        return self.__counts / self.n_runs
+
+    def expected_placement(self) -> np.ndarray:
+        """Expected placement of each player
+
+        Returns
+        -------
+        np.ndarray
+            The average final place of each player, in the order of players().
+        """
+        return self.distribution() @ np.arange(1, len(self.__players) + 1)
+
+    def title_probability(self) -> np.ndarray:
+        """Probability to win the competition
+
+        Returns
+        -------
+        np.ndarray
+            The frequency of first places of each player, in the order of players().
+        """
+        return self.distribution()[:, 0]
+
+    # --- general mechanism --- #
+    def run(self) -> None:
+        """Execute the simulation
+
+        Results of a previous call are replaced.
+        """
+        tasks = math.ceil(self.n_runs / self.chunk_size)
+        sizes = [min(self.chunk_size, self.n_runs - task * self.chunk_size) for task in range(tasks)]
+        streams = RNG(self.seed).spawn(tasks)
+        args = [(self.competition, self.__players, self.solver, size, rng, self.kwargs)
+                for size, rng in zip(sizes, streams)]
+
+        if self.workers == 1 or tasks == 1:
+            counts = [_simulate(*arg) for arg in args]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                counts = list(pool.map(_simulate, *zip(*args)))
+        self.__counts = np.sum(counts, axis=0, dtype=np.int64) if counts else np.zeros_like(self.__counts)
+
+
+def _simulate(competition: type[Competition], players: list[SPlayer], solver: Solver,
+              runs: int, rng: RNG, kwargs: dict[str, Any]) -> np.ndarray:
+    # a seeding with the same order as the original one, rankings are not picklable
+    seeding = BasicElo('seeding', players=players)
+    seeding.set_ratings({player: float(len(players) - i) for i, player in enumerate(players)})
+    index = {player: i for i, player in enumerate(players)}
+
+    counts = np.zeros((len(players), len(players)), dtype=np.int64)
+    with rng, warnings.catch_warnings():
+        # Competition.__init__ warns about the participants attribute deprecation at every run
+        warnings.simplefilter('ignore', DeprecationWarning)
+        for _ in range(runs):
+            event = competition('montecarlo', seeding, solver, **kwargs)
+            event.registration(players)
+            event.start()
+            event.play()
+            # NOBUG: not trophies(), players would collect one achievement per run
+            standing = event._standing()
+            np.add.at(counts, ([index[player] for player in standing], [place - 1 for place in standing.values()]), 1)
+    return counts
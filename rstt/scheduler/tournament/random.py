@@ -3,7 +3,7 @@ from rstt.ranking.ranking import Ranking
 from rstt import BetterWin
 from rstt.stypes import Solver
 
-import random
+import rstt.utils.rng as ur
 
 
 class RandomRound(RoundRobin):
@@ -45,7 +45,7 @@ class RandomRound(RoundRobin):
         # !!! Bugs when self.nb_duel is to high. When should the error be raised, and how/where should it be documented.
         participants = [p for p in self.participants()]
         for _ in range(self.nb_rounds):
-            random.shuffle(participants)
+            ur.current().random.shuffle(participants)
             new_round = participants[:self.nb_duel*2]
 
         self.future_rounds.append(new_round)
@@ -1,5 +1,5 @@
 from typing import Union, List, Dict, Tuple, Optional
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 
 from rstt import Duel, BetterWin
 from rstt.ranking.ranking import Ranking
@@ -101,6 +101,10 @@ class SwissBracket(Competition):
         self.def_generator = def_generator
         self.def_evaluator = def_evaluator
 
+        # per player records, updated once per game - player -> (wins, loses) and player -> results() format
+        self.__scores: Dict[SPlayer, Tuple[int, int]] = {}
+        self.__records: Dict[SPlayer, Dict[str, list]] = {}
+
     # --- Override ---#
     def _initialise(self):
         # !!! Currently hardcoded setting for 16 participants
@@ -109,12 +113,14 @@ class SwissBracket(Competition):
 
         self.__init_settings()
         self.__init_params()
+        self.__init_records()
 
     def _update(self) -> None:
         # ??? clear self.rounds or keep history
         # move winner and loser
         for game in self.played_matches[-1]:
             p1, p2 = game.player1(), game.player2()
+            self.__record(game)
             self.rounds[self.score(p1)].append(p1)
             self.rounds[self.score(p2)].append(p2)
 
@@ -138,17 +144,16 @@ class SwissBracket(Competition):
         return standing
 
     def generate_games(self):
+        played = self.games()
         games = [uc.find_valid_draw(draws=self.draws(group=self.rounds[score]),
-                                    games=self.games())
+                                    games=played)
                  for score in self.round_scores()]
         return uu.flatten(games)
 
     # --- round mechanism --- #
     @typechecked
     def score(self, player: SPlayer) -> Tuple[int, int]:
-        wins = len([game for game in self.games() if game.winner() == player])
-        loses = len([game for game in self.games() if game.loser() == player])
-        return (wins, loses)
+        return self.__scores.get(player, (0, 0))
 
     def round_scores(self) -> List[Tuple[int, int]]:
         # Round1 [(0, 0)]; Round2 [(1,0), (0,1)]; Round3 [(2,0), (1,1), (0,2)] ...
@@ -186,27 +191,34 @@ class SwissBracket(Competition):
 
         return [uc.playersToDuel(option) for option in options]
 
-    def results(self):
-        # fit data to expected format for tiebreaker function
-        res = {player: {'opponent': [], 'score': [], }
-               for player in self.seeding}
-
-        for game in self.games():
-            # update opponent list
-            res[game.player1()]['opponent'].append(game.player2())
-            res[game.player2()]['opponent'].append(game.player1())
-
-            # update score list !!! Lacks generalisation
-            res[game.player1()]['score'].append(
-                'win' if game.winner() == game.player1() else 'lose')
-            res[game.player2()]['score'].append(
-                'win' if game.winner() == game.player2() else 'lose')
-        return res
+    def results(self) -> Dict[SPlayer, Dict[str, list]]:
+        # NOBUG: a copy, seeders and evaluators may modify it. Players have at most max_round games, copies are O(players)
+        if not self.__records:
+            self.__init_records()
+        return {player: {field: list(values) for field, values in record.items()}
+                for player, record in self.__records.items()}
 
     # --- under the hood mechanism --- #
     def __possible_scores(self):
         return [(i, j) for j in range(self.max_loses+1) for i in range(self.max_wins+1) if i+j <= self.max_round]
 
+    def __init_records(self):
+        # fit data to expected format for tiebreaker function
+        self.__records = {player: {'opponent': [], 'score': [], }
+                          for player in self.seeding}
+        self.__scores = {player: (0, 0) for player in self.__records}
+
+    def __record(self, game: Duel):
+        winner, loser = game.winner(), game.loser()
+        for player, opponent in [(game.player1(), game.player2()), (game.player2(), game.player1())]:
+            # update opponent list
+            record = self.__records.setdefault(player, {'opponent': [], 'score': [], })
+            record['opponent'].append(opponent)
+            # update score list !!! Lacks generalisation
+            record['score'].append('win' if winner == player else 'lose')
+            wins, loses = self.__scores.get(player, (0, 0))
+            self.__scores[player] = (wins + (winner == player), loses + (loser == player))
+
     def __init_settings(self):
         self.max_round = 5
         self.max_wins = 3
@@ -1,19 +1,23 @@
 """ Solver Module
 
 Solver provide a solve(match: SMatch) method to assign a Score to the match. Typicaly a WIN/LOSE/DRAW in case of 'versus' matches
+
+Solvers of this module also provide a solve_many(duels) method solving a whole round at once:
+levels are gathered in arrays, probabilities are computed with numpy and all outcomes are sampled with a single random call.
 """
 
 
 from typing import List, Optional, Callable
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 
 from rstt import Duel
-from rstt.stypes import Score
+from rstt.stypes import Score, SPlayer
 import rstt.utils.functions as uf
+import rstt.utils.rng as ur
 
 import rstt.config as cfg
 
-import random
+import numpy as np
 
 
 '''
@@ -70,6 +74,43 @@ class BetterWin:
             score = WIN
         duel._Match__set_result(result=score)
 
+    @typechecked
+    def solve_many(self, duels: List[Duel], rng: Optional[np.random.Generator] = None) -> None:
+        """Solve many duels at once
+
+        Equivalent to calling solve() on each duel, in order.
+
+        Parameters
+        ----------
+        duels : List[Duel]
+            Unplayed duels.
+        rng : Optional[np.random.Generator], optional
+            Unused, the solver is deterministic. By default None.
+        """
+        level1, level2 = _levels(duels)
+        choices = np.where(level1 > level2, 0, np.where(level1 < level2, 1, 2 if self.with_draw else 0))
+        for duel, choice in zip(duels, choices.tolist()):
+            duel._Match__set_result(result=[WIN, LOSE, DRAW][choice])
+
+    @typechecked
+    def win_probabilities(self, players: List[SPlayer]) -> np.ndarray:
+        """Pairwise win probabilities
+
+        Parameters
+        ----------
+        players : List[SPlayer]
+            Players with a level() method.
+
+        Returns
+        -------
+        np.ndarray
+            matrix where the entry [i, j] is the probability that players[i] wins a Duel against players[j], players[i] being the first player.
+            Draws count as half a win.
+        """
+        level = _player_levels(players)
+        ties = 0.5 if self.with_draw else 1.0
+        return np.where(level[:, None] > level[None, :], 1.0, np.where(level[:, None] < level[None, :], 0.0, ties))
+
 
 class ScoreProb:
     @typechecked
@@ -94,12 +135,39 @@ class ScoreProb:
 
     @typechecked
     def solve(self, duel: Duel, *args, **kwars) -> None:
-        score = random.choices(population=self.scores,
+        score = ur.current().random.choices(population=self.scores,
                                # !!! THE F* is going on here, func should return a Score
                                weights=self.probabilities(duel),
                                k=1)[0]
         duel._Match__set_result(score)
 
+    @typechecked
+    def solve_many(self, duels: List[Duel], rng: Optional[np.random.Generator] = None) -> None:
+        """Solve many duels at once
+
+        Outcomes follow the same distribution as with solve(), but are drawn from a numpy Generator with one call for all the duels.
+
+        Parameters
+        ----------
+        duels : List[Duel]
+            Unplayed duels.
+        rng : Optional[np.random.Generator], optional
+            The random generator, by default None which uses the generator of the current random context, see :func:`rstt.utils.rng.current`.
+        """
+        if not duels:
+            return
+        cumulative = np.cumsum(self._probabilities_many(duels), axis=1)
+        generator = rng if rng is not None else ur.current().generator
+        # inverse transform sampling, like random.choices with cumulative weights
+        thresholds = generator.random(len(duels)) * cumulative[:, -1]
+        choices = np.minimum((cumulative <= thresholds[:, None]).sum(axis=1), len(self.scores) - 1)
+        for duel, choice in zip(duels, choices.tolist()):
+            duel._Match__set_result(self.scores[choice])
+
+    def _probabilities_many(self, duels: List[Duel]) -> np.ndarray:
+        # (games, scores) matrix of weights, subclasses vectorize it
+        return np.array([self.probabilities(duel) for duel in duels], dtype=float)
+
 
 class WeightedScore(ScoreProb):
     @typechecked
@@ -123,7 +191,15 @@ class WeightedScore(ScoreProb):
         if len(scores) != len(weights):
             msg = f"length of scores ({len(scores)}) does not match length of weights ({len(weights)})"
             raise ValueError(msg)
-        super().__init__(scores=scores, func=lambda x: weights)
+        self.weights = weights
+        # NOBUG: bound method instead of a lambda, solvers are pickled by multiprocessing
+        super().__init__(scores=scores, func=self._constant_weights)
+
+    def _constant_weights(self, duel: Duel) -> List[float]:
+        return self.weights
+
+    def _probabilities_many(self, duels: List[Duel]) -> np.ndarray:
+        return np.broadcast_to(np.array(self.weights, dtype=float), (len(duels), len(self.weights)))
 
 
 class CoinFlip(WeightedScore):
@@ -134,6 +210,22 @@ class CoinFlip(WeightedScore):
         """
         super().__init__(scores=[WIN, LOSE], weights=[0.5, 0.5])
 
+    @typechecked
+    def win_probabilities(self, players: List[SPlayer]) -> np.ndarray:
+        """Pairwise win probabilities
+
+        Parameters
+        ----------
+        players : List[SPlayer]
+            Any players.
+
+        Returns
+        -------
+        np.ndarray
+            matrix where the entry [i, j] is the probability that players[i] wins a Duel against players[j], i.e 0.5.
+        """
+        return np.full((len(players), len(players)), 0.5)
+
 
 class BradleyTerry(ScoreProb):
     def __init__(self):
@@ -144,14 +236,35 @@ class BradleyTerry(ScoreProb):
         It is a ScoreProb Solver where the probability function that a player A with level a, beats a player B with level b, is defined as
             P(A win against B) := a/(a + b)
         """
-        super().__init__(scores=[WIN, LOSE], func=self.__probabilities)
+        super().__init__(scores=[WIN, LOSE], func=self._duel_probabilities)
 
-    def __probabilities(self, duel: Duel) -> List[float]:
+    def _duel_probabilities(self, duel: Duel) -> List[float]:
         level1 = duel.teams()[0][0].level()
         level2 = duel.teams()[1][0].level()
         prob = uf.bradleyterry(level1, level2)
         return [prob, 1-prob]
 
+    def _probabilities_many(self, duels: List[Duel]) -> np.ndarray:
+        prob = uf.bradleyterry(*_levels(duels))
+        return np.column_stack((prob, 1-prob))
+
+    @typechecked
+    def win_probabilities(self, players: List[SPlayer]) -> np.ndarray:
+        """Pairwise win probabilities
+
+        Parameters
+        ----------
+        players : List[SPlayer]
+            Players with a level() method.
+
+        Returns
+        -------
+        np.ndarray
+            matrix where the entry [i, j] is the probability that players[i] wins a Duel against players[j].
+        """
+        level = _player_levels(players)
+        return uf.bradleyterry(level[:, None], level[None, :])
+
 
 class LogSolver(ScoreProb):
     @typechecked
@@ -174,13 +287,43 @@ class LogSolver(ScoreProb):
             Default constant in the RSTT package ensure that the LogSolver probabilities matches the expected Score by :class:`rstt.ranking.inferer.Elo`.
             Which means that perfectly accurate predictions are possible when combining both in simulation.
         """
-        super().__init__(scores=[WIN, LOSE], func=self.__probabilities)
+        super().__init__(scores=[WIN, LOSE], func=self._duel_probabilities)
         self.base = base if base is not None else cfg.LOGSOLVER_BASE
         self.lc = lc if lc is not None else cfg.LOGSOLVER_LC
 
-    def __probabilities(self, duel: Duel) -> List[float]:
+    def _duel_probabilities(self, duel: Duel) -> List[float]:
         level1 = duel.teams()[0][0].level()
         level2 = duel.teams()[1][0].level()
         prob = uf.logistic_elo(
             base=self.base, diff=level1-level2, constant=self.lc)
         return [prob, 1-prob]
+
+    def _probabilities_many(self, duels: List[Duel]) -> np.ndarray:
+        level1, level2 = _levels(duels)
+        prob = uf.logistic_elo_many(base=self.base, diffs=level1-level2, constant=self.lc)
+        return np.column_stack((prob, 1-prob))
+
+    @typechecked
+    def win_probabilities(self, players: List[SPlayer]) -> np.ndarray:
+        """Pairwise win probabilities
+
+        Parameters
+        ----------
+        players : List[SPlayer]
+            Players with a level() method.
+
+        Returns
+        -------
+        np.ndarray
+            matrix where the entry [i, j] is the probability that players[i] wins a Duel against players[j].
+        """
+        level = _player_levels(players)
+        return uf.logistic_elo_many(base=self.base, diffs=level[:, None] - level[None, :], constant=self.lc)
+
+
+def _levels(duels: List[Duel]) -> tuple[np.ndarray, np.ndarray]:
+    return _player_levels([duel.player1() for duel in duels]), _player_levels([duel.player2() for duel in duels])
+
+
+def _player_levels(players: List[SPlayer]) -> np.ndarray:
+    return np.fromiter((player.level() for player in players), dtype=float, count=len(players))
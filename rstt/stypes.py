@@ -10,6 +10,7 @@ For example: :class:`rstt.stypes.SPlayer` should only be used for typehint in fu
 .. note::
     RSTT relies on typeguard 3.0.0 and `Duck-Typing` for function signatures.
     Which means that Protocol are defined by the existence of attributes/methods, and not their type signatures.
+    Checks can be turned off for production runs, see :attr:`rstt.config.TYPECHECK`.
 """
 
 
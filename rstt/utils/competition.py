@@ -1,5 +1,5 @@
 from typing import List
-from typeguard import typechecked
+from rstt.utils.typecheck import typechecked
 
 from rstt import Duel
 from rstt.stypes import SPlayer
@@ -26,22 +26,15 @@ def new_matchup(game: Duel, games: List[Duel], symetric: bool = True) -> bool:
 @typechecked
 def find_valid_draw(draws: List[List[Duel]], games: List[Duel], symetric: bool = True) -> List[Duel]:
     # !!! symetric -> valid_draw(...) -> new_matchup(...)
-    # avoid side-effect (usage of .pop)
-    draws = [option for option in draws]
-
-    # default return value
-    first_option = draws[0]
+    # played confrontations, collected once for all the options
+    confrontations = _confrontations(games)
 
     # find draw
-    good_draw = None
-    while not good_draw and draws:
-        option = draws.pop(0)
-        if valid_draw(option, games):
-            good_draw = option
+    good_draw = next((option for option in draws if _valid_draw(option, confrontations)), None)
 
     # deal with mission failed
     if not good_draw:
-        good_draw = first_option
+        good_draw = draws[0]
         msg = "No Valid matchups where found"
         warnings.warn(msg, RuntimeWarning)
 
@@ -50,7 +43,16 @@ def find_valid_draw(draws: List[List[Duel]], games: List[Duel], symetric: bool =
 
 @typechecked
 def valid_draw(draw: List[Duel], games: List[Duel]) -> bool:
+    return _valid_draw(draw, _confrontations(games))
+
+
+def _confrontations(games: List[Duel]) -> set[tuple[SPlayer, SPlayer]]:
+    return {(duel.player1(), duel.player2()) for duel in games}
+
+
+def _valid_draw(draw: List[Duel], confrontations: set[tuple[SPlayer, SPlayer]]) -> bool:
     for game in draw:
-        if not new_matchup(game, games):
+        p1, p2 = game.player1(), game.player2()
+        if (p1, p2) in confrontations or (p2, p1) in confrontations:
             return False
     return True
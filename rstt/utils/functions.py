@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 
 def bradleyterry(level1, level2):
@@ -11,6 +12,11 @@ def logistic_elo(base, diff, constant):
     return 1.0 / (1.0 + math.pow(base, -diff/constant))
 
 
+def logistic_elo_many(base, diffs, constant):
+    # vectorized logistic_elo, np.power may differ from math.pow in the last bit
+    return 1.0 / (1.0 + np.power(base, -np.asarray(diffs, dtype=float)/constant))
+
+
 def normal_elo(diff):
     # TODO: add parametrization
     # https://wismuth.com/elo/calculator.html
@@ -1,11 +1,15 @@
 from rstt.stypes import SPlayer, SMatch, Event, RatingSystem
-from rstt import Duel
+from rstt import Duel, GameLog
 
 
-from typeguard import typechecked
-from typing import Optional, Any, Callable
+from rstt.utils.typecheck import typechecked
+from typing import Optional, Any, Callable, Iterable, Iterator
 
+import numpy as np
+import functools
 import inspect
+import itertools
+import operator
 
 # --- Observation's Data --- #
 PLAYER = 'player'
@@ -26,21 +30,10 @@ NEW_RATINGS = 'new_ratings'
 # --- CONVERTOR --- #
 @typechecked
 def to_list_of_games(game: Optional[SMatch] = None,
-                     games: Optional[list[SMatch]] = None,
+                     games: Optional[Iterable[SMatch]] = None,
                      event: Optional[Event] = None,
-                     events: Optional[list[Event]] = None):
-    observations = []
-    if game:
-        observations.append(game)
-    if games:
-        observations += games
-    if event:
-        observations += event.games()
-    if events:
-        for ev in events:
-            observations += ev.games()
-    # NOBUG: user responsability to not pass a given game multiple time (or allow it)
-    return observations
+                     events: Optional[Iterable[Event]] = None):
+    return list(iter_games(game=game, games=games, event=event, events=events))
 
 
 @typechecked
@@ -94,21 +87,21 @@ def duel_data(duel: SMatch) -> dict[str, Any]:
     return data
 
 
-def players_records(duels: list[Duel]) -> list[dict[str, Any]]:
-    # returned value
-    datas = []
-    for player in active_players(duels):
-        # game relevant to the player
-        targets = [duel for duel in duels if player in duel]
-
-        # data_points as player 'performance summary'
-        data_point = {}
-        data_point[TEAMS] = [[player], [
-            duel.opponent(player) for duel in targets]]
-        data_point[SCORES] = [duel.score(player) for duel in targets]
+def players_records(duels: Iterable[Duel]) -> list[dict[str, Any]]:
+    # game relevant to each player, grouped in one pass - players in order of first appearance
+    opponents: dict[SPlayer, list[SPlayer]] = {}
+    scores: dict[SPlayer, list[float]] = {}
+    for duel in duels:
+        player1, player2 = duel.player1(), duel.player2()
+        score1, score2 = duel.scores()
+        opponents.setdefault(player1, []).append(player2)
+        scores.setdefault(player1, []).append(score1)
+        opponents.setdefault(player2, []).append(player1)
+        scores.setdefault(player2, []).append(score2)
 
-        datas.append(data_point)
-    return datas
+    # data_points as player 'performance summary'
+    return [{TEAMS: [[player], opponents[player]], SCORES: scores[player]}
+            for player in opponents]
 
 
 # --- QUERY --- #
@@ -142,14 +135,76 @@ def push_new_ratings(data: dict[str, Any], posteriori: RatingSystem):
 
 
 # --- Clean Method Calls --- #
-def get_function_args(func: Callable):
-    return inspect.getfullargspec(func).args
+DECLARED_ARGS = 'declared_args'
+
+
+def declare_args(*args_name: str) -> Callable[[Callable], Callable]:
+    '''Decorator declaring the arguments an observer passes to a function
+
+    The declared names are the leading positional parameters of the function, in order.
+    Observers then pass data points values by position, without inspecting the signature nor filtering the data points.
+    '''
+    def decorator(func: Callable) -> Callable:
+        setattr(func, DECLARED_ARGS, tuple(args_name))
+        return func
+    return decorator
+
+
+def get_function_args(func: Callable) -> tuple[str, ...]:
+    # bound methods are new objects at every attribute access, the underlying function is cached instead
+    func = getattr(func, '__func__', func)
+    declared = getattr(func, DECLARED_ARGS, None)
+    if declared is not None:
+        return declared
+    try:
+        return _function_args(func)
+    except TypeError:
+        # unhashable callable
+        return _function_args.__wrapped__(func)
+
+
+# bounded, entries keep their function alive
+@functools.lru_cache(maxsize=256)
+def _function_args(func: Callable) -> tuple[str, ...]:
+    # inspect.signature follows __wrapped__, decorated functions expose their original parameters
+    keywords = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    return tuple(name for name, param in inspect.signature(func).parameters.items() if param.kind in keywords)
 
 
 def filter_valid_args(args_name: list[str], **kwargs):
     return {key: value for key, value in kwargs.items() if key in args_name}
 
 
+def bind_function_args(func: Callable) -> Callable[[dict[str, Any]], Any]:
+    '''Compile the call of a function with a data point
+
+    return a callable taking a data point (a dict), equivalent to call_function_with_args(func, **data).
+    The signature of func is resolved once instead of at every call.
+    When func declares its arguments (see declare_args), the values are fetched by position with one itemgetter call
+    and the data point is not filtered.
+    '''
+    declared = getattr(getattr(func, '__func__', func), DECLARED_ARGS, None)
+    if declared is None:
+        args_name = get_function_args(func)
+
+        def call(data: dict[str, Any]) -> Any:
+            return func(**filter_valid_args(args_name, **data))
+        return call
+
+    if len(declared) == 1:
+        [name] = declared
+
+        def call(data: dict[str, Any]) -> Any:
+            return func(data[name])
+        return call
+
+    values = operator.itemgetter(*declared)
+
+    def call(data: dict[str, Any]) -> Any:
+        return func(*values(data))
+    return call
+
+
 def call_function_with_args(func: Callable, **kwargs):
     func_args = get_function_args(func)
     call_args = filter_valid_args(args_name=func_args, **kwargs)
@@ -158,9 +213,157 @@ def call_function_with_args(func: Callable, **kwargs):
 
 # --- Others --- #
 def active_players(games: list[SMatch]) -> list[SPlayer]:
+    if isinstance(games, GameLog):
+        return [games.players[i] for i in np.unique(np.concatenate((games.player1, games.player2))).tolist()]
     return list(set([player for players in [game.players() for game in games] for player in players]))
 
 
+# --- Streaming and Arrays --- #
+@typechecked
+def iter_games(game: Optional[SMatch] = None,
+               games: Optional[Iterable[SMatch]] = None,
+               event: Optional[Event] = None,
+               events: Optional[Iterable[Event]] = None):
+    '''Lazy counterpart of to_list_of_games
+
+    games and events can be any iterable, including generators decoding matches on the fly.
+    Observations are yielded one at a time and never stored.
+    '''
+    if game:
+        yield game
+    if games:
+        yield from games
+    if event:
+        yield from event.games()
+    if events:
+        for ev in events:
+            yield from ev.games()
+    # NOBUG: user responsability to not pass a given game multiple time (or allow it)
+
+
+def chunked(observations: Iterable[Any], size: Optional[int] = None) -> Iterator[Iterable[Any]]:
+    '''Split observations in consecutive lists of at most size elements
+
+    When size is None, the observations are yielded as they are, in one chunk.
+    '''
+    if size is None:
+        yield observations
+        return
+    if size < 1:
+        msg = f"chunk size must be a positive integer, got {size}"
+        raise ValueError(msg)
+    iterator = iter(observations)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def to_game_logs(size: Optional[int] = None,
+                 game: Optional[SMatch] = None,
+                 games: Optional[Iterable[SMatch]] = None,
+                 event: Optional[Event] = None,
+                 events: Optional[Iterable[Event]] = None) -> Iterator[GameLog]:
+    '''Columnar counterpart of iter_games
+
+    Yields the observations as GameLog of at most size games, in order. A GameLog passed as games is sliced, not converted.
+    Other sources are read lazily, chunk by chunk.
+    '''
+    sources = [iter_games(game=game), games, iter_games(event=event, events=events)]
+    for source in sources:
+        if source is None:
+            continue
+        if isinstance(source, GameLog):
+            yield from source.chunks(size)
+            continue
+        for chunk in chunked(source, size):
+            log = GameLog.from_games(chunk)
+            if len(log):
+                yield log
+
+
+def players_records_arrays(duels: Iterable[Duel], indices: Callable[[list[SPlayer]], np.ndarray]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''Columnar counterpart of players_records for vectorized inferers
+
+    Each duel produces two records (player, opponent, score of player), one per player, in game order.
+    indices maps players to integer ids, for example ArrayKeyModel.indices.
+
+    return: player ids, opponent ids and scores arrays.
+    '''
+    log = duels if isinstance(duels, GameLog) else GameLog.from_games(duels)
+    return log.records(indices)
+
+
+def game_log_slots(log: GameLog, datamodel: RatingSystem) -> tuple[np.ndarray, np.ndarray]:
+    '''Slots of the players of a GameLog in an ArrayKeyModel
+
+    When the log and the datamodel share a PlayerRegistry, ids are translated with arrays only.
+
+    return: slots of the first and second player of each game.
+    '''
+    registry = getattr(datamodel, 'registry', None)
+    if registry is not None and log.players is registry:
+        slots = datamodel.registry_indices(np.ravel(np.column_stack((log.player1, log.player2))))
+        return slots[0::2], slots[1::2]
+    return log.map_players(datamodel.indices)
+
+
+def game_logs_records(logs: Iterable[GameLog], datamodel: RatingSystem) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''players_records_arrays of consecutive GameLog (see to_game_logs), with the slots of an ArrayKeyModel as ids'''
+    players, opponents, scores = [], [], []
+    for log in logs:
+        player1, player2 = game_log_slots(log, datamodel)
+        players.append(np.ravel(np.column_stack((player1, player2))))
+        opponents.append(np.ravel(np.column_stack((player2, player1))))
+        scores.append(np.ravel(np.column_stack((log.scores1, log.scores2))))
+    if not players:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+    return np.concatenate(players), np.concatenate(opponents), np.concatenate(scores)
+
+
+def conflict_free_waves(player1_idx: np.ndarray, player2_idx: np.ndarray) -> list[np.ndarray]:
+    '''Partition an ordered sequence of duels into waves of player-disjoint games
+
+    Game i is scheduled one wave after the last game involving one of its players.
+    Processing the waves in order, each wave at once, is equivalent to processing the games one by one:
+    every player sees its games in the original order.
+
+    NOTE: the waves are a topological layering of the games, computed with arrays.
+    Each game depends on the previous game of its two players, a game joins a wave when its dependencies are all scheduled.
+    Every game is examined at most twice, the number of numpy calls grows with the number of waves, not of games.
+
+    return: list of int arrays, the game indices of each wave in increasing order.
+    '''
+    n_games = len(player1_idx)
+    if n_games == 0:
+        return []
+    # previous and next game of the same player, -1 if none. Both 'sides' of the games are stacked.
+    games = np.tile(np.arange(n_games), 2)
+    order = np.argsort(np.concatenate((player1_idx, player2_idx)) * n_games + games)
+    players, games = np.concatenate((player1_idx, player2_idx))[order], games[order]
+    # a player facing himself does not depend on his own game
+    same = np.flatnonzero((players[1:] == players[:-1]) & (games[1:] != games[:-1]))
+    previous = np.full(2 * n_games, -1, dtype=np.int64)
+    following = np.full(2 * n_games, -1, dtype=np.int64)
+    previous[order[same + 1]] = games[same]
+    following[order[same]] = games[same + 1]
+    previous, following = previous.reshape(2, n_games), following.reshape(2, n_games)
+
+    scheduled = np.zeros(n_games + 1, dtype=bool)
+    scheduled[-1] = True  # index -1 stands for 'no previous game'
+    stamp = np.empty(n_games, dtype=np.int64)
+    waves = []
+    wave = np.flatnonzero((previous < 0).all(axis=0))
+    while wave.size:
+        waves.append(wave)
+        scheduled[wave] = True
+        candidates = following[:, wave].ravel()
+        candidates = candidates[candidates >= 0]
+        candidates = candidates[scheduled[previous[:, candidates]].all(axis=0)]
+        # drop duplicates, games whose two previous games are in the wave
+        stamp[candidates] = np.arange(candidates.size)
+        wave = np.sort(candidates[stamp[candidates] == np.arange(candidates.size)])
+    return waves
+
+
 # --- no processing --- #
 def no_convertion(*args, **kwargs) -> Any:
     # !!! probably not what a user expect. BUT what does he expect ?
@@ -0,0 +1,123 @@
+"""Random number generators of simulations
+
+Random components of rstt (solvers, player generators, time varying players, random schedulers) draw from the current random context, see :func:`rstt.utils.rng.current`.
+Outside of any context, they use the python random module, and a simulation is reproducible with random.seed().
+
+An :class:`rstt.utils.rng.RNG` context provides independent and reproducible streams. It is backed by a numpy SeedSequence,
+:func:`rstt.utils.rng.RNG.spawn` creates child contexts with statistically independent streams, for example one per worker of a process pool.
+
+Example
+-------
+.. code-block:: python
+    :linenos:
+
+    from rstt import Player, RNG
+
+    def study(rng: RNG):
+        with rng:
+            players = Player.create(nb=16)
+            ...
+
+    workers = RNG(seed=2024).spawn(8)
+    # results of study(workers[i]) only depend on the seed and on i, whichever process runs it.
+
+.. note::
+    Player names generated by the `names` package always use the python random module.
+"""
+
+from typing import Optional, Union, Any
+
+import numpy as np
+import random
+
+
+class RNG:
+    def __init__(self, seed: Optional[Union[int, np.random.SeedSequence]] = None):
+        """Random context
+
+        Holds a python random.Random instance and a numpy Generator, both seeded from the same SeedSequence.
+        Entering the context (with statement) makes it the current context of rstt components, contexts can be nested.
+
+        Parameters
+        ----------
+        seed : Optional[Union[int, np.random.SeedSequence]], optional
+            The entropy source, by default None which uses fresh entropy from the OS.
+        """
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.random = random.Random(int.from_bytes(self.seed_sequence.generate_state(4).tobytes(), 'little'))
+        self.generator = np.random.default_rng(self.seed_sequence)
+
+    def spawn(self, n: int) -> list['RNG']:
+        """Create independent child contexts
+
+        Successive calls return different children.
+
+        Parameters
+        ----------
+        n : int
+            Number of children.
+
+        Returns
+        -------
+        list[RNG]
+            Contexts with independent streams, reproducible given the parent seed and the order of spawn calls.
+        """
+        return [RNG(child) for child in self.seed_sequence.spawn(n)]
+
+    def __enter__(self) -> 'RNG':
+        _CONTEXTS.append(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        _CONTEXTS.remove(self)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __str__(self) -> str:
+        return f"{type(self)} - entropy: {self.seed_sequence.entropy}, spawn_key: {self.seed_sequence.spawn_key}"
+
+
+class _GlobalRNG:
+    # NOBUG: default context, stays consistent with random.seed() calls made by users
+    random = random
+
+    @property
+    def generator(self) -> np.random.Generator:
+        return np.random.default_rng(random.getrandbits(64))
+
+
+_GLOBAL = _GlobalRNG()
+_CONTEXTS: list[RNG] = []
+
+
+def current() -> Union[RNG, Any]:
+    """Getter for the current random context
+
+    Returns
+    -------
+    Union[RNG, Any]
+        The last entered :class:`rstt.utils.rng.RNG` still active. Otherwise an object with the same attributes,
+        where 'random' is the python random module and 'generator' a numpy Generator seeded from it.
+    """
+    return _CONTEXTS[-1] if _CONTEXTS else _GLOBAL
+
+
+def gauss(mu: float, sigma: float) -> float:
+    """Gaussian distribution of the current random context
+
+    Default level distribution of :mod:`rstt.config`.
+
+    Parameters
+    ----------
+    mu : float
+        The mean.
+    sigma : float
+        The standard deviation.
+
+    Returns
+    -------
+    float
+        A random value.
+    """
+    return current().random.gauss(mu, sigma)
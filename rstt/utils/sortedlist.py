@@ -0,0 +1,182 @@
+"""Blocked sorted list
+
+Order-statistic container used by :class:`rstt.ranking.standing.Standing`.
+Elements are kept in ascending order inside small sorted blocks (a 'list of lists'),
+which gives logarithmic search and cheap insertion/removal without a full re-sort.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, chain
+from typing import Any, Iterable, Iterator
+
+
+class SortedList:
+    LOAD = 512
+    """Target size of a block. Blocks are split when they reach twice this value."""
+
+    def __init__(self, values: Iterable[Any] = ()):
+        """Ascending sorted container with positional access
+
+        Elements must be mutually comparable and unique with respect to comparison (i.e. a == b implies a is b).
+
+        Complexity, for n elements and blocks of size B:
+            - add / remove: O(log n + B)
+            - position / __getitem__: O(log n) once the block offsets are known, O(n/B) to refresh them after a modification.
+
+        Parameters
+        ----------
+        values : Iterable[Any], optional
+            Initial elements, by default ()
+        """
+        self._lists: list[list[Any]] = []
+        self._maxes: list[Any] = []
+        self._offsets: list[int] | None = None
+        self._len = 0
+        self.update(values)
+
+    # --- setter --- #
+    def update(self, values: Iterable[Any]):
+        """Add many elements at once
+
+        The container is rebuilt with a single sort, which is faster than repeated add() calls for large inputs.
+
+        Parameters
+        ----------
+        values : Iterable[Any]
+            Elements to add
+        """
+        values = sorted(chain(self, values))
+        load = self.LOAD
+        self._lists = [values[i:i+load] for i in range(0, len(values), load)]
+        self._maxes = [sublist[-1] for sublist in self._lists]
+        self._len = len(values)
+        self._offsets = None
+
+    def add(self, value: Any):
+        """Insert an element at its sorted position
+
+        Parameters
+        ----------
+        value : Any
+            The element to insert
+        """
+        if not self._maxes:
+            self._lists.append([value])
+            self._maxes.append(value)
+        else:
+            i = bisect_right(self._maxes, value)
+            if i == len(self._maxes):
+                i -= 1
+                self._lists[i].append(value)
+                self._maxes[i] = value
+            else:
+                insort(self._lists[i], value)
+            if len(self._lists[i]) > 2 * self.LOAD:
+                self.__split(i)
+        self._len += 1
+        self._offsets = None
+
+    def remove(self, value: Any):
+        """Remove an element
+
+        Parameters
+        ----------
+        value : Any
+            The element to remove
+
+        Raises
+        ------
+        ValueError
+            When the element is not contained.
+        """
+        i, j = self.__locate(value)
+        sublist = self._lists[i]
+        del sublist[j]
+        if sublist:
+            self._maxes[i] = sublist[-1]
+        else:
+            del self._lists[i]
+            del self._maxes[i]
+        self._len -= 1
+        self._offsets = None
+
+    def clear(self):
+        self._lists = []
+        self._maxes = []
+        self._offsets = None
+        self._len = 0
+
+    # --- getter --- #
+    def position(self, value: Any) -> int:
+        """Index of an element in ascending order
+
+        Parameters
+        ----------
+        value : Any
+            A contained element
+
+        Returns
+        -------
+        int
+            The position of the element.
+
+        Raises
+        ------
+        ValueError
+            When the element is not contained.
+        """
+        i, j = self.__locate(value)
+        return self.__block_offsets()[i] + j
+
+    # --- internal mechanism --- #
+    def __locate(self, value: Any) -> tuple[int, int]:
+        i = bisect_left(self._maxes, value)
+        if i < len(self._maxes):
+            sublist = self._lists[i]
+            j = bisect_left(sublist, value)
+            if j < len(sublist) and sublist[j] == value:
+                return i, j
+        msg = f"{value} is not in SortedList"
+        raise ValueError(msg)
+
+    def __split(self, i: int):
+        sublist = self._lists[i]
+        half = len(sublist) // 2
+        self._lists[i:i+1] = [sublist[:half], sublist[half:]]
+        self._maxes[i:i+1] = [sublist[half-1], sublist[-1]]
+
+    def __block_offsets(self) -> list[int]:
+        if self._offsets is None:
+            self._offsets = list(accumulate(
+                (len(sublist) for sublist in self._lists), initial=0))
+        return self._offsets
+
+    # --- magic methods --- #
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            msg = "SortedList index out of range"
+            raise IndexError(msg)
+        offsets = self.__block_offsets()
+        i = bisect_right(offsets, index) - 1
+        return self._lists[i][index - offsets[i]]
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            self.__locate(value)
+            return True
+        except ValueError:
+            return False
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return chain.from_iterable(reversed(sublist) for sublist in reversed(self._lists))
+
+    def __repr__(self) -> str:
+        return f"SortedList({list(self)})"
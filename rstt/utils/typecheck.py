@@ -0,0 +1,30 @@
+"""Runtime type checking switch
+
+Functions and classes of rstt are decorated with :func:`rstt.utils.typecheck.typechecked` instead of typeguard's decorator.
+When :attr:`rstt.config.TYPECHECK` is False, the decorator returns its target unchanged and calls run without any type checking overhead.
+
+The flag is read when a decorated module is imported. Set the environment variable RSTT_TYPECHECK=0 before importing rstt for production runs.
+"""
+
+from typing import Any
+from typeguard import typechecked as typeguard_typechecked
+
+import rstt.config as cfg
+
+
+def typechecked(target: Any = None) -> Any:
+    """Conditional typeguard decorator
+
+    Parameters
+    ----------
+    target : Any, optional
+        A function or a class, by default None.
+
+    Returns
+    -------
+    Any
+        The target instrumented by typeguard.typechecked when :attr:`rstt.config.TYPECHECK` is True, the target itself otherwise.
+    """
+    if target is None:
+        return typechecked
+    return typeguard_typechecked(target) if cfg.TYPECHECK else target
@@ -0,0 +1,108 @@
+import pytest
+import numpy as np
+
+from rstt.ranking.datamodel import KeyModel, ArrayKeyModel, ArrayGaussianModel
+from rstt.ranking.rating import GlickoRating, Glicko2Rating
+from rstt import Player, PlayerRegistry, Duel, BetterWin, BasicElo, BasicGlicko
+
+
+# --- Fixtures --- #
+@pytest.fixture
+def players():
+    return Player.create(nb=5)
+
+
+# --- TESTING --- #
+def test_default_rating(players):
+    km = ArrayKeyModel(default=1500.0)
+    assert km.get(players[0]) == 1500.0
+    assert players[0] in km
+
+
+def test_set_get(players):
+    km = ArrayGaussianModel(default=Glicko2Rating())
+    rating = Glicko2Rating(mu=1600.0, sigma=80.0, volatility=0.05)
+    km.set(players[0], rating)
+    assert km.get(players[0]) == rating
+    assert km.get(players[1]) == Glicko2Rating()
+
+
+def test_ordinal_all(players):
+    km = ArrayGaussianModel(default=GlickoRating(1500.0, 100.0))
+    km.set(players[0], GlickoRating(1800.0, 50.0))
+    km.get(players[1])
+    assert km.ordinal_all().tolist() == [1700.0, 1300.0]
+    assert km.ordinal_all([players[1]]).tolist() == [km.ordinal(km.get(players[1]))]
+
+
+def test_delitem_swap(players):
+    km = ArrayKeyModel(default=0.0)
+    for i, player in enumerate(players):
+        km.set(player, float(i))
+    del km[players[1]]
+    assert players[1] not in km
+    assert len(km) == len(players) - 1
+    assert [km.get(player) for player in players if player is not players[1]] == [0.0, 2.0, 3.0, 4.0]
+
+
+def test_set_all(players):
+    km = ArrayGaussianModel(default=GlickoRating())
+    slots = km.indices(players)
+    km.pop_new()
+    km.set_all(slots, mu=np.arange(5.0), sigma=np.ones(5))
+    assert km.get(players[3]) == GlickoRating(3.0, 1.0)
+    assert km.pop_dirty() == players
+
+
+def test_registry_indices(players):
+    registry = PlayerRegistry(players)
+    km = ArrayKeyModel(default=0.0, registry=registry)
+    km.set(players[2], 2.0)
+    slots = km.registry_indices(np.array([4, 2, 4, 0]))
+    assert slots.tolist() == [1, 0, 1, 2]
+    assert list(km.keys()) == [players[2], players[4], players[0]]
+
+
+def test_registry_delitem(players):
+    registry = PlayerRegistry()
+    km = ArrayKeyModel(default=0.0, registry=registry)
+    for i, player in enumerate(players):
+        km.set(player, float(i))
+    del km[players[1]]
+    slots = km.registry_indices(np.array([0, 2, 3, 4]))
+    assert km.array()[slots].tolist() == [0.0, 2.0, 3.0, 4.0]
+    assert km.registry_indices(np.array([1])).tolist() == [4]
+    assert km.get(players[1]) == 0.0
+
+
+def test_same_api_as_keymodel(players):
+    registry = PlayerRegistry(players[::-1])
+    models = [KeyModel(default=0.0, registry=registry), ArrayKeyModel(default=0.0, registry=registry)]
+    for km in models:
+        for i, player in enumerate(players[:3]):
+            km.set(player, float(i))
+    for km in models:
+        assert km.keys() == players[:3]
+        assert km.items() == [(player, float(i)) for i, player in enumerate(players[:3])]
+        assert players[4] not in km
+    assert models[1]._slots[registry.id(players[0])] == 0
+
+
+def test_invalid_default():
+    with pytest.raises(TypeError):
+        ArrayKeyModel(default='1500')
+    with pytest.raises(TypeError):
+        ArrayGaussianModel(default=1500.0)
+
+
+@pytest.mark.parametrize("system", [BasicElo, BasicGlicko])
+def test_array_backed_ranking(system, players):
+    ranking = system('dict', players=players)
+    array = system('array', players=players, array_backed=True)
+    games = [Duel(p1, p2) for p1, p2 in zip(players, players[1:])]
+    for game in games:
+        BetterWin().solve(game)
+    ranking.update(games=games)
+    array.update(games=games)
+    assert ranking.players() == array.players()
+    assert ranking.points() == array.points()
@@ -70,3 +70,29 @@ def test_init_with_factory(factory, dummy, rating):
 def test_init_with_facotry_kwargs(factory, kwargs, dummy, rating):
     datamodel = KeyModel(factory=factory, **kwargs)
     assert datamodel.get(dummy) == rating
+
+
+def test_pop_dirty(dummy):
+    km = KeyModel(default=1500.0)
+    other = BasicPlayer('other', DUMMY_LEVEL)
+    km.get(other)
+    km.set(dummy, 1600.0)
+    assert km.pop_dirty() == [dummy]
+    assert km.pop_dirty() == []
+
+
+def test_pop_dirty_deleted(dummy):
+    km = KeyModel(default=1500.0)
+    km.set(dummy, 1600.0)
+    del km[dummy]
+    assert km.pop_dirty() == []
+
+
+def test_pop_new(dummy):
+    km = KeyModel(default=1500.0)
+    other = BasicPlayer('other', DUMMY_LEVEL)
+    km.get(other)
+    km.set(dummy, 1600.0)
+    km.set(other, 1600.0)
+    assert km.pop_new() == [other, dummy]
+    assert km.pop_new() == []
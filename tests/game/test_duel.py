@@ -153,3 +153,11 @@ def test_scores(p1_versus_p2, score):
 def test_ranks(score, ranks, p1_versus_p2):
     p1_versus_p2._Match__set_result(score)
     assert p1_versus_p2.ranks() == ranks
+
+
+def test_played_constructor(p1, p2):
+    duel = Duel.played(p1, p2, WIN, tracking=False)
+    assert not duel.live()
+    assert duel.winner() is p1
+    with pytest.raises(RuntimeError):
+        BetterWin().solve(duel)
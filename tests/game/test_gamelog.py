@@ -0,0 +1,106 @@
+import pytest
+import random
+import numpy as np
+
+from rstt import Player, PlayerRegistry, Duel, GameLog, BetterWin, BTRanking, RoundRobin
+from rstt.ranking.standard import BasicElo, BasicGlicko
+
+
+@pytest.fixture
+def players():
+    return Player.create(nb=6)
+
+
+@pytest.fixture
+def games(players):
+    rng = random.Random(5)
+    duels = []
+    for _ in range(30):
+        duel = Duel(*rng.sample(players, 2))
+        BetterWin().solve(duel)
+        duels.append(duel)
+    return duels
+
+
+@pytest.fixture
+def log(games):
+    return GameLog.from_games(games)
+
+
+def test_from_games(log, games):
+    assert len(log) == len(games)
+    for duel, game in zip(log, games):
+        assert duel.players() == game.players()
+        assert duel.scores() == game.scores()
+
+
+def test_lazy_duel_not_tracked(log):
+    duel = log[0]
+    assert duel not in log.players[log.player1[0]].games()
+
+
+def test_slice_shares_players(log):
+    part = log[5:10]
+    assert len(part) == 5
+    assert part.players is log.players
+    assert part[0].players() == log[5].players()
+
+
+def test_length_error(players):
+    with pytest.raises(ValueError):
+        GameLog(players, np.array([0, 1]), np.array([1]), np.array([1.0]), np.array([0.0]))
+
+
+def test_concatenate(games):
+    merged = GameLog.concatenate([GameLog.from_games(games[:10]), GameLog.from_games(games[10:])])
+    assert [duel.players() for duel in merged] == [game.players() for game in games]
+
+
+def test_map_players_first_appearance(log):
+    seen = []
+    log.map_players(lambda keys: seen.extend(keys) or np.arange(len(keys)))
+    expected = list(dict.fromkeys(p for game in log for p in game.players()))
+    assert seen == expected
+
+
+@pytest.mark.parametrize("array_backed", [False, True], ids=['dict', 'array'])
+def test_elo_update_from_gamelog(array_backed, players, games, log):
+    reference = BasicElo('reference', players=players, array_backed=array_backed)
+    columnar = BasicElo('columnar', players=players, array_backed=array_backed)
+    reference.update(games=games)
+    columnar.update(games=log)
+    assert [columnar.rating(p) for p in players] == [reference.rating(p) for p in players]
+
+
+@pytest.mark.parametrize("array_backed", [False, True], ids=['dict', 'array'])
+def test_glicko_update_from_gamelog(array_backed, players, games, log):
+    reference = BasicGlicko('reference', players=players, array_backed=array_backed)
+    columnar = BasicGlicko('columnar', players=players, array_backed=array_backed)
+    reference.update(games=games)
+    columnar.update(games=log)
+    for p in players:
+        assert columnar.rating(p).mu == pytest.approx(reference.rating(p).mu)
+
+
+@pytest.mark.parametrize("system", [BasicElo, BasicGlicko])
+def test_update_with_shared_registry(system, players, games):
+    registry = PlayerRegistry()
+    reference = system('reference', players=players, array_backed=True)
+    shared = system('shared', players=players, array_backed=True, registry=registry)
+    log = GameLog.from_games(games, players=registry)
+    assert log.players is shared.datamodel.registry
+    reference.update(games=games)
+    shared.update(games=log)
+    for p in players:
+        assert shared.datamodel.ordinal(shared.rating(p)) == pytest.approx(reference.datamodel.ordinal(reference.rating(p)))
+
+
+def test_competition_game_log(players):
+    cup = RoundRobin('rr', seeding=BTRanking('seeding', players=players))
+    cup.registration(players)
+    cup.run()
+    log = cup.game_log()
+    assert len(log) == len(cup.games())
+    assert log.event_names == ['rr']
+    assert log.timestamps.tolist() == sorted(log.timestamps.tolist())
+    assert log.timestamps[-1] == len(cup.games(by_rounds=True)) - 1
@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+
+from rstt import Player, PlayerRegistry, BasicPlayer, Duel
+from rstt.game.importer import read_csv, load_csv
+from rstt.ranking.standard import BasicElo
+
+
+CSV = """date,player_a,player_b,score_a,score_b,event
+2024-01-01,alice,bob,1.0,0.0,open
+2024-01-02,bob,carol,0.5,0.5,open
+2024-01-03,carol,alice,0.0,1.0,cup
+2024-01-04,alice,dave,1.0,0.0,cup
+2024-01-05,dave,bob,0.0,1.0,cup
+"""
+
+
+@pytest.fixture
+def path(tmp_path):
+    file = tmp_path / 'results.csv'
+    file.write_text(CSV)
+    return file
+
+
+def test_read_csv_chunks(path):
+    logs = list(read_csv(path, chunk_size=2))
+    assert [len(log) for log in logs] == [2, 2, 1]
+    assert all(log.players is logs[0].players for log in logs)
+    assert [p.name() for p in logs[0].players] == ['alice', 'bob', 'carol', 'dave']
+
+
+def test_read_csv_columns(path):
+    [log] = list(read_csv(path))
+    assert log.player1.tolist() == [0, 1, 2, 0, 3]
+    assert log.scores2.tolist() == [0.0, 0.5, 1.0, 0.0, 1.0]
+    assert log.timestamps[0] == np.datetime64('2024-01-01')
+    assert [log.event_names[i] for i in log.events] == ['open', 'open', 'cup', 'cup', 'cup']
+
+
+def test_read_csv_known_players(path):
+    alice = Player('alice')
+    [log] = list(read_csv(path, players=[alice]))
+    assert log.players[0] is alice
+    assert log[0].player1() is alice
+
+
+def test_read_csv_registry(path):
+    alice = Player('alice')
+    registry = PlayerRegistry([Player('zoe'), alice])
+    [log] = list(read_csv(path, registry=registry))
+    assert log.players is registry
+    assert log.player1.tolist() == [1, 2, 3, 1, 4]
+    assert log[0].player1() is alice
+
+
+def test_read_csv_missing_column(tmp_path):
+    file = tmp_path / 'bad.csv'
+    file.write_text("player_a,player_b,score_a\nalice,bob,1.0\n")
+    with pytest.raises(ValueError):
+        next(read_csv(file))
+
+
+def test_read_csv_blank_lines(tmp_path):
+    file = tmp_path / 'blank.csv'
+    file.write_text(CSV.replace("2024-01-03", "\n2024-01-03") + "\n\n")
+    logs = list(read_csv(file, chunk_size=2))
+    assert [len(log) for log in logs] == [2, 2, 1]
+    assert logs[1].player1.tolist() == [2, 0]
+
+
+def test_read_csv_ragged_line(tmp_path):
+    file = tmp_path / 'ragged.csv'
+    file.write_text(CSV.replace("carol,alice,0.0,1.0,cup", "carol,alice,0.0,cup"))
+    with pytest.raises(ValueError, match="Line 4"):
+        list(read_csv(file))
+
+
+def test_load_csv_matches_duels(path):
+    players = [BasicPlayer(name) for name in ['alice', 'bob', 'carol', 'dave']]
+    elo = BasicElo('csv')
+    load_csv(elo, path, players=players, chunk_size=2)
+
+    reference = BasicElo('duels')
+    for line in CSV.splitlines()[1:]:
+        _, a, b, sa, sb, _ = line.split(',')
+        duel = Duel(players[[p.name() for p in players].index(a)], players[[p.name() for p in players].index(b)])
+        duel._Match__set_result([float(sa), float(sb)])
+        reference.update(game=duel)
+    assert [elo.rating(p) for p in players] == [reference.rating(p) for p in players]
+
+
+def test_load_csv_ranking_registry(path):
+    elo = BasicElo('csv', array_backed=True, registry=PlayerRegistry())
+    load_csv(elo, path)
+    assert [p.name() for p in elo.datamodel.registry] == ['alice', 'bob', 'carol', 'dave']
+    assert len(elo) == 4
@@ -2,9 +2,13 @@ import pytest
 
 from rstt import Player, BasicPlayer, Duel, BetterWin
 import rstt.config as cfg
+from rstt.utils.typecheck import typechecked
 
 import numpy as np
 import math
+import subprocess
+import sys
+import os
 
 
 @pytest.fixture
@@ -31,6 +35,22 @@ def test_duel_history_default_set_tracking(p0, p1):
     assert duel in p0.games()
 
 
+def test_typecheck_disabled(monkeypatch):
+    def f(x: int) -> int: return x
+    monkeypatch.setattr(cfg, 'TYPECHECK', False)
+    assert typechecked(f) is f
+    monkeypatch.setattr(cfg, 'TYPECHECK', True)
+    assert typechecked(f) is not f
+
+
+@pytest.mark.parametrize("env, error", [('1', 'TypeCheckError'), ('0', 'AttributeError')])
+def test_typecheck_environment_variable(env, error):
+    code = "from rstt import BetterWin\ntry:\n    BetterWin().solve('duel')\nexcept Exception as e:\n    print(type(e).__name__)"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            env={**os.environ, 'RSTT_TYPECHECK': env})
+    assert result.stdout.strip() == error
+
+
 '''
 NOTE: Currently rstt solvers are only define for the Duel class
 
@@ -0,0 +1,38 @@
+import pytest
+
+import rstt
+
+import subprocess
+import sys
+
+
+def test_import_is_lazy():
+    code = "import sys, rstt\nprint(sorted(m for m in sys.modules if m.startswith(('rstt.', 'numpy', 'typeguard'))))"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    assert result.stdout.strip() == '[]'
+
+
+@pytest.mark.parametrize("name", rstt.__all__)
+def test_public_names(name):
+    assert getattr(rstt, name) is not None
+    assert name in dir(rstt)
+
+
+@pytest.mark.parametrize("name", ['utils', 'player', 'game', 'solver', 'ranking', 'scheduler'])
+def test_subpackages(name):
+    code = f"import rstt\nprint(rstt.{name}.__name__, '{name}' in dir(rstt))"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    assert result.stdout.split() == [f'rstt.{name}', 'True']
+
+
+def test_subpackage_attribute_access():
+    code = "import rstt\nprint(rstt.ranking.standard.BasicElo.__name__)"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    assert result.stdout.strip() == 'BasicElo'
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        rstt.NotAName
+    with pytest.raises(ImportError):
+        from rstt import NotAName
@@ -0,0 +1,56 @@
+import pytest
+import numpy as np
+
+from rstt import Player, PlayerRegistry, BasicElo
+from rstt.ranking.datamodel import KeyModel
+
+
+# --- Fixtures --- #
+@pytest.fixture
+def players():
+    return Player.create(nb=4)
+
+
+# --- TESTING --- #
+def test_dense_ids(players):
+    registry = PlayerRegistry(players[:2])
+    assert registry.register(players[2]) == 2
+    assert registry.register(players[0]) == 0
+    assert [registry.id(player) for player in players[:3]] == [0, 1, 2]
+    assert registry.players() == players[:3]
+    assert len(registry) == 3
+
+
+def test_ids_register_missing(players):
+    registry = PlayerRegistry([players[1]])
+    ids = registry.ids([players[3], players[1], players[3]])
+    assert ids.tolist() == [1, 0, 1]
+    assert registry.player(1) is players[3]
+    assert players[2] not in registry
+
+
+def test_unknown_id(players):
+    with pytest.raises(KeyError):
+        PlayerRegistry().id(players[0])
+
+
+def test_ranking_containers_share_registry(players):
+    registry = PlayerRegistry(players[2:])
+    elo = BasicElo('elo', players=players, registry=registry)
+    assert elo.datamodel.registry is registry
+    assert elo.standing.fit(players)._registry is registry
+    assert registry.players() == players[2:] + players[:2]
+    assert set(elo.standing.keys()) == set(players)
+
+
+def test_keymodel_keys_on_ids(players):
+    registry = PlayerRegistry()
+    km = KeyModel(default=1500.0, registry=registry)
+    km.set(players[1], 1600.0)
+    km.get(players[0])
+    assert len(registry) == 2
+    assert km.keys() == [players[1], players[0]]
+    assert players[0] in km and players[2] not in km
+    assert len(km) == 2
+    del km[players[1]]
+    assert km.items() == [(players[0], 1500.0)]
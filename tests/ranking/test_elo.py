@@ -1,8 +1,11 @@
 import pytest
+import random
+import numpy as np
 from collections import namedtuple
 
-from rstt import Player, Duel
+from rstt import Player, Duel, BetterWin, LogSolver
 from rstt.ranking.standard import BasicElo
+from rstt.ranking.inferer import Elo
 from rstt.solver import WIN, LOSE
 
 EloParam = namedtuple('EloParam', 'player, prior, posteriori')
@@ -28,9 +31,9 @@ def p3():
 def p4():
     return EloParam(Player('p2'), 1000, 1022.8)
 
-@pytest.fixture
-def elo():
-    return BasicElo(name='test', k=30, lc=400, base=10)
+@pytest.fixture(params=[False, True], ids=['dict', 'array'])
+def elo(request):
+    return BasicElo(name='test', k=30, lc=400, base=10, array_backed=request.param)
 
 @pytest.fixture
 def games(p1, p2, p3, p4):
@@ -47,4 +50,48 @@ def test_elo_with_examples(elo, p1, p2, p3, p4, games):
     elo.update(games=games)
     
     for p in [p1, p2, p3, p4]:
-        assert elo.rating(p.player) == pytest.approx(p.posteriori, 0.01)
\ No newline at end of file
+        assert elo.rating(p.player) == pytest.approx(p.posteriori, 0.01)
+
+
+def test_elo_vectorized_replay_identical():
+    rng = random.Random(1)
+    players = Player.create(nb=50)
+    games = []
+    for _ in range(3000):
+        duel = Duel(*rng.sample(players, 2))
+        LogSolver().solve(duel)
+        games.append(duel)
+    replay = BasicElo('replay', players=players)
+    vectorized = BasicElo('vectorized', players=players, array_backed=True)
+    replay.update(games=games)
+    vectorized.update(games=games)
+    assert vectorized.vectorized()
+    assert [vectorized.rating(p) for p in players] == [replay.rating(p) for p in players]
+
+
+def test_rate_duels_identical_to_rate():
+    # small ratings and K expose last bit differences of the expected scores
+    rng = np.random.default_rng(0)
+    ratings1, ratings2 = rng.uniform(-10, 10, 500), rng.uniform(-10, 10, 500)
+    scores1 = rng.integers(0, 2, 500).astype(float)
+    elo = Elo(k=1.0)
+    new1, new2 = elo.rate_duels(ratings1, ratings2, scores1, 1 - scores1)
+    for r1, r2, s1, n1, n2 in zip(ratings1.tolist(), ratings2.tolist(), scores1.tolist(), new1.tolist(), new2.tolist()):
+        assert elo.rate([[r1], [r2]], [s1, 1 - s1]) == [[n1], [n2]]
+
+
+@pytest.mark.parametrize("array_backed", [False, True], ids=['dict', 'array'])
+def test_elo_update_from_generator(array_backed):
+    rng = random.Random(2)
+    players = Player.create(nb=8)
+    games = []
+    for _ in range(50):
+        duel = Duel(*rng.sample(players, 2))
+        BetterWin().solve(duel)
+        games.append(duel)
+    reference = BasicElo('reference', players=players, array_backed=array_backed)
+    streamed = BasicElo('streamed', players=players, array_backed=array_backed)
+    streamed.handler.chunk_size = 7
+    reference.update(games=games)
+    streamed.update(games=(game for game in games))
+    assert [streamed.rating(p) for p in players] == [reference.rating(p) for p in players]
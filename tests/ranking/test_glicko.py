@@ -1,8 +1,11 @@
 import pytest
+import random
+import numpy as np
 from collections import namedtuple
 
-from rstt import Player, Duel
+from rstt import Player, Duel, BetterWin
 from rstt.ranking.standard import BasicGlicko
+from rstt.ranking.inferer import Glicko
 from rstt.ranking.rating import GlickoRating
 from rstt.solver import WIN, LOSE
 
@@ -53,9 +56,9 @@ def games(player, p1, p2, p3):
     return [duel1, duel2, duel3]
 
 
-@pytest.fixture
-def glicko():
-    return BasicGlicko(name='test-glicko')
+@pytest.fixture(params=[False, True], ids=['dict', 'array'])
+def glicko(request):
+    return BasicGlicko(name='test-glicko', array_backed=request.param)
 
 
 def test_glicko_with_paper_example(glicko, player, p1, p2, p3, games):
@@ -69,3 +72,42 @@ def test_glicko_with_paper_example(glicko, player, p1, p2, p3, games):
     targeted = player.posteriori
     assert computed.mu == pytest.approx(targeted.mu, 0.1)
     assert computed.sigma == pytest.approx(targeted.sigma, 0.1)
+
+
+def test_rate_period_matches_rate(player, p1, p2, p3, games):
+    glicko = Glicko()
+    params = [player, p1, p2, p3]
+    mu = np.array([p.prior.mu for p in params])
+    sigma = np.array([p.prior.sigma for p in params])
+    scores = [WIN[0], LOSE[0], LOSE[0]]
+    new_mu, new_sigma = glicko.rate_period(player_idx=np.array([0, 0, 0]),
+                                           opp_idx=np.array([1, 2, 3]),
+                                           scores=np.array(scores),
+                                           mu=mu, sigma=sigma)
+    expected = glicko.rate(player.prior, [p.prior for p in params[1:]], scores)
+    assert new_mu[0] == pytest.approx(expected.mu)
+    assert new_sigma[0] == pytest.approx(expected.sigma)
+    assert new_mu[1:].tolist() == mu[1:].tolist()
+
+
+@pytest.mark.parametrize("array_backed", [False, True], ids=['dict', 'array'])
+def test_live_period_matches_update(array_backed):
+    rng = random.Random(3)
+    players = [Player(f'player_{i}', 1000.0 + 100.0*i) for i in range(10)]
+    games = []
+    for _ in range(60):
+        duel = Duel(*rng.sample(players, 2))
+        BetterWin().solve(duel)
+        games.append(duel)
+    batch = BasicGlicko('batch', players=players, array_backed=array_backed)
+    live = BasicGlicko('live', players=players, array_backed=array_backed)
+    batch.update(games=games)
+    period = live.open_period()
+    period.add(games=games[:25])
+    period.add(games=(game for game in games[25:]))
+    assert period.games() == len(games)
+    live.close_period(period)
+    for p in players:
+        assert live.rating(p).mu == pytest.approx(batch.rating(p).mu, abs=1e-9)
+        assert live.rating(p).sigma == pytest.approx(batch.rating(p).sigma, abs=1e-9)
+    assert live.players() == batch.players()
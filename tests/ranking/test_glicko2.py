@@ -1,8 +1,12 @@
 import pytest
+import random
+import numpy as np
 from collections import namedtuple
 
-from rstt import Player, Duel
+from rstt import Player, Duel, BetterWin
 from rstt.ranking.standard import BasicGlicko2
+from rstt.ranking.inferer import Glicko2
+import rstt.utils.observer as uo
 from rstt.ranking.rating import Glicko2Rating
 from rstt.solver import WIN, LOSE
 
@@ -53,9 +57,9 @@ def games(player, p1, p2, p3):
     return [duel1, duel2, duel3]
 
 
-@pytest.fixture
-def glicko2():
-    return BasicGlicko2(name='test-glicko-2', tau=0.5)
+@pytest.fixture(params=[False, True], ids=['dict', 'array'])
+def glicko2(request):
+    return BasicGlicko2(name='test-glicko-2', tau=0.5, array_backed=request.param)
 
 
 def test_glicko2_with_paper_example(glicko2, player, p1, p2, p3, games):
@@ -71,3 +75,70 @@ def test_glicko2_with_paper_example(glicko2, player, p1, p2, p3, games):
     assert computed.sigma == pytest.approx(targeted.sigma, abs=0.01)
     assert computed.volatility == pytest.approx(
         targeted.volatility, abs=0.00001)
+
+
+def test_glicko2_unactive_player(glicko2, player, p1, p2, p3, games):
+    idle = Player('idle')
+    for p in [player, p1, p2, p3]:
+        glicko2.set_rating(p.player, p.prior)
+    glicko2.set_rating(idle, Glicko2Rating(1500, 200, 0.06))
+    glicko2.update(games=games)
+
+    # verification: phi* = sqrt(phi^2 + volatility^2)
+    computed = glicko2.rating(idle)
+    assert computed.mu == 1500
+    assert computed.sigma == pytest.approx(173.7178 * ((200/173.7178)**2 + 0.06**2)**0.5, abs=0.01)
+
+
+def test_volatility_all_matches_step5():
+    glicko2 = Glicko2(tau=0.5)
+    phi2 = np.array([0.5, 1.3, 0.01])
+    vol2 = np.array([0.0036, 0.01, 0.0001])
+    v = np.array([1.7785, 0.2, 40.0])
+    delta2 = np.array([0.2299, 3.0, 0.0])
+    computed = glicko2.volatility_all(phi2, vol2, v, delta2)
+    expected = [glicko2._step5(*params) for params in zip(phi2, vol2, v, delta2)]
+    assert computed.tolist() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("array_backed", [False, True], ids=['dict', 'array'])
+def test_live_period_matches_update(array_backed):
+    rng = random.Random(4)
+    players = Player.create(nb=10)
+    games = []
+    for _ in range(40):
+        duel = Duel(*rng.sample(players[:8], 2))
+        BetterWin().solve(duel)
+        games.append(duel)
+    batch = BasicGlicko2('batch', players=players, array_backed=array_backed)
+    live = BasicGlicko2('live', players=players, array_backed=array_backed)
+    batch.update(games=games)
+    period = live.open_period()
+    for game in games:
+        period.add(game=game)
+    live.close_period(period)
+    for p in players:
+        assert live.rating(p).mu == pytest.approx(batch.rating(p).mu, abs=1e-9)
+        assert live.rating(p).sigma == pytest.approx(batch.rating(p).sigma, abs=1e-9)
+        assert live.rating(p).volatility == pytest.approx(batch.rating(p).volatility, abs=1e-12)
+
+
+@pytest.mark.parametrize("array_backed", [False, True], ids=['dict', 'array'])
+def test_update_with_generator(array_backed, player, p1, p2, p3, games, monkeypatch):
+
+    def materialize(*args, **kwargs):
+        raise AssertionError('games stored in a list')
+    monkeypatch.setattr(uo, 'to_list_of_games', materialize)
+    ratings = {}
+    for source in [games, (game for game in games)]:
+        glicko2 = BasicGlicko2(name='test-glicko-2', tau=0.5, array_backed=array_backed)
+        for p in [player, p1, p2, p3]:
+            glicko2.set_rating(p.player, p.prior)
+        glicko2.update(games=source)
+        ratings[type(source)] = [glicko2.rating(p.player) for p in [player, p1, p2, p3]]
+    by_list, by_generator = ratings.values()
+    for expected, computed in zip(by_list, by_generator):
+        assert computed.mu == pytest.approx(expected.mu)
+        assert computed.sigma == pytest.approx(expected.sigma)
+        assert computed.volatility == pytest.approx(expected.volatility)
+    assert by_list[0].mu != 1500
@@ -1,6 +1,11 @@
 import pytest
 
-from rstt import Player, BasicElo
+from rstt import Player, Duel, BetterWin, BasicElo, BasicGlicko, BTRanking, WinRate, SuccessRanking
+from rstt.ranking import Ranking, ArrayStanding
+from rstt.ranking.datamodel import KeyModel
+from rstt.ranking.inferer import Elo
+from rstt.ranking.observer import GameByGame
+from rstt.ranking.standard import BasicGlicko2
 import random
 
 
@@ -113,3 +118,82 @@ def test_fit_some_present(elo, players):
     seeding = elo.fit(unseeded+players)
     for p in unseeded + players:
         assert p in seeding
+
+
+def test_set_ratings(players):
+    elo = BasicElo('bulk', players=players)
+    elo.set_ratings({p: float(i*100) for i, p in enumerate(players)})
+    assert elo.players() == list(reversed(players))
+    assert elo.points() == [float(i*100) for i in reversed(range(len(players)))]
+
+
+def test_array_standing_backend(players):
+    ranking = Ranking('array', datamodel=KeyModel(default=1500), backend=Elo(),
+                      handler=GameByGame(), players=players, standing=ArrayStanding())
+    ranking.set_ratings({p: float(i*100) for i, p in enumerate(players)})
+    assert isinstance(ranking.standing, ArrayStanding)
+    assert ranking.players() == list(reversed(players))
+
+
+@pytest.mark.parametrize('cls', [BasicElo, BasicGlicko, BasicGlicko2, BTRanking, WinRate, SuccessRanking])
+def test_standing_forwarded(cls, players):
+    standing = ArrayStanding()
+    ranking = cls('forwarded', players=players, standing=standing)
+    assert ranking.standing is standing
+    assert len(ranking) == len(players)
+
+
+def test_update_refresh_changed_only(elo, players, monkeypatch):
+    calls = []
+    ordinal = elo.datamodel.ordinal
+    monkeypatch.setattr(elo.datamodel, 'ordinal', lambda r: calls.append(r) or ordinal(r))
+    duel = Duel(players[0], players[1])
+    BetterWin().solve(duel)
+    elo.update(game=duel)
+    elo.players()
+    assert len(calls) == 2
+    for p in players:
+        assert elo.point(p) == elo.rating(p)
+
+
+def test_equivalence_new_keys_only(elo, monkeypatch):
+    def full_check():
+        raise AssertionError('full container comparison')
+    monkeypatch.setattr(elo, '_Ranking__FullContainerEquivalence', full_check)
+    newcomer = Player('newcomer', 1500)
+    elo.set_rating(newcomer, 2000.0)
+    elo.players()
+    assert elo.rank(newcomer) == 0
+
+
+def test_batch(players):
+    games = []
+    for p1, p2 in zip(players[::2], players[1::2]):
+        games.append(Duel(p1, p2))
+        BetterWin().solve(games[-1])
+    replay, batched = BasicElo('replay', players=players), BasicElo('batch', players=players)
+    for game in games:
+        replay.update(game=game)
+    with batched.batch():
+        for game in games:
+            batched.update(game=game)
+        assert batched.points() == [1500.0]*len(players)
+    assert batched.players() == replay.players()
+    assert batched.points() == replay.points()
+    assert batched.status()['maintain_equivalence']
+
+
+def test_in_place_rating_edit_refresh(players):
+    glicko = BasicGlicko('glicko', players=players)
+    glicko.rating(players[0]).mu = 3000.0
+    glicko.set_rating(players[1], glicko.rating(players[1]))
+    assert glicko.players()[0] is players[0]
+    assert glicko.point(players[0]) == glicko.datamodel.ordinal(glicko.rating(players[0]))
+
+
+def test_tracking_errors_not_hidden(elo, players, monkeypatch):
+    def broken():
+        raise AttributeError('broken tracking')
+    monkeypatch.setattr(elo.datamodel, 'pop_dirty', broken)
+    with pytest.raises(AttributeError, match='broken tracking'):
+        elo.set_rating(players[0], 2000.0)
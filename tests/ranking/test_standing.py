@@ -1,8 +1,10 @@
 import pytest
+import random
+import numpy as np
 
 
 from rstt import Player
-from rstt.ranking import Standing, BTRanking
+from rstt.ranking import Standing, ArrayStanding, BTRanking
 
 from collections import namedtuple
 
@@ -196,4 +198,97 @@ def test_fit_unseeded_value():
     unseeded = Player.create(nb=5)
     seeding = ref.fit(unseeded)
     for p in unseeded:
-        assert seeding.value(p) == ref._Standing__default
+        assert seeding.value(p) == ref._default
+
+
+def test_change_value_reorders():
+    stand = Standing()
+    stand.add(pop, vals)
+    stand[p2.player] = 40.0
+    assert stand.keys() == [p2.player, p0.player, p1.player]
+    assert stand.index(p2.player) == 0
+    assert stand.value(p2.player) == 40.0
+
+
+def test_tied_items():
+    stand = Standing()
+    stand.add(pop, [10, 10, 20])
+    assert stand.ties()
+    assert stand.tied_items() == {(1, 2): stand[[1, 2]]}
+
+
+def test_no_tied_items():
+    assert not standing.ties()
+    assert standing.tied_items() == {}
+
+
+@pytest.mark.parametrize("ratio", [0.0, 1.0])
+def test_sorting_paths(ratio, monkeypatch):
+    # ratio=0.0 forces a full sort, ratio=1.0 forces incremental insertions
+    monkeypatch.setattr('rstt.config.STANDING_INCREMENTAL_RATIO', ratio)
+    players = Player.create(nb=50)
+    stand = Standing(protocol='get')
+    stand.add(players, [float(i) for i in range(50)])
+    for i, player in enumerate(players[:10]):
+        stand[player] = float(100 + i)
+    expected = sorted(players, key=lambda p: stand.value(p), reverse=True)
+    assert stand.keys() == expected
+
+
+def test_set_sorting_none_keeps_protocol():
+    stand = Standing(protocol='get')
+    stand.set_sorting()
+    assert stand._protocol == 'get'
+    assert stand._maintain
+
+
+def test_update_values_dict():
+    stand = Standing()
+    stand.add(pop, vals)
+    stand.update_values({p0.player: 5.0, p2.player: 50.0})
+    assert stand.keys() == [p2.player, p1.player, p0.player]
+    assert stand.values() == [50.0, 20, 5.0]
+
+
+def test_update_values_array():
+    stand = Standing()
+    stand.update_values(pop, np.array([1.0, 3.0, 2.0]))
+    assert stand.keys() == [p1.player, p2.player, p0.player]
+
+
+def test_update_values_error():
+    stand = Standing()
+    with pytest.raises(ValueError):
+        stand.update_values(pop, [1.0])
+    with pytest.raises(TypeError):
+        stand.update_values(tuple(pop), [1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize("protocol", ['set', 'get', 'always'])
+def test_array_standing_equivalence(protocol):
+    rng = random.Random(0)
+    players = [Player(name=f"p{rng.randint(0, 20)}", level=1500) for _ in range(60)]
+    std, arr = Standing(protocol=protocol), ArrayStanding(protocol=protocol)
+    for stand in (std, arr):
+        stand.add(players[:40], [float(i % 7) for i in range(40)])
+    for player in players[40:]:
+        std[player] = arr[player] = float(rng.randint(0, 7))
+    changes = {p: float(rng.randint(0, 7)) for p in rng.sample(players, 20)}
+    std.update_values(changes)
+    arr.update_values(changes)
+    for player in rng.sample(players, 10):
+        del std[player]
+        del arr[player]
+    batch = rng.sample(std.keys(), 10)
+    del std[batch]
+    del arr[batch]
+    assert std.items() == arr.items()
+    assert std.tied_items() == arr.tied_items()
+    assert [std.index(p) for p in std] == [arr.index(p) for p in arr]
+
+
+def test_array_standing_arrays():
+    stand = ArrayStanding()
+    stand.add(pop, [10.0, 30.0, 20.0])
+    assert list(stand.keys_array()) == [pop[1], pop[2], pop[0]]
+    assert list(stand.values_array()) == [30.0, 20.0, 10.0]
@@ -1,5 +1,9 @@
-from rstt import Player, Duel, BetterWin
-from rstt.solver.solvers import WIN, LOSE, DRAW
+import pytest
+import random
+import numpy as np
+
+from rstt import Player, Duel, BetterWin, BTRanking, RoundRobin, LogSolver, BradleyTerry, CoinFlip
+from rstt.solver.solvers import WIN, LOSE, DRAW, ScoreProb
 
 p1 = Player('p1', 2000)
 p2 = Player('p2', 1000)
@@ -28,3 +32,60 @@ def test_BetterWin_home_advantage():
     game = Duel(p3, p2)
     BetterWin().solve(game)
     assert game.scores() == WIN
+
+
+# --- solve_many --- #
+def test_BetterWin_solve_many_matches_solve():
+    pairs = [(p1, p2), (p2, p1), (p2, p3), (p3, p2)]
+    for with_draw in [False, True]:
+        many = [Duel(a, b) for a, b in pairs]
+        BetterWin(with_draw=with_draw).solve_many(many)
+        for game, (a, b) in zip(many, pairs):
+            single = Duel(a, b)
+            BetterWin(with_draw=with_draw).solve(single)
+            assert game.scores() == single.scores()
+
+
+@pytest.mark.parametrize("solver, expected", [(LogSolver(), 1/(1+10**(-1000/400))),
+                                              (BradleyTerry(), 2000/3000),
+                                              (CoinFlip(), 0.5)])
+def test_solve_many_probabilities(solver, expected):
+    games = [Duel(p1, p2) for _ in range(20000)]
+    solver.solve_many(games, rng=np.random.default_rng(0))
+    frequency = sum(game.scores() == WIN for game in games) / len(games)
+    assert frequency == pytest.approx(expected, abs=0.015)
+
+
+def test_ScoreProb_solve_many_uses_func():
+    solver = ScoreProb(scores=[WIN, DRAW, LOSE], func=lambda duel: [0.0, 1.0, 0.0])
+    games = [Duel(p1, p2) for _ in range(10)]
+    solver.solve_many(games)
+    assert all(game.scores() == DRAW for game in games)
+
+
+def test_solve_many_reproducible():
+    results = []
+    for _ in range(2):
+        random.seed(3)
+        games = [Duel(p1, p2) for _ in range(50)]
+        BradleyTerry().solve_many(games)
+        results.append([game.scores() for game in games])
+    assert results[0] == results[1]
+
+
+class HomeWin(BetterWin):
+    def solve(self, duel, *args, **kwargs):
+        duel._Match__set_result(WIN)
+
+
+@pytest.mark.parametrize("solver", [BetterWin(), HomeWin(), CoinFlip()])
+def test_competition_batch_solving(solver):
+    players = Player.create(nb=16)
+    cup = RoundRobin('cup', seeding=BTRanking('seeding', players=players), solver=solver)
+    cup.registration(players)
+    cup.run()
+    assert len(cup.games()) == 120
+    if isinstance(solver, HomeWin):
+        assert all(game.scores() == WIN for game in cup.games())
+    if type(solver) is BetterWin:
+        assert all(game.winner().level() >= game.loser().level() for game in cup.games())
@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+
+from rstt import Player, BetterWin, LogSolver, CoinFlip, BradleyTerry, BTRanking, MonteCarlo
+from rstt import SingleEliminationBracket, DoubleEliminationBracket, RoundRobin, SwissBracket
+
+
+population = Player.create(nb=16)
+seeding = BTRanking('Seedings', players=population)
+
+
+@pytest.mark.parametrize("competition", [SingleEliminationBracket, DoubleEliminationBracket, RoundRobin, SwissBracket])
+def test_placements_histogram(competition):
+    mc = MonteCarlo(competition, seeding, LogSolver(), n_runs=20, workers=1, seed=1, chunk_size=7)
+    mc.run()
+    counts = mc.placements()
+    assert counts.shape == (16, 16)
+    assert counts.sum(axis=1).tolist() == [20] * 16
+    assert mc.distribution().sum(axis=1) == pytest.approx(np.ones(16))
+    assert mc.players() == list(seeding.fit(population))
+
+
+def test_betterwin_top_seed_always_wins():
+    mc = MonteCarlo(SingleEliminationBracket, seeding, BetterWin(), n_runs=10, workers=1)
+    mc.run()
+    assert mc.title_probability().tolist() == [1.0] + [0.0] * 15
+    assert mc.expected_placement()[0] == 1.0
+
+
+@pytest.mark.parametrize("solver", [CoinFlip, LogSolver, BradleyTerry])
+def test_reproducible_across_workers(solver):
+    results = []
+    for workers in [1, 2]:
+        mc = MonteCarlo(SingleEliminationBracket, seeding, solver(), n_runs=40, workers=workers, seed=3, chunk_size=10)
+        mc.run()
+        results.append(mc.placements())
+    assert (results[0] == results[1]).all()
+    assert results[0][:, 0].sum() == 40
+
+
+def test_no_achievements_collected():
+    players = Player.create(nb=4)
+    mc = MonteCarlo(SingleEliminationBracket, BTRanking('s', players=players), LogSolver(), n_runs=5, workers=1)
+    mc.run()
+    assert all(not player.achievements() for player in players)
@@ -1,6 +1,8 @@
 import pytest
+import numpy as np
 
-from rstt import Player, BetterWin, BTRanking
+from rstt import Player, BetterWin, BTRanking, LogSolver, MonteCarlo
+from rstt.solver.solvers import ScoreProb, WIN, LOSE
 from rstt.scheduler.tournament.knockout import SingleEliminationBracket as SEB
 
 
@@ -36,4 +38,38 @@ def test_nb_games(nb):
     seb = SEB(f"test games {nb}", seeding, BetterWin())
     seb.registration(population[:nb])
     seb.run()
-    assert len(seb.games()) == nb-1
\ No newline at end of file
+    assert len(seb.games()) == nb-1
+
+# --- reach_probabilities --- #
+
+def test_reach_probabilities_betterwin():
+    table = SEB.reach_probabilities(seeding, BetterWin(), population[:16])
+    assert table[:, -1].tolist() == [1.0] + [0.0] * 15
+    assert table.sum(axis=0).tolist() == [16, 8, 4, 2, 1]
+
+
+def test_reach_probabilities_four_players():
+    players = [Player(f"p{i}", level) for i, level in enumerate([1800.0, 1600.0, 1500.0, 1400.0])]
+    solver = LogSolver()
+    p = solver.win_probabilities(players)
+    table = SEB.reach_probabilities(BTRanking('levels', players=players), solver)
+    # balanced_tree(2): seed 1 vs seed 4, seed 2 vs seed 3
+    title = p[0, 3] * (p[1, 2] * p[0, 1] + p[2, 1] * p[0, 2])
+    assert table[0].tolist() == pytest.approx([1.0, p[0, 3], title])
+    assert table[:, -1].sum() == pytest.approx(1.0)
+
+
+def test_reach_probabilities_matches_montecarlo():
+    players = population[:8]
+    ranking = BTRanking('levels', players=players)
+    mc = MonteCarlo(SEB, ranking, LogSolver(), n_runs=4000, workers=1, seed=0)
+    mc.run()
+    table = SEB.reach_probabilities(ranking, LogSolver())
+    assert mc.title_probability() == pytest.approx(table[:, -1], abs=0.03)
+
+
+def test_reach_probabilities_errors():
+    with pytest.raises(ValueError):
+        SEB.reach_probabilities(seeding, LogSolver(), population[:6])
+    with pytest.raises(TypeError):
+        SEB.reach_probabilities(seeding, ScoreProb(scores=[WIN, LOSE], func=lambda d: [0.5, 0.5]), population[:8])
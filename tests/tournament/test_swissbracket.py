@@ -36,4 +36,29 @@ def test_nb_rounds(sbf):
     assert len(sbf.games(by_rounds=True)) == 5
 
 def test_nb_games(sbf):
-    assert len(sbf.games()) == 33
\ No newline at end of file
+    assert len(sbf.games()) == 33
+
+def test_records_match_games(sbf):
+    games = sbf.games()
+    for player in sbf.participants():
+        wins = len([game for game in games if game.winner() == player])
+        loses = len([game for game in games if game.loser() == player])
+        assert sbf.score(player) == (wins, loses)
+        played = [game for game in games if player in game]
+        assert sbf.results()[player]['opponent'] == [game.opponent(player) for game in played]
+        assert sbf.results()[player]['score'] == ['win' if game.winner() == player else 'lose' for game in played]
+
+
+def test_score_before_start(seeding, population):
+    sb = SwissBracket('not started', seeding=seeding, solver=BetterWin())
+    assert sb.score(population[0]) == (0, 0)
+    assert sb.results()[population[0]] == {'opponent': [], 'score': []}
+
+
+def test_results_is_a_copy(sbf):
+    player = sbf.participants()[0]
+    results = sbf.results()
+    results[player]['opponent'].clear()
+    del results[sbf.participants()[1]]
+    assert len(sbf.results()[player]['opponent']) == sum(sbf.score(player))
+    assert sbf.participants()[1] in sbf.results()
@@ -1,7 +1,13 @@
 import pytest
+import numpy as np
+import functools
 
 from rstt import BasicPlayer, Duel, BTRanking, RoundRobin, BetterWin, SingleEliminationBracket
 from rstt.utils.observer import to_list_of_games, to_list_of_players, duel_data, players_records
+from rstt.utils.observer import conflict_free_waves, players_records_arrays, chunked, iter_games
+from rstt.utils.observer import bind_function_args, call_function_with_args, get_function_args, _function_args
+from rstt.ranking.inferer import Elo
+import rstt.utils.observer as uo
 
 
 @pytest.fixture
@@ -137,3 +143,102 @@ def test_duel_data_keys(duel, key):
 def test_players_records_keys(duel, key):
     data, *_ = players_records([duel])
     assert key in data.keys()
+
+
+def test_conflict_free_waves():
+    player1 = np.array([0, 2, 0, 4, 1])
+    player2 = np.array([1, 3, 2, 5, 3])
+    waves = conflict_free_waves(player1, player2)
+    assert [wave.tolist() for wave in waves] == [[0, 1, 3], [2, 4]]
+
+
+def test_conflict_free_waves_sequential():
+    rng = np.random.default_rng(5)
+    player1, player2 = rng.integers(0, 6, 80), rng.integers(0, 6, 80)
+    # reference: one game after the other
+    last, expected = [-1] * 6, []
+    for p1, p2 in zip(player1.tolist(), player2.tolist()):
+        last[p1] = last[p2] = max(last[p1], last[p2]) + 1
+        expected.append(last[p1])
+    waves = conflict_free_waves(player1, player2)
+    assert [wave.tolist() for wave in waves] == [[game for game, w in enumerate(expected) if w == k]
+                                                 for k in range(max(expected) + 1)]
+
+
+def test_bind_function_args():
+
+    def func(a, b=2):
+        return a + b
+    call = bind_function_args(func)
+    assert call({'a': 1, 'b': 3, 'c': 10}) == call_function_with_args(func, a=1, b=3, c=10) == 4
+    assert call({'a': 1}) == 3
+
+
+def test_bind_declared_args(monkeypatch):
+
+    class Inferer:
+        @uo.declare_args('x', 'y')
+        def rate(self, *args, **kwargs):
+            return args, kwargs
+
+    def no_filtering(*args, **kwargs):
+        raise AssertionError('data point filtered')
+    call = uo.bind_function_args(Inferer().rate)
+    monkeypatch.setattr(uo, 'filter_valid_args', no_filtering)
+    assert call({'y': 2, 'z': 3, 'x': 1}) == ((1, 2), {})
+    assert uo.get_function_args(Inferer().rate) == ('x', 'y')
+    assert uo.bind_function_args(Elo().rate)({'rating_groups': [[1500.0], [1500.0]], 'scores': [1.0, 0.0], 'teams': None}) == [[1510.0], [1490.0]]
+
+
+def test_function_args_decorated():
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+        return wrapper
+
+    @decorator
+    def func(x, y=1, *args, z=2, **kwargs):
+        return x + y + z
+    assert get_function_args(func) == ('x', 'y', 'z')
+    assert _function_args.cache_info().maxsize is not None
+
+
+def test_players_records_grouping(pop):
+    games = [Duel(pop[0], pop[1]), Duel(pop[2], pop[0]), Duel(pop[1], pop[2])]
+    for game in games:
+        BetterWin().solve(game)
+    records = {data['teams'][0][0]: data for data in players_records(games)}
+    for player in pop[:3]:
+        targets = [game for game in games if player in game]
+        assert records[player]['teams'][1] == [game.opponent(player) for game in targets]
+        assert records[player]['scores'] == [game.score(player) for game in targets]
+
+
+def test_players_records_arrays(pop):
+    games = [Duel(pop[0], pop[1]), Duel(pop[2], pop[0])]
+    for game in games:
+        BetterWin().solve(game)
+    ids = {player: i for i, player in enumerate(pop)}
+    players, opponents, scores = players_records_arrays(
+        games, lambda keys: np.array([ids[key] for key in keys]))
+    assert players.tolist() == [0, 1, 2, 0]
+    assert opponents.tolist() == [1, 0, 0, 2]
+    assert scores.tolist() == [games[0].score(pop[0]), games[0].score(pop[1]),
+                               games[1].score(pop[2]), games[1].score(pop[0])]
+
+
+@pytest.mark.parametrize("size, expected", [(None, [[0, 1, 2, 3, 4]]), (2, [[0, 1], [2, 3], [4]]), (5, [[0, 1, 2, 3, 4]])])
+def test_chunked(size, expected):
+    assert [list(chunk) for chunk in chunked(range(5), size)] == expected
+
+
+def test_chunked_error():
+    with pytest.raises(ValueError):
+        next(chunked(range(5), 0))
+
+
+def test_iter_games_generator(duel, bunch_of_games):
+    games = iter_games(game=duel, games=(game for game in bunch_of_games))
+    assert list(games) == [duel] + bunch_of_games
@@ -0,0 +1,53 @@
+import pytest
+import random
+
+from rstt import RNG, Player, GaussianPlayer, Duel, BTRanking, RandomRound, LogSolver
+import rstt.utils.rng as ur
+
+
+def simulation(rng: RNG):
+    with rng:
+        players = Player.create(nb=8)
+        gaussians = [GaussianPlayer(name=f"g{i}") for i in range(2)]
+        for player in gaussians:
+            player.update_level()
+        cup = RandomRound('cup', seeding=BTRanking('seeding', players=players), solver=LogSolver(), rounds=3, amount=2)
+        cup.registration(players)
+        cup.run()
+        single = Duel(players[0], players[1])
+        LogSolver().solve(single)
+    return ([p.level() for p in players + gaussians],
+            [[p.name() for p in game.players()] + game.scores() for game in cup.games() + [single]])
+
+
+def test_same_seed_same_simulation():
+    first, second = simulation(RNG(7)), simulation(RNG(7))
+    assert first[0] == second[0]
+    assert [game[2:] for game in first[1]] == [game[2:] for game in second[1]]
+    assert simulation(RNG(8))[0] != first[0]
+
+
+def test_spawn_independent_and_reproducible():
+    children = RNG(11).spawn(3)
+    again = RNG(11).spawn(3)
+    draws = [child.random.random() for child in children]
+    assert len(set(draws)) == 3
+    assert draws == [child.random.random() for child in again]
+    assert [c.generator.random() for c in children] == [c.generator.random() for c in again]
+
+
+def test_context_nesting():
+    outer, inner = RNG(1), RNG(2)
+    assert ur.current().random is random
+    with outer:
+        with inner:
+            assert ur.current() is inner
+        assert ur.current() is outer
+    assert ur.current().random is random
+
+
+def test_global_random_seed():
+    random.seed(5)
+    first = [p.level() for p in Player.create(nb=4)]
+    random.seed(5)
+    assert first == [p.level() for p in Player.create(nb=4)]
@@ -0,0 +1,62 @@
+import pytest
+import random
+
+from rstt.utils.sortedlist import SortedList
+
+
+@pytest.fixture
+def values():
+    values = list(range(5000))
+    random.shuffle(values)
+    return values
+
+
+@pytest.fixture
+def small_load(monkeypatch):
+    monkeypatch.setattr(SortedList, 'LOAD', 4)
+
+
+def test_add_keeps_order(values, small_load):
+    sl = SortedList()
+    for value in values:
+        sl.add(value)
+    assert list(sl) == sorted(values)
+    assert len(sl) == len(values)
+
+
+def test_update_keeps_order(values, small_load):
+    sl = SortedList(values[:100])
+    sl.update(values[100:])
+    assert list(sl) == sorted(values)
+
+
+def test_position_and_getitem(values, small_load):
+    sl = SortedList(values)
+    for value in values[:200]:
+        assert sl.position(value) == value
+        assert sl[value] == value
+    assert sl[-1] == max(values)
+
+
+def test_remove(values, small_load):
+    sl = SortedList(values)
+    for value in values[:2500]:
+        sl.remove(value)
+    assert list(sl) == sorted(values[2500:])
+
+
+def test_remove_error():
+    sl = SortedList([1, 2, 3])
+    with pytest.raises(ValueError):
+        sl.remove(4)
+
+
+def test_getitem_error():
+    sl = SortedList([1, 2, 3])
+    with pytest.raises(IndexError):
+        sl[3]
+
+
+def test_reversed(values, small_load):
+    sl = SortedList(values)
+    assert list(reversed(sl)) == sorted(values, reverse=True)